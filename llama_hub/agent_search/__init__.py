@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.agent_search.base import (
-    AgentSearchReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.agent_search.base import (
+        AgentSearchReader,
+    )
 
 __all__ = ["AgentSearchReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.agent_search.base": ["AgentSearchReader"],
+    },
+)
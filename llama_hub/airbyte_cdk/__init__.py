@@ -1,6 +1,18 @@
-from llama_hub.airbyte_cdk.base import (
-    AirbyteCDKReader,
-    RecordHandler,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.airbyte_cdk.base import (
+        AirbyteCDKReader,
+        RecordHandler,
+    )
 
 __all__ = ["AirbyteCDKReader", "RecordHandler"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.airbyte_cdk.base": ["AirbyteCDKReader", "RecordHandler"],
+    },
+)
@@ -1,5 +1,17 @@
-from llama_hub.airbyte_hubspot.base import (
-    AirbyteHubspotReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.airbyte_hubspot.base import (
+        AirbyteHubspotReader,
+    )
 
 __all__ = ["AirbyteHubspotReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.airbyte_hubspot.base": ["AirbyteHubspotReader"],
+    },
+)
@@ -1,5 +1,17 @@
-from llama_hub.airbyte_salesforce.base import (
-    AirbyteSalesforceReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.airbyte_salesforce.base import (
+        AirbyteSalesforceReader,
+    )
 
 __all__ = ["AirbyteSalesforceReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.airbyte_salesforce.base": ["AirbyteSalesforceReader"],
+    },
+)
@@ -1,5 +1,17 @@
-from llama_hub.airbyte_typeform.base import (
-    AirbyteTypeformReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.airbyte_typeform.base import (
+        AirbyteTypeformReader,
+    )
 
 __all__ = ["AirbyteTypeformReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.airbyte_typeform.base": ["AirbyteTypeformReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.airtable.base import (
-    AirtableReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.airtable.base import (
+        AirtableReader,
+    )
 
 __all__ = ["AirtableReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.airtable.base": ["AirtableReader"],
+    },
+)
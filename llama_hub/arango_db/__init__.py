@@ -1,5 +1,17 @@
-from llama_hub.arango_db.base import (
-    SimpleArangoDBReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.arango_db.base import (
+        SimpleArangoDBReader,
+    )
 
 __all__ = ["SimpleArangoDBReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.arango_db.base": ["SimpleArangoDBReader"],
+    },
+)
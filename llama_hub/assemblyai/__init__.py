@@ -1,7 +1,22 @@
 """Init file."""
-from llama_hub.assemblyai.base import (
-    AssemblyAIAudioTranscriptReader,
-    TranscriptFormat,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.assemblyai.base import (
+        AssemblyAIAudioTranscriptReader,
+        TranscriptFormat,
+    )
 
 __all__ = ["AssemblyAIAudioTranscriptReader", "TranscriptFormat"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.assemblyai.base": [
+            "AssemblyAIAudioTranscriptReader",
+            "TranscriptFormat",
+        ],
+    },
+)
@@ -1,5 +1,17 @@
-from llama_hub.astra_db.base import (
-    AstraDBReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.astra_db.base import (
+        AstraDBReader,
+    )
 
 __all__ = ["AstraDBReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.astra_db.base": ["AstraDBReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.azcognitive_search.base import (
-    AzCognitiveSearchReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.azcognitive_search.base import (
+        AzCognitiveSearchReader,
+    )
 
 __all__ = ["AzCognitiveSearchReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.azcognitive_search.base": ["AzCognitiveSearchReader"],
+    },
+)
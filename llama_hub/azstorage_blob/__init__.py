@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.azstorage_blob.base import (
-    AzStorageBlobReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.azstorage_blob.base import (
+        AzStorageBlobReader,
+    )
 
 __all__ = ["AzStorageBlobReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.azstorage_blob.base": ["AzStorageBlobReader"],
+    },
+)
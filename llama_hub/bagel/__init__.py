@@ -1,27 +1,32 @@
-from llama_hub.bagel.base import (
-    BagelReader,
-    ClusterMetadata,
-    Doc,
-    Documents,
-    Embedding,
-    Embeddings,
-    ID,
-    IDs,
-    Include,
-    LiteralValue,
-    LogicalOperator,
-    Metadata,
-    Metadatas,
-    OneOrMany,
-    OperatorExpression,
-    Parameter,
-    T,
-    Vector,
-    Where,
-    WhereDocument,
-    WhereDocumentOperator,
-    WhereOperator,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.bagel.base import (
+        BagelReader,
+        ClusterMetadata,
+        Doc,
+        Documents,
+        Embedding,
+        Embeddings,
+        ID,
+        IDs,
+        Include,
+        LiteralValue,
+        LogicalOperator,
+        Metadata,
+        Metadatas,
+        OneOrMany,
+        OperatorExpression,
+        Parameter,
+        T,
+        Vector,
+        Where,
+        WhereDocument,
+        WhereDocumentOperator,
+        WhereOperator,
+    )
 
 __all__ = [
     "BagelReader",
@@ -47,3 +52,33 @@ __all__ = [
     "WhereDocumentOperator",
     "WhereOperator",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.bagel.base": [
+            "BagelReader",
+            "ClusterMetadata",
+            "Doc",
+            "Documents",
+            "Embedding",
+            "Embeddings",
+            "ID",
+            "IDs",
+            "Include",
+            "LiteralValue",
+            "LogicalOperator",
+            "Metadata",
+            "Metadatas",
+            "OneOrMany",
+            "OperatorExpression",
+            "Parameter",
+            "T",
+            "Vector",
+            "Where",
+            "WhereDocument",
+            "WhereDocumentOperator",
+            "WhereOperator",
+        ],
+    },
+)
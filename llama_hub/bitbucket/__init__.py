@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.bitbucket.base import (
-    BitbucketReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.bitbucket.base import (
+        BitbucketReader,
+    )
 
 __all__ = ["BitbucketReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.bitbucket.base": ["BitbucketReader"],
+    },
+)
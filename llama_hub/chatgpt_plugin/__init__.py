@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.chatgpt_plugin.base import (
-    ChatGPTRetrievalPluginReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.chatgpt_plugin.base import (
+        ChatGPTRetrievalPluginReader,
+    )
 
 __all__ = ["ChatGPTRetrievalPluginReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.chatgpt_plugin.base": ["ChatGPTRetrievalPluginReader"],
+    },
+)
@@ -1,5 +1,17 @@
-from llama_hub.chroma.base import (
-    ChromaReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.chroma.base import (
+        ChromaReader,
+    )
 
 __all__ = ["ChromaReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.chroma.base": ["ChromaReader"],
+    },
+)
@@ -1,10 +1,15 @@
 """Init file."""
-from llama_hub.confluence.base import (
-    CONFLUENCE_API_TOKEN,
-    CONFLUENCE_PASSWORD,
-    CONFLUENCE_USERNAME,
-    ConfluenceReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.confluence.base import (
+        CONFLUENCE_API_TOKEN,
+        CONFLUENCE_PASSWORD,
+        CONFLUENCE_USERNAME,
+        ConfluenceReader,
+    )
 
 __all__ = [
     "CONFLUENCE_API_TOKEN",
@@ -12,3 +17,15 @@ __all__ = [
     "CONFLUENCE_USERNAME",
     "ConfluenceReader",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.confluence.base": [
+            "CONFLUENCE_API_TOKEN",
+            "CONFLUENCE_PASSWORD",
+            "CONFLUENCE_USERNAME",
+            "ConfluenceReader",
+        ],
+    },
+)
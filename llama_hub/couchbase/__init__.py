@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.couchbase.base import (
-    CouchbaseReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.couchbase.base import (
+        CouchbaseReader,
+    )
 
 __all__ = ["CouchbaseReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.couchbase.base": ["CouchbaseReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.dad_jokes.base import (
-    DadJokesReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.dad_jokes.base import (
+        DadJokesReader,
+    )
 
 __all__ = ["DadJokesReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.dad_jokes.base": ["DadJokesReader"],
+    },
+)
@@ -1,8 +1,24 @@
 """Init params."""
-from llama_hub.deeplake.base import (
-    DeepLakeReader,
-    distance_metric_map,
-    vector_search,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.deeplake.base import (
+        DeepLakeReader,
+        distance_metric_map,
+        vector_search,
+    )
 
 __all__ = ["DeepLakeReader", "distance_metric_map", "vector_search"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.deeplake.base": [
+            "DeepLakeReader",
+            "distance_metric_map",
+            "vector_search",
+        ],
+    },
+)
@@ -1,4 +1,16 @@
 """Init file."""
-from llama_hub.docstring_walker.base import DocstringWalker
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.docstring_walker.base import DocstringWalker
 
 __all__ = ["DocstringWalker"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.docstring_walker.base": ["DocstringWalker"],
+    },
+)
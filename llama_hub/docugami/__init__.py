@@ -1,13 +1,18 @@
-from llama_hub.docugami.base import (
-    DEFAULT_API_ENDPOINT,
-    DOCUMENT_NAME_KEY,
-    DocugamiReader,
-    PROJECTS_KEY,
-    STRUCTURE_KEY,
-    TABLE_NAME,
-    TAG_KEY,
-    XPATH_KEY,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.docugami.base import (
+        DEFAULT_API_ENDPOINT,
+        DOCUMENT_NAME_KEY,
+        DocugamiReader,
+        PROJECTS_KEY,
+        STRUCTURE_KEY,
+        TABLE_NAME,
+        TAG_KEY,
+        XPATH_KEY,
+    )
 
 __all__ = [
     "DEFAULT_API_ENDPOINT",
@@ -19,3 +24,19 @@ __all__ = [
     "TAG_KEY",
     "XPATH_KEY",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.docugami.base": [
+            "DEFAULT_API_ENDPOINT",
+            "DOCUMENT_NAME_KEY",
+            "DocugamiReader",
+            "PROJECTS_KEY",
+            "STRUCTURE_KEY",
+            "TABLE_NAME",
+            "TAG_KEY",
+            "XPATH_KEY",
+        ],
+    },
+)
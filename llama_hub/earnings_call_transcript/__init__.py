@@ -1,10 +1,14 @@
-from llama_hub.earnings_call_transcript.base import EarningsCallTranscript
+from typing import TYPE_CHECKING
 
-from llama_hub.earnings_call_transcript.utils import (
-    get_earnings_transcript,
-    extract_speakers,
-    correct_date,
-)
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.earnings_call_transcript.base import EarningsCallTranscript
+    from llama_hub.earnings_call_transcript.utils import (
+        get_earnings_transcript,
+        extract_speakers,
+        correct_date,
+    )
 
 __all__ = [
     "EarningsCallTranscript",
@@ -12,3 +16,15 @@ __all__ = [
     "extract_speakers",
     "correct_date",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.earnings_call_transcript.base": ["EarningsCallTranscript"],
+        "llama_hub.earnings_call_transcript.utils": [
+            "get_earnings_transcript",
+            "extract_speakers",
+            "correct_date",
+        ],
+    },
+)
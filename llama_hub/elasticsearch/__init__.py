@@ -1,5 +1,17 @@
-from llama_hub.elasticsearch.base import (
-    ElasticsearchReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.elasticsearch.base import (
+        ElasticsearchReader,
+    )
 
 __all__ = ["ElasticsearchReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.elasticsearch.base": ["ElasticsearchReader"],
+    },
+)
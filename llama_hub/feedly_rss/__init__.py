@@ -1,5 +1,17 @@
-from llama_hub.feedly_rss.base import (
-    FeedlyRssReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.feedly_rss.base import (
+        FeedlyRssReader,
+    )
 
 __all__ = ["FeedlyRssReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.feedly_rss.base": ["FeedlyRssReader"],
+    },
+)
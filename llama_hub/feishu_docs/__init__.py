@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.feishu_docs.base import (
-    FeishuDocsReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.feishu_docs.base import (
+        FeishuDocsReader,
+    )
 
 __all__ = ["FeishuDocsReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.feishu_docs.base": ["FeishuDocsReader"],
+    },
+)
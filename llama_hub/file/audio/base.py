@@ -3,24 +3,73 @@
 A transcriber for the audio of mp3, mp4 files.
 
 """
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Deque, Dict, List, Optional, cast
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
 
+@lru_cache(maxsize=None)
+def _load_model(model_version: str) -> Any:
+    """Load a Whisper model once per process.
+
+    Every AudioTranscriber using the same model version shares it.
+    """
+    import whisper
+
+    return whisper.load_model(model_version)
+
+
+def _load_audio(file: Path) -> Any:
+    """Decode the audio of a file into the waveform Whisper transcribes."""
+    import whisper
+
+    if file.name.endswith("mp4"):
+        from pydub import AudioSegment  # noqa: F401
+
+        # open file
+        video = AudioSegment.from_file(file, format="mp4")
+
+        # Extract audio from video
+        audio = video.split_to_mono()[0]
+
+        file_str = str(file)[:-4] + ".mp3"
+        # export file
+        audio.export(file_str, format="mp3")
+
+    return whisper.load_audio(str(file))
+
+
 class AudioTranscriber(BaseReader):
     """Audio parser.
 
     Extract text from transcript of video/audio files using OpenAI Whisper.
 
+    Args:
+        model_version (str): Whisper model to use. Models are loaded once per
+            process and shared between transcribers.
+        num_threads (Optional[int]): Number of threads torch uses for CPU
+            inference. Left to torch's default if None.
+        num_workers (int): Number of threads decoding the audio of the next
+            files in `load_batch` while the current one is transcribed.
+
     """
 
-    def __init__(self, *args: Any, model_version: str = "base", **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *args: Any,
+        model_version: str = "base",
+        num_threads: Optional[int] = None,
+        num_workers: int = 2,
+        **kwargs: Any
+    ) -> None:
         """Init params."""
         try:
-            import whisper
+            import whisper  # noqa: F401
         except ImportError:
             raise ImportError(
                 "Missing required package: whisper\n"
@@ -29,33 +78,56 @@ class AudioTranscriber(BaseReader):
 
         super().__init__(*args, **kwargs)
         self._model_version = model_version
+        self._num_threads = num_threads
+        self._num_workers = max(num_workers, 1)
 
-        model = whisper.load_model(self._model_version)
+        model = _load_model(self._model_version)
 
         self.parser_config = {"model": model}
 
-    def load_data(
-        self, file: Path, extra_info: Optional[Dict] = None
+    def load_batch(
+        self, files: List[Path], extra_infos: Optional[List[Optional[Dict]]] = None
     ) -> List[Document]:
-        """Parse file."""
-        import whisper
+        """Transcribe a list of files.
+
+        The audio of the next files is decoded in background threads while
+        the model transcribes the current one.
 
-        if file.name.endswith("mp4"):
-            from pydub import AudioSegment  # noqa: F401
+        Args:
+            files (List[Path]): The audio or video files.
+            extra_infos (Optional[List[Optional[Dict]]]): Metadata of each file.
 
-            # open file
-            video = AudioSegment.from_file(file, format="mp4")
+        Returns:
+            List[Document]: A document per file, in the same order.
+        """
+        import whisper
 
-            # Extract audio from video
-            audio = video.split_to_mono()[0]
+        if self._num_threads is not None:
+            import torch
 
-            file_str = str(file)[:-4] + ".mp3"
-            # export file
-            audio.export(file_str, format="mp3")
+            torch.set_num_threads(self._num_threads)
 
         model = cast(whisper.Whisper, self.parser_config["model"])
-        result = model.transcribe(str(file))
+        infos = extra_infos or [None] * len(files)
 
-        transcript = result["text"]
+        documents = []
+        with ThreadPoolExecutor(self._num_workers) as executor:
+            # bound the number of decoded waveforms held in memory
+            pending: Deque[Future] = deque()
+            next_file = 0
+            for extra_info in infos:
+                while next_file < len(files) and len(pending) <= self._num_workers:
+                    pending.append(executor.submit(_load_audio, files[next_file]))
+                    next_file += 1
 
-        return [Document(text=transcript, extra_info=extra_info or {})]
+                result = model.transcribe(pending.popleft().result())
+
+                transcript = result["text"]
+                documents.append(Document(text=transcript, extra_info=extra_info or {}))
+        return documents
+
+    def load_data(
+        self, file: Path, extra_info: Optional[Dict] = None
+    ) -> List[Document]:
+        """Parse file."""
+        return self.load_batch([file], [extra_info])
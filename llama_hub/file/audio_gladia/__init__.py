@@ -1,6 +1,18 @@
 """Init params."""
-from llama_hub.file.audio_gladia.base import (
-    GladiaAudioTranscriber,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.file.audio_gladia.base import (
+        GladiaAudioTranscriber,
+    )
 
 __all__ = ["GladiaAudioTranscriber"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.file.audio_gladia.base": ["GladiaAudioTranscriber"],
+    },
+)
@@ -1,8 +1,29 @@
 """Simple reader that reads files of different formats from a directory."""
 
+import fnmatch
+import hashlib
+import json
 import logging
+import multiprocessing
+import os
+import re
+import warnings
+from collections import deque
+from functools import partial
+from multiprocessing.pool import AsyncResult
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.download import download_loader
@@ -27,6 +48,108 @@ DEFAULT_FILE_EXTRACTOR: Dict[str, str] = {
     ".json": "JSONReader",
 }
 
+MANIFEST_VERSION = 1
+
+_worker_load_file: Optional[Callable[[Path], List[Document]]] = None
+
+
+def _init_worker(load_file: Callable[[Path], List[Document]]) -> None:
+    """Set the file loader used by a pool worker."""
+    global _worker_load_file
+    _worker_load_file = load_file
+
+
+def _load_file_in_worker(input_file: Path) -> List[Document]:
+    """Load a file with the loader set by `_init_worker`."""
+    assert _worker_load_file is not None
+    return _worker_load_file(input_file)
+
+
+def _compile_ignore_pattern(pattern: str) -> Pattern[str]:
+    """Translate a .gitignore-style pattern into a regular expression.
+
+    The expression matches paths relative to the directory holding the
+    ignore file, using "/" as separator.
+    """
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+        elif pattern.startswith("**", i):
+            regex += ".*"
+            i += 2
+        elif pattern[i] == "*":
+            regex += "[^/]*"
+            i += 1
+        elif pattern[i] == "?":
+            regex += "[^/]"
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 1 :]:
+            end = pattern.index("]", i + 1)
+            regex += fnmatch.translate(pattern[i : end + 1])[4:-3]
+            i = end + 1
+        else:
+            regex += re.escape(pattern[i])
+            i += 1
+
+    if not anchored:
+        regex = "(?:.*/)?" + regex
+    return re.compile(regex + r"\Z")
+
+
+def _read_ignore_file(
+    ignore_file: Path, base: str
+) -> List[Tuple[str, Pattern[str], bool, bool]]:
+    """Parse an ignore file into (base, regex, negated, dir_only) rules."""
+    rules = []
+    with open(ignore_file, "r", errors="ignore") as f:
+        for line in f:
+            line = line.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negated = line.startswith("!")
+            if negated:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            rules.append((base, _compile_ignore_pattern(line), negated, dir_only))
+    return rules
+
+
+def _is_ignored(
+    rel_path: str, is_dir: bool, rules: List[Tuple[str, Pattern[str], bool, bool]]
+) -> bool:
+    """Return whether the last ignore rule matching a path excludes it."""
+    ignored = False
+    for base, regex, negated, dir_only in rules:
+        if dir_only and not is_dir:
+            continue
+        if base:
+            if not rel_path.startswith(base + "/"):
+                continue
+            path = rel_path[len(base) + 1 :]
+        else:
+            path = rel_path
+        if regex.match(path):
+            ignored = not negated
+    return ignored
+
+
+def _hash_file(input_file: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Return the sha256 hex digest of a file's content."""
+    sha = hashlib.sha256()
+    with open(input_file, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
 
 class SimpleDirectoryReader(BaseReader):
     """Simple directory reader.
@@ -51,6 +174,19 @@ class SimpleDirectoryReader(BaseReader):
         file_metadata (Optional[Callable[str, Dict]]): A function that takes
             in a filename and returns a Dict of metadata for the Document.
             Default is None.
+        include_globs (Optional[List[str]]): Glob patterns, relative to
+            input_dir, that files must match to be read. Default is None.
+        exclude_globs (Optional[List[str]]): Glob patterns, relative to
+            input_dir, of files and directories to skip. Default is None.
+        ignore_file_names (Optional[List[str]]): Names of .gitignore-style
+            files (e.g. [".gitignore"]) whose rules exclude files and
+            directories below the directory they are found in.
+            Default is None.
+        manifest_path (Optional[str]): Path to a JSON manifest of file
+            fingerprints (size, mtime and content hash). When set, loading is
+            incremental: only new or changed files are parsed, files removed
+            since the previous load are listed in `deleted_files`, and the
+            manifest is rewritten once a load completes. Default is None.
     """
 
     def __init__(
@@ -63,6 +199,10 @@ class SimpleDirectoryReader(BaseReader):
         file_extractor: Optional[Dict[str, Union[str, BaseReader]]] = None,
         num_files_limit: Optional[int] = None,
         file_metadata: Optional[Callable[[str], Dict]] = None,
+        include_globs: Optional[List[str]] = None,
+        exclude_globs: Optional[List[str]] = None,
+        ignore_file_names: Optional[List[str]] = None,
+        manifest_path: Optional[str] = None,
     ) -> None:
         """Initialize with parameters."""
         super().__init__()
@@ -73,36 +213,78 @@ class SimpleDirectoryReader(BaseReader):
         self.exclude_hidden = exclude_hidden
         self.required_exts = required_exts
         self.num_files_limit = num_files_limit
+        self.include_globs = include_globs
+        self.exclude_globs = exclude_globs
+        self.ignore_file_names = ignore_file_names
 
         self.input_files = self._add_files(self.input_dir)
         self.file_extractor = file_extractor or DEFAULT_FILE_EXTRACTOR
         self.file_metadata = file_metadata
 
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self.deleted_files: List[Path] = []
+
     def _add_files(self, input_dir: Path) -> List[Path]:
-        """Add files."""
-        input_files = sorted(input_dir.iterdir())
-        new_input_files = []
-        dirs_to_explore = []
-        for input_file in input_files:
-            if self.exclude_hidden and input_file.stem.startswith("."):
-                continue
-            elif input_file.is_dir():
-                if self.recursive:
-                    dirs_to_explore.append(input_file)
-            elif (
-                self.required_exts is not None
-                and input_file.suffix not in self.required_exts
-            ):
-                continue
-            else:
-                new_input_files.append(input_file)
+        """Add files.
+
+        Walks the tree iteratively with os.scandir, which reuses the file type
+        cached in each DirEntry instead of stat-ing every entry. Files in a
+        directory come before its subdirectories, in sorted order, and the
+        walk stops as soon as num_files_limit files have been found.
+        """
+        limit = self.num_files_limit
+        if limit is not None and limit <= 0:
+            limit = None
+
+        new_input_files: List[Path] = []
+        # stack of (directory, path relative to input_dir, ignore rules)
+        dirs_to_explore: List[
+            Tuple[Path, str, List[Tuple[str, Pattern[str], bool, bool]]]
+        ] = [(input_dir, "", [])]
+        while dirs_to_explore:
+            current_dir, rel_dir, rules = dirs_to_explore.pop()
+            with os.scandir(current_dir) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+
+            for ignore_file_name in self.ignore_file_names or []:
+                ignore_file = current_dir / ignore_file_name
+                if ignore_file.is_file():
+                    rules = rules + _read_ignore_file(ignore_file, rel_dir)
 
-        for dir_to_explore in dirs_to_explore:
-            sub_input_files = self._add_files(dir_to_explore)
-            new_input_files.extend(sub_input_files)
+            sub_dirs = []
+            for entry in entries:
+                if self.exclude_hidden and entry.name.startswith("."):
+                    continue
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                is_dir = entry.is_dir()
+                if self.exclude_globs is not None and any(
+                    fnmatch.fnmatch(rel_path, glob) for glob in self.exclude_globs
+                ):
+                    continue
+                if rules and _is_ignored(rel_path, is_dir, rules):
+                    continue
 
-        if self.num_files_limit is not None and self.num_files_limit > 0:
-            new_input_files = new_input_files[0 : self.num_files_limit]
+                input_file = Path(entry.path)
+                if is_dir:
+                    if self.recursive:
+                        sub_dirs.append((input_file, rel_path, rules))
+                elif (
+                    self.required_exts is not None
+                    and input_file.suffix not in self.required_exts
+                ):
+                    continue
+                elif self.include_globs is not None and not any(
+                    fnmatch.fnmatch(rel_path, glob) for glob in self.include_globs
+                ):
+                    continue
+                else:
+                    new_input_files.append(input_file)
+                    if limit is not None and len(new_input_files) >= limit:
+                        dirs_to_explore = []
+                        sub_dirs = []
+                        break
+
+            dirs_to_explore.extend(reversed(sub_dirs))
 
         # print total number of files added
         logging.debug(
@@ -111,46 +293,213 @@ class SimpleDirectoryReader(BaseReader):
 
         return new_input_files
 
-    def load_data(self) -> List[Document]:
-        """Load data from the input directory.
+    @staticmethod
+    def load_file(
+        input_file: Path,
+        file_metadata: Optional[Callable[[str], Dict]] = None,
+        file_extractor: Optional[Dict[str, Union[str, BaseReader]]] = None,
+        errors: str = "ignore",
+        reader_cache: Optional[Dict[str, BaseReader]] = None,
+    ) -> List[Document]:
+        """Load a single file into documents.
+
+        Kept static so that it can be dispatched to worker processes.
 
         Args:
-            concatenate (bool): whether to concatenate all files into one document.
-                If set to True, file metadata is ignored.
-                False by default.
+            input_file (Path): Path to the file.
+            file_metadata (Optional[Callable[str, Dict]]): A function that takes
+                in a filename and returns a Dict of metadata for the Document.
+            file_extractor (Optional[Dict[str, Union[str, BaseReader]]]): A mapping
+                of file extension to a BaseReader class or loader name.
+            errors (str): how encoding and decoding errors are to be handled.
+            reader_cache (Optional[Dict[str, BaseReader]]): Reader instances
+                keyed by loader name. Loaders given by name are instantiated
+                once, stored here and reused for later files.
 
         Returns:
-            List[Document]: A list of documents.
+            List[Document]: The documents extracted from the file.
 
         """
+        file_extractor = file_extractor or DEFAULT_FILE_EXTRACTOR
+        metadata = None
+        if file_metadata is not None:
+            metadata = file_metadata(str(input_file))
 
-        documents = []
-        for input_file in self.input_files:
-            metadata = None
-            if self.file_metadata is not None:
-                metadata = self.file_metadata(str(input_file))
+        if input_file.suffix in file_extractor:
+            reader = file_extractor[input_file.suffix]
 
-            if input_file.suffix in self.file_extractor:
-                reader = self.file_extractor[input_file.suffix]
-
-                if isinstance(reader, str):
+            if isinstance(reader, str):
+                reader_str = reader
+                if reader_cache is not None and reader_str in reader_cache:
+                    reader = reader_cache[reader_str]
+                else:
                     try:
                         from llama_hub.utils import import_loader
 
-                        reader = import_loader(reader)()
+                        reader = import_loader(reader_str)()
                     except ImportError:
-                        reader = download_loader(reader)()
+                        reader = download_loader(reader_str)()
+                    if reader_cache is not None:
+                        reader_cache[reader_str] = reader
+
+            return reader.load_data(file=input_file, extra_info=metadata)
 
-                extracted_documents = reader.load_data(
-                    file=input_file, extra_info=metadata
-                )
-                documents.extend(extracted_documents)
+        data = ""
+        # do standard read
+        with open(input_file, "r", errors=errors) as f:
+            data = f.read()
+        return [Document(text=data, extra_info=metadata or {})]
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Load the file fingerprints recorded by the previous load."""
+        if self.manifest_path is None or not self.manifest_path.exists():
+            return {}
+        with open(self.manifest_path, "r") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        return manifest["files"]
+
+    def _save_manifest(self, files: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically write the file fingerprints to the manifest."""
+        assert self.manifest_path is not None
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"version": MANIFEST_VERSION, "files": files}, f)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _diff_manifest(
+        self,
+    ) -> Tuple[List[Path], List[Path], Dict[str, Dict[str, Any]]]:
+        """Compare the input files against the manifest.
+
+        Files whose size and mtime match the manifest are not read at all;
+        the content hash is only computed for the others, so touching a file
+        without changing it does not cause a re-parse.
+
+        Returns:
+            Tuple of the new or changed files, the deleted files and the
+            updated manifest entries.
+
+        """
+        old_files = self._load_manifest()
+        new_files: Dict[str, Dict[str, Any]] = {}
+        changed_files = []
+        for input_file in self.input_files:
+            key = str(input_file.resolve())
+            stat = input_file.stat()
+            entry = old_files.get(key)
+            if (
+                entry is not None
+                and entry["size"] == stat.st_size
+                and entry["mtime"] == stat.st_mtime_ns
+            ):
+                new_files[key] = entry
+                continue
+
+            digest = _hash_file(input_file)
+            new_files[key] = {
+                "size": stat.st_size,
+                "mtime": stat.st_mtime_ns,
+                "sha256": digest,
+            }
+            if entry is None or entry["sha256"] != digest:
+                changed_files.append(input_file)
+
+        deleted_files = []
+        for key, entry in old_files.items():
+            if key in new_files:
+                continue
+            if Path(key).exists():
+                # filtered out of this listing (e.g. by num_files_limit) but
+                # still on disk, so keep its fingerprint
+                new_files[key] = entry
             else:
-                data = ""
-                # do standard read
-                with open(input_file, "r", errors=self.errors) as f:
-                    data = f.read()
-                document = Document(text=data, extra_info=metadata or {})
-                documents.append(document)
-
-        return documents
+                deleted_files.append(Path(key))
+
+        return changed_files, deleted_files, new_files
+
+    def _iter_file_documents(
+        self, input_files: List[Path], num_workers: Optional[int] = None
+    ) -> Iterable[List[Document]]:
+        """Yield the documents of each input file, in input order."""
+        load_file = partial(
+            SimpleDirectoryReader.load_file,
+            file_metadata=self.file_metadata,
+            file_extractor=self.file_extractor,
+            errors=self.errors,
+            reader_cache={},
+        )
+
+        if num_workers is None or num_workers <= 1 or len(input_files) <= 1:
+            for input_file in input_files:
+                yield load_file(input_file)
+            return
+
+        if num_workers > multiprocessing.cpu_count():
+            warnings.warn(
+                "Specified num_workers exceed number of CPUs in the system. "
+                "Setting `num_workers` down to the maximum CPU count."
+            )
+            num_workers = multiprocessing.cpu_count()
+
+        # hand the loader to the workers at start-up rather than with every
+        # task, so that metadata callables and reader instances which cannot
+        # be pickled still work with the default (fork) start method
+        with multiprocessing.Pool(
+            num_workers, initializer=_init_worker, initargs=(load_file,)
+        ) as pool:
+            # at most two files per worker are in flight, the next one being
+            # submitted as the oldest is consumed, so that the documents of
+            # parsed files do not pile up ahead of a slow consumer
+            pending: Deque[AsyncResult] = deque()
+            for input_file in input_files:
+                if len(pending) >= 2 * num_workers:
+                    yield pending.popleft().get()
+                pending.append(pool.apply_async(_load_file_in_worker, (input_file,)))
+            while pending:
+                yield pending.popleft().get()
+
+    def lazy_load_data(self, num_workers: Optional[int] = None) -> Iterable[Document]:
+        """Lazily load data from the input directory.
+
+        Documents are yielded as soon as the file they come from has been
+        parsed, so memory stays bounded by the files in flight. If a manifest
+        path is set, only new or changed files are loaded.
+
+        Args:
+            num_workers (Optional[int]): Number of worker processes used to
+                parse files in parallel. Files are parsed in the current
+                process if None or 1. Default is None.
+
+        Returns:
+            Iterable[Document]: An iterable of documents.
+
+        """
+        input_files = self.input_files
+        manifest_files = None
+        if self.manifest_path is not None:
+            input_files, self.deleted_files, manifest_files = self._diff_manifest()
+
+        for documents in self._iter_file_documents(
+            input_files, num_workers=num_workers
+        ):
+            yield from documents
+
+        if manifest_files is not None:
+            self._save_manifest(manifest_files)
+
+    def load_data(self, num_workers: Optional[int] = None) -> List[Document]:
+        """Load data from the input directory.
+
+        Args:
+            num_workers (Optional[int]): Number of worker processes used to
+                parse files in parallel. Files are parsed in the current
+                process if None or 1. Default is None.
+
+        Returns:
+            List[Document]: A list of documents.
+
+        """
+        return list(self.lazy_load_data(num_workers=num_workers))
@@ -1,5 +1,17 @@
-from llama_hub.file.deepdoctection.base import (
-    DeepDoctectionReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.file.deepdoctection.base import (
+        DeepDoctectionReader,
+    )
 
 __all__ = ["DeepDoctectionReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.file.deepdoctection.base": ["DeepDoctectionReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.file.flat_pdf.base import (
-    FlatPdfReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.file.flat_pdf.base import (
+        FlatPdfReader,
+    )
 
 __all__ = ["FlatPdfReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.file.flat_pdf.base": ["FlatPdfReader"],
+    },
+)
@@ -5,18 +5,42 @@ A parser for image files.
 """
 
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, cast, Any
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document, ImageDocument
 
+DEFAULT_DONUT_MODEL = "naver-clova-ix/donut-base-finetuned-cord-v2"
+
+
+@lru_cache(maxsize=None)
+def _load_donut(model_name: str) -> Tuple[Any, Any]:
+    """Load a Donut processor and model once per process.
+
+    Every ImageReader using the same model shares them.
+    """
+    from transformers import DonutProcessor, VisionEncoderDecoderModel
+
+    processor = DonutProcessor.from_pretrained(model_name)
+    model = VisionEncoderDecoderModel.from_pretrained(model_name)
+    return processor, model
+
 
 class ImageReader(BaseReader):
     """Image parser.
 
     Extract text from images using DONUT.
 
+    Args:
+        model_name (str): Name of the Donut model used for key-value text.
+            Models are loaded once per process and shared between readers.
+        batch_size (int): Number of images run through the Donut model at a
+            time by `load_batch`.
+        num_threads (Optional[int]): Number of threads torch uses for CPU
+            inference. Left to torch's default if None.
+
     """
 
     def __init__(
@@ -26,6 +50,9 @@ class ImageReader(BaseReader):
         keep_image: bool = False,
         parse_text: bool = True,
         model_kwargs: Dict[str, Any] = {},
+        model_name: str = DEFAULT_DONUT_MODEL,
+        batch_size: int = 8,
+        num_threads: Optional[int] = None,
     ):
         """Init parser."""
         self._text_type = text_type
@@ -36,87 +63,117 @@ class ImageReader(BaseReader):
                 processor = None
                 model = pytesseract
             else:
-                from transformers import DonutProcessor, VisionEncoderDecoderModel
-
-                processor = DonutProcessor.from_pretrained(
-                    "naver-clova-ix/donut-base-finetuned-cord-v2"
-                )
-                model = VisionEncoderDecoderModel.from_pretrained(
-                    "naver-clova-ix/donut-base-finetuned-cord-v2"
-                )
+                processor, model = _load_donut(model_name)
             parser_config = {"processor": processor, "model": model}
         self._parser_config = parser_config
         self._keep_image = keep_image
         self._parse_text = parse_text
         self._model_kwargs = model_kwargs
+        self._batch_size = max(batch_size, 1)
+        self._num_threads = num_threads
+
+    def _generate_text(self, images: List[Any]) -> List[str]:
+        """Extract the key-value text of a batch of images with Donut."""
+        import torch
+
+        model = self._parser_config["model"]
+        processor = self._parser_config["processor"]
+
+        if self._num_threads is not None:
+            torch.set_num_threads(self._num_threads)
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        model.to(device)
+
+        # prepare decoder inputs
+        task_prompt = "<s_cord-v2>"
+        decoder_input_ids = processor.tokenizer(
+            task_prompt, add_special_tokens=False, return_tensors="pt"
+        ).input_ids.repeat(len(images), 1)
+
+        pixel_values = processor(images, return_tensors="pt").pixel_values
+
+        outputs = model.generate(
+            pixel_values.to(device),
+            decoder_input_ids=decoder_input_ids.to(device),
+            max_length=model.decoder.config.max_position_embeddings,
+            early_stopping=True,
+            pad_token_id=processor.tokenizer.pad_token_id,
+            eos_token_id=processor.tokenizer.eos_token_id,
+            use_cache=True,
+            num_beams=3,
+            bad_words_ids=[[processor.tokenizer.unk_token_id]],
+            return_dict_in_generate=True,
+            **self._model_kwargs,
+        )
+
+        texts = []
+        for sequence in processor.batch_decode(outputs.sequences):
+            sequence = sequence.replace(processor.tokenizer.eos_token, "").replace(
+                processor.tokenizer.pad_token, ""
+            )
+            # remove first task start token
+            texts.append(re.sub(r"<.*?>", "", sequence, count=1).strip())
+        return texts
 
-    def load_data(
-        self, file: Path, extra_info: Optional[Dict] = None
+    def load_batch(
+        self, files: List[Path], extra_infos: Optional[List[Optional[Dict]]] = None
     ) -> List[Document]:
-        """Parse file."""
+        """Parse a list of files, running the Donut model on batches of images.
+
+        Args:
+            files (List[Path]): The image files.
+            extra_infos (Optional[List[Optional[Dict]]]): Metadata of each file.
+
+        Returns:
+            List[Document]: A document per file, in the same order.
+        """
         from llama_index.img_utils import img_2_b64
         from PIL import Image
 
-        # load document image
-        image = Image.open(file)
-        if image.mode != "RGB":
-            image = image.convert("RGB")
-
-        # Encode image into base64 string and keep in document
-        image_str: Optional[str] = None
-        if self._keep_image:
-            image_str = img_2_b64(image)
-
-        # Parse image into text
-        text_str: str = ""
-        if self._parse_text:
-            model = self._parser_config["model"]
-            processor = self._parser_config["processor"]
-
-            if processor:
-                import torch
-
-                device = "cuda" if torch.cuda.is_available() else "cpu"
-                model.to(device)
-
-                # prepare decoder inputs
-                task_prompt = "<s_cord-v2>"
-                decoder_input_ids = processor.tokenizer(
-                    task_prompt, add_special_tokens=False, return_tensors="pt"
-                ).input_ids
-
-                pixel_values = processor(image, return_tensors="pt").pixel_values
-
-                outputs = model.generate(
-                    pixel_values.to(device),
-                    decoder_input_ids=decoder_input_ids.to(device),
-                    max_length=model.decoder.config.max_position_embeddings,
-                    early_stopping=True,
-                    pad_token_id=processor.tokenizer.pad_token_id,
-                    eos_token_id=processor.tokenizer.eos_token_id,
-                    use_cache=True,
-                    num_beams=3,
-                    bad_words_ids=[[processor.tokenizer.unk_token_id]],
-                    return_dict_in_generate=True,
-                    **self._model_kwargs,
+        infos = extra_infos or [None] * len(files)
+        documents: List[Document] = []
+        for batch_start in range(0, len(files), self._batch_size):
+            batch_files = files[batch_start : batch_start + self._batch_size]
+
+            # load document images
+            images = []
+            for file in batch_files:
+                image = Image.open(file)
+                if image.mode != "RGB":
+                    image = image.convert("RGB")
+                images.append(image)
+
+            # Parse images into text
+            texts = [""] * len(images)
+            if self._parse_text:
+                if self._parser_config["processor"]:
+                    texts = self._generate_text(images)
+                else:
+                    import pytesseract
+
+                    model = cast(pytesseract, self._parser_config["model"])
+                    texts = [
+                        model.image_to_string(image, **self._model_kwargs)
+                        for image in images
+                    ]
+
+            for i, (image, text_str) in enumerate(zip(images, texts)):
+                # Encode image into base64 string and keep in document
+                image_str: Optional[str] = None
+                if self._keep_image:
+                    image_str = img_2_b64(image)
+
+                documents.append(
+                    ImageDocument(
+                        text=text_str,
+                        image=image_str,
+                        extra_info=infos[batch_start + i] or {},
+                    )
                 )
+        return documents
 
-                sequence = processor.batch_decode(outputs.sequences)[0]
-                sequence = sequence.replace(processor.tokenizer.eos_token, "").replace(
-                    processor.tokenizer.pad_token, ""
-                )
-                # remove first task start token
-                text_str = re.sub(r"<.*?>", "", sequence, count=1).strip()
-            else:
-                import pytesseract
-
-                model = cast(pytesseract, self._parser_config["model"])
-                text_str = model.image_to_string(image, **self._model_kwargs)
-
-        return [
-            ImageDocument(
-                text=text_str,
-                image=image_str,
-                extra_info=extra_info or {},
-            )
-        ]
+    def load_data(
+        self, file: Path, extra_info: Optional[Dict] = None
+    ) -> List[Document]:
+        """Parse file."""
+        return self.load_batch([file], [extra_info])
@@ -1,5 +1,17 @@
-from llama_hub.file.image_blip2.base import (
-    ImageVisionLLMReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.file.image_blip2.base import (
+        ImageVisionLLMReader,
+    )
 
 __all__ = ["ImageVisionLLMReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.file.image_blip2.base": ["ImageVisionLLMReader"],
+    },
+)
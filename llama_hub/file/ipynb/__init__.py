@@ -1,5 +1,17 @@
-from llama_hub.file.ipynb.base import (
-    IPYNBReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.file.ipynb.base import (
+        IPYNBReader,
+    )
 
 __all__ = ["IPYNBReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.file.ipynb.base": ["IPYNBReader"],
+    },
+)
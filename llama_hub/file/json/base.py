@@ -1,13 +1,25 @@
 """JSON Reader."""
 
 import json
+import multiprocessing
+import os
 import re
 from pathlib import Path
-from typing import Dict, Generator, List, Optional
+from typing import IO, Any, Dict, Generator, Iterator, List, Optional, Tuple
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+# Size of the byte ranges of a JSONL file handed to each worker process.
+JSONL_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Number of characters read at a time when streaming a JSON array.
+JSON_READ_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"\s*")
+# characters that can continue a number, up to the end of the buffer
+_NUMBER_TAIL = re.compile(r"[0-9.eE+\-]*\Z")
+
 
 def _depth_first_yield(
     json_data: Dict, levels_back: int, path: List[str]
@@ -33,6 +45,110 @@ def _depth_first_yield(
         yield " ".join(new_path)
 
 
+def _formatted_lines(
+    json_data: Any, prefix: str = "", suffix: str = ""
+) -> Generator[str, None, None]:
+    """Yield the lines of `json.dumps(json_data, indent=0)`.
+
+    Lines that only close a JSON object followed by another item ("},") are
+    skipped, so that the text is built in a single pass instead of dumping
+    the whole object and filtering its lines with a regex.
+    """
+    if isinstance(json_data, dict) and json_data:
+        yield prefix + "{"
+        last = len(json_data) - 1
+        for i, (key, value) in enumerate(json_data.items()):
+            yield from _formatted_lines(
+                value, json.dumps(str(key)) + ": ", "," if i < last else ""
+            )
+        if suffix != ",":
+            yield "}" + suffix
+    elif isinstance(json_data, list) and json_data:
+        yield prefix + "["
+        last = len(json_data) - 1
+        for i, value in enumerate(json_data):
+            yield from _formatted_lines(value, "", "," if i < last else "")
+        yield "]" + suffix
+    else:
+        yield prefix + json.dumps(json_data) + suffix
+
+
+def _iter_json_array(f: IO[str], buffer: str) -> Iterator[Any]:
+    """Incrementally parse the items of a top-level JSON array.
+
+    Args:
+        f (IO[str]): The file, positioned right after `buffer`.
+        buffer (str): Text already read from the file, starting with the
+            array's opening bracket (after optional whitespace).
+
+    """
+    decoder = json.JSONDecoder()
+    pos = _WHITESPACE.match(buffer).end() + 1
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()
+        if pos == len(buffer):
+            buffer = f.read(JSON_READ_SIZE)
+            if not buffer:
+                raise ValueError("Unexpected end of file in JSON array")
+            pos = 0
+            continue
+
+        char = buffer[pos]
+        if char == "]":
+            return
+        if char == ",":
+            pos += 1
+            continue
+
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            end = -1
+        # a number followed only by number characters up to the end of the
+        # buffer may be truncated (e.g. "1." of "1.5"), so it is only accepted
+        # once more text has been read
+        truncated = end == -1 or (
+            isinstance(item, (int, float))
+            and not isinstance(item, bool)
+            and _NUMBER_TAIL.match(buffer, end) is not None
+        )
+        if truncated:
+            chunk = f.read(max(JSON_READ_SIZE, len(buffer) - pos))
+            if chunk:
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                continue
+            if end == -1:
+                raise ValueError("Invalid or truncated item in JSON array")
+        yield item
+        pos = end
+
+
+def _load_jsonl_range(
+    args: Tuple["JSONReader", str, int, int, Optional[Dict]]
+) -> List[Document]:
+    """Load the records of a JSONL file that start in a byte range.
+
+    Runs in worker processes.
+    """
+    reader, file, start, end, extra_info = args
+    documents = []
+    with open(file, "rb") as f:
+        if start > 0:
+            # move to the first line starting at or after `start`
+            f.seek(start - 1)
+            f.readline()
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            if line.strip():
+                documents.append(
+                    reader._parse_jsonobj_to_document(json.loads(line), extra_info)
+                )
+    return documents
+
+
 class JSONReader(BaseReader):
     """JSON reader.
 
@@ -42,13 +158,19 @@ class JSONReader(BaseReader):
         levels_back (int): the number of levels to go back in the JSON tree, 0
         if you want all levels. If levels_back is None, then we just format the
         JSON and make each line an embedding
+        num_workers (Optional[int]): number of worker processes used to parse
+        JSONL files, each working on its own byte range of the file. JSONL
+        files are parsed in the current process if None or 1.
 
     """
 
-    def __init__(self, levels_back: Optional[int] = None) -> None:
+    def __init__(
+        self, levels_back: Optional[int] = None, num_workers: Optional[int] = None
+    ) -> None:
         """Initialize with arguments."""
         super().__init__()
         self.levels_back = levels_back
+        self.num_workers = num_workers
 
     def _parse_jsonobj_to_document(
         self, json_data_object: Dict, extra_info: Optional[Dict] = None
@@ -63,24 +185,45 @@ class JSONReader(BaseReader):
             Document: The document.
         """
         if self.levels_back is None:
-            json_output = json.dumps(json_data_object, indent=0)
-            lines = json_output.split("\n")
-            useful_lines = [
-                line for line in lines if not re.match(r"^[{}\\[\\],]*$", line)
-            ]
-            return Document(text="\n".join(useful_lines), extra_info=extra_info or {})
+            lines = _formatted_lines(json_data_object)
+            return Document(text="\n".join(lines), extra_info=extra_info or {})
 
         else:
             lines = [*_depth_first_yield(json_data_object, self.levels_back, [])]
             return Document(text="\n".join(lines), extra_info=extra_info or {})
 
-    def load_data(
+    def _lazy_load_jsonl_in_workers(
+        self, file: Path, extra_info: Optional[Dict] = None
+    ) -> Iterator[Document]:
+        """Load a JSONL file with a pool of worker processes, in order."""
+        assert self.num_workers is not None
+        file_size = os.path.getsize(file)
+        tasks = [
+            (
+                self,
+                str(file),
+                start,
+                min(start + JSONL_CHUNK_SIZE, file_size),
+                extra_info,
+            )
+            for start in range(0, file_size, JSONL_CHUNK_SIZE)
+        ]
+        if not tasks:
+            return
+        with multiprocessing.Pool(min(self.num_workers, len(tasks))) as pool:
+            for documents in pool.imap(_load_jsonl_range, tasks):
+                yield from documents
+
+    def lazy_load_data(
         self,
         file: Path,
         is_jsonl: Optional[bool] = False,
         extra_info: Optional[Dict] = None,
-    ) -> List[Document]:
-        """Load data from the input file.
+    ) -> Iterator[Document]:
+        """Lazily load data from the input file.
+
+        Yields a document per JSONL record, or per item of a top-level JSON
+        array, without loading the whole file in memory.
 
         Args:
             file (Path): Path to the input file.
@@ -88,27 +231,55 @@ class JSONReader(BaseReader):
             extra_info (Optional[Dict]): Additional information. Default is None.
 
         Returns:
-            List[Document]: List of documents.
+            Iterator[Document]: Iterator of documents.
         """
         if not isinstance(file, Path):
             file = Path(file)
+
+        if is_jsonl and self.num_workers is not None and self.num_workers > 1:
+            yield from self._lazy_load_jsonl_in_workers(file, extra_info)
+            return
+
         with open(file, "r") as f:
-            data = []
             if is_jsonl:
                 for line in f:
-                    data.append(json.loads(line.strip()))
-            else:
-                data = json.load(f)
-            documents = []
+                    line = line.strip()
+                    if line:
+                        yield self._parse_jsonobj_to_document(
+                            json.loads(line), extra_info
+                        )
+                return
+
+            buffer = f.read(JSON_READ_SIZE)
+            if buffer.lstrip().startswith("["):
+                for json_object in _iter_json_array(f, buffer):
+                    yield self._parse_jsonobj_to_document(json_object, extra_info)
+                return
+
+            data = json.loads(buffer + f.read())
 
             # For a dictionary JSON object, pass the entire data to be parsed as document
             if isinstance(data, dict):
-                documents.append(self._parse_jsonobj_to_document(data, extra_info))
+                yield self._parse_jsonobj_to_document(data, extra_info)
             # For a List or Non-Dictionary JSON object loop through and pass each item
             else:
                 for json_object in data:
-                    documents.append(
-                        self._parse_jsonobj_to_document(json_object, extra_info)
-                    )
+                    yield self._parse_jsonobj_to_document(json_object, extra_info)
+
+    def load_data(
+        self,
+        file: Path,
+        is_jsonl: Optional[bool] = False,
+        extra_info: Optional[Dict] = None,
+    ) -> List[Document]:
+        """Load data from the input file.
+
+        Args:
+            file (Path): Path to the input file.
+            is_jsonl (Optional[bool]): If True, indicates that the file is in JSONL format. Defaults to False.
+            extra_info (Optional[Dict]): Additional information. Default is None.
 
-            return documents
+        Returns:
+            List[Document]: List of documents.
+        """
+        return list(self.lazy_load_data(file, is_jsonl=is_jsonl, extra_info=extra_info))
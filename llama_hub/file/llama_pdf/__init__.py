@@ -1,3 +1,15 @@
-from llama_hub.file.llama_pdf.base import LlamaPDFReader
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.file.llama_pdf.base import LlamaPDFReader
 
 __all__ = ["LlamaPDFReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.file.llama_pdf.base": ["LlamaPDFReader"],
+    },
+)
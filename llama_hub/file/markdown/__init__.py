@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.file.markdown.base import (
-    MarkdownReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.file.markdown.base import (
+        MarkdownReader,
+    )
 
 __all__ = ["MarkdownReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.file.markdown.base": ["MarkdownReader"],
+    },
+)
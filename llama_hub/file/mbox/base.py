@@ -3,12 +3,135 @@
 Contains simple parser for mbox files.
 
 """
+import multiprocessing
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+_worker_file: Optional[IO[bytes]] = None
+_worker_message_format: str = ""
+_worker_errors: str = "ignore"
+
+# number of messages sent to a worker at a time
+MESSAGES_PER_TASK = 16
+
+
+def _iter_message_spans(
+    fp: IO[bytes], start_byte: int = 0
+) -> Iterator[Tuple[int, int]]:
+    """Yield the [start, stop) byte offsets of the messages of an mbox file.
+
+    Messages are delimited as `mailbox.mbox` does, by lines starting with
+    "From ", without building a table of contents of the whole file first.
+
+    Args:
+        fp (IO[bytes]): The mbox file, opened in binary mode.
+        start_byte (int): Offset of the start of a line to scan from.
+    """
+    from mailbox import linesep
+
+    fp.seek(start_byte)
+    start = None
+    last_was_empty = False
+    while True:
+        line_pos = fp.tell()
+        line = fp.readline()
+        if line.startswith(b"From ") or not line:
+            if start is not None:
+                yield start, line_pos - len(linesep) if last_was_empty else line_pos
+            if not line:
+                return
+            start = line_pos
+            last_was_empty = False
+        else:
+            last_was_empty = line == linesep
+
+
+def _read_message(fp: IO[bytes], span: Tuple[int, int]) -> bytes:
+    """Read the message at `span`, without its "From " line."""
+    start, stop = span
+    fp.seek(start)
+    fp.readline()
+    return fp.read(stop - fp.tell())
+
+
+def _format_message(raw: bytes, message_format: str, errors: str) -> Optional[str]:
+    """Format a message, or return None if it has no text content."""
+    from email.parser import BytesParser
+    from email.policy import default
+
+    msg = BytesParser(policy=default).parsebytes(raw)
+
+    # Parse multipart messages
+    part = None
+    if msg.is_multipart():
+        for candidate in msg.walk():
+            ctype = candidate.get_content_type()
+            cdispo = str(candidate.get("Content-Disposition"))
+            if ctype == "text/plain" and "attachment" not in cdispo:
+                part = candidate
+                break
+    # Get plain message payload for non-multipart messages
+    else:
+        part = msg
+
+    content = part.get_payload(decode=True) if part is not None else None
+    if not content:
+        return None
+
+    if part.get_content_type() == "text/plain":
+        # plain text needs no HTML parsing, only decoding
+        charset = part.get_content_charset() or "utf-8"
+        try:
+            text = content.decode(charset, errors=errors)
+        except LookupError:
+            text = content.decode("utf-8", errors=errors)
+    else:
+        from bs4 import BeautifulSoup
+
+        # Parse message HTML content
+        text = BeautifulSoup(content, "html.parser").get_text()
+
+    # Remove unneeded whitespace
+    stripped_content = " ".join(text.split())
+    # Format message to include date, sender, receiver and subject
+    return message_format.format(
+        _date=msg["date"],
+        _from=msg["from"],
+        _to=msg["to"],
+        _subject=msg["subject"],
+        _content=stripped_content,
+    )
+
+
+def _init_worker(filepath: str, message_format: str, errors: str) -> None:
+    """Open the mbox file read by a pool worker."""
+    global _worker_file, _worker_message_format, _worker_errors
+    _worker_file = open(filepath, "rb")
+    _worker_message_format = message_format
+    _worker_errors = errors
+
+
+def _format_message_at(span: Tuple[int, int]) -> Tuple[Tuple[int, int], Optional[str]]:
+    """Read and format the message at `span` of the worker's mbox file.
+
+    Runs in worker processes, so only offsets are sent to the workers.
+    """
+    assert _worker_file is not None
+    raw = _read_message(_worker_file, span)
+    return span, _format_message(raw, _worker_message_format, _worker_errors)
+
+
+def _format_messages_at(
+    spans: List[Tuple[int, int]]
+) -> List[Tuple[Tuple[int, int], Optional[str]]]:
+    """Read and format a batch of messages of the worker's mbox file."""
+    return [_format_message_at(span) for span in spans]
+
 
 class MboxReader(BaseReader):
     """Mbox reader.
@@ -17,6 +140,14 @@ class MboxReader(BaseReader):
     Returns string including date, subject, sender, receiver and
     content for each message.
 
+    Args:
+        num_workers (Optional[int]): Number of worker processes decoding
+            messages in parallel. Messages are decoded in the current process
+            if None or 1.
+        include_byte_offsets (bool): Whether to add the `start_byte` and
+            `end_byte` of each message to the metadata of its document, so
+            that reading can resume after it with `start_byte`.
+
     """
 
     DEFAULT_MESSAGE_FORMAT: str = (
@@ -33,6 +164,8 @@ class MboxReader(BaseReader):
         max_count: int = 0,
         message_format: str = DEFAULT_MESSAGE_FORMAT,
         id_fn: Optional[Callable[[str], str]] = None,
+        num_workers: Optional[int] = None,
+        include_byte_offsets: bool = False,
         **kwargs: Any
     ) -> None:
         """Init params."""
@@ -40,66 +173,98 @@ class MboxReader(BaseReader):
         self.max_count = max_count
         self.message_format = message_format
         self.id_fn = id_fn
+        self.num_workers = num_workers
+        self.include_byte_offsets = include_byte_offsets
 
-    def parse_file(self, filepath: Path, errors: str = "ignore") -> List[str]:
-        """Parse file into string."""
-        # Import required libraries
-        import mailbox
-        from email.parser import BytesParser
-        from email.policy import default
+    def _iter_messages(
+        self, filepath: Path, errors: str = "ignore", start_byte: int = 0
+    ) -> Iterator[Tuple[Tuple[int, int], str]]:
+        """Yield the span and formatted text of each message with content."""
+        with open(filepath, "rb") as fp:
+            spans = _iter_message_spans(fp, start_byte)
+            if self.num_workers is not None and self.num_workers > 1:
+                # workers read the messages from their own handle on the file.
+                # Batches are submitted as results are consumed, so that a slow
+                # consumer does not let messages pile up in memory
+                max_pending = 2 * self.num_workers
+                with multiprocessing.Pool(
+                    self.num_workers,
+                    initializer=_init_worker,
+                    initargs=(str(filepath), self.message_format, errors),
+                ) as pool:
+                    pending: deque = deque()
+                    while True:
+                        batch = list(islice(spans, MESSAGES_PER_TASK))
+                        if batch:
+                            pending.append(
+                                pool.apply_async(_format_messages_at, (batch,))
+                            )
+                        if not pending:
+                            break
+                        if batch and len(pending) < max_pending:
+                            continue
+                        for span, msg_string in pending.popleft().get():
+                            yield from self._checked(span, msg_string)
+            else:
+                for span in spans:
+                    position = fp.tell()
+                    raw = _read_message(fp, span)
+                    fp.seek(position)
+                    msg_string = _format_message(raw, self.message_format, errors)
+                    yield from self._checked(span, msg_string)
 
-        from bs4 import BeautifulSoup
+    @staticmethod
+    def _checked(
+        span: Tuple[int, int], msg_string: Optional[str]
+    ) -> Iterator[Tuple[Tuple[int, int], str]]:
+        if msg_string is None:
+            print(
+                "WARNING llama_hub.file.mbox found messages with content that"
+                " stayed None. Skipping entry..."
+            )
+            return
+        yield span, msg_string
 
-        i = 0
+    def parse_file(self, filepath: Path, errors: str = "ignore") -> List[str]:
+        """Parse file into string."""
         results: List[str] = []
-        # Load file using mailbox
-        bytes_parser = BytesParser(policy=default).parse
-        mbox = mailbox.mbox(filepath, factory=bytes_parser)  # type: ignore
-
-        # Iterate through all messages
-        for _, _msg in enumerate(mbox):
-            msg: mailbox.mboxMessage = _msg
-            # Parse multipart messages
-
-            content = None
-
-            if msg.is_multipart():
-                for part in msg.walk():
-                    ctype = part.get_content_type()
-                    cdispo = str(part.get("Content-Disposition"))
-                    if ctype == "text/plain" and "attachment" not in cdispo:
-                        content = part.get_payload(decode=True)  # decode
-                        break
-            # Get plain message payload for non-multipart messages
-            else:
-                content = msg.get_payload(decode=True)
-
-            if not content:
-                print(
-                    "WARNING llama_hub.file.mbox found messages with content that"
-                    " stayed None. Skipping entry..."
-                )
-                continue
-
-            # Parse message HTML content and remove unneeded whitespace
-            soup = BeautifulSoup(content)
-            stripped_content = " ".join(soup.get_text().split())
-            # Format message to include date, sender, receiver and subject
-            msg_string = self.message_format.format(
-                _date=msg["date"],
-                _from=msg["from"],
-                _to=msg["to"],
-                _subject=msg["subject"],
-                _content=stripped_content,
-            )
-            # Add message string to results
+        for _, msg_string in self._iter_messages(filepath, errors):
             results.append(msg_string)
-            # Increment counter and return if max count is met
-            i += 1
-            if self.max_count > 0 and i >= self.max_count:
+            # Return if max count is met
+            if self.max_count > 0 and len(results) >= self.max_count:
                 break
         return results
 
+    def lazy_load_data(
+        self,
+        file: Path,
+        extra_info: Optional[Dict] = None,
+        start_byte: int = 0,
+    ) -> Iterator[Document]:
+        """Lazily load data from the input file, a message at a time.
+
+        Args:
+            file (Path): The mbox file.
+            extra_info (Optional[Dict]): Extra metadata added to every document.
+            start_byte (int): Offset to resume reading from, such as the
+                `end_byte` of the last document read with
+                `include_byte_offsets=True`. 0 by default.
+        """
+        for count, ((start, end), msg) in enumerate(
+            self._iter_messages(file, start_byte=start_byte), start=1
+        ):
+            metadata = dict(extra_info or {})
+            if self.include_byte_offsets:
+                metadata.update({"start_byte": start, "end_byte": end})
+            d = Document(text=msg, extra_info=metadata)
+            if self.id_fn:
+                d.doc_id = self.id_fn(msg)
+            yield d
+
+            # Return if max count is met
+            if self.max_count > 0 and count >= self.max_count:
+                break
+
     def load_data(
         self, file: Path, extra_info: Optional[Dict] = None
     ) -> List[Document]:
@@ -109,12 +274,4 @@ class MboxReader(BaseReader):
             max_count (int): Maximum amount of messages to read.
             message_format (str): Message format overriding default.
         """
-        docs: List[Document] = []
-        content = self.parse_file(file)
-        for msg in content:
-            d = Document(text=msg, extra_info=extra_info or {})
-            if self.id_fn:
-                d.doc_id = self.id_fn(msg)
-            docs.append(d)
-
-        return docs
+        return list(self.lazy_load_data(file, extra_info=extra_info))
@@ -1,5 +1,17 @@
-from llama_hub.file.paged_csv.base import (
-    PagedCSVReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.file.paged_csv.base import (
+        PagedCSVReader,
+    )
 
 __all__ = ["PagedCSVReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.file.paged_csv.base": ["PagedCSVReader"],
+    },
+)
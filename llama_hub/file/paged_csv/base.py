@@ -4,12 +4,89 @@ A parser for tabular data files.
 
 """
 
+import codecs
+import io
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+# size of the chunks the file is read by
+CSV_READ_SIZE = 64 * 1024
+
+
+def _ends_lines_with_newline_byte(encoding: str) -> bool:
+    """Whether text in `encoding` ends its lines with single newline bytes."""
+    encoder = codecs.getincrementalencoder(encoding)()
+    # past a byte order mark
+    encoder.encode("a")
+    return encoder.encode("\r\n") == b"\r\n"
+
+
+class _LineReader:
+    """Iterate over the decoded lines of a binary file, tracking the byte offset.
+
+    The csv module pulls lines one at a time, so the offset before and after
+    reading a row gives the bytes the row spans in the file. Lines end with
+    LF, CRLF or CR, and are returned ending with LF, as in universal newlines
+    mode. Files in encodings whose lines do not end with newline
+    bytes, such as utf-16, are decoded as a text stream instead, and the
+    offset is not tracked.
+    """
+
+    def __init__(self, fp: IO[bytes], encoding: str) -> None:
+        self._fp = fp
+        self._encoding = encoding
+        self.offset = fp.tell()
+        # complete lines read ahead, and the start of the next line
+        self._lines: List[bytes] = []
+        self._index = 0
+        self._rest = b""
+        self._text: Optional[IO[str]] = None
+        if not _ends_lines_with_newline_byte(encoding):
+            self._text = io.TextIOWrapper(fp, encoding=encoding)
+
+    def __iter__(self) -> "_LineReader":
+        return self
+
+    def __next__(self) -> str:
+        if self._text is not None:
+            return next(self._text)
+
+        if self._index == len(self._lines):
+            self._read_lines()
+            if not self._lines:
+                raise StopIteration
+        line = self._lines[self._index]
+        self._index += 1
+        self.offset += len(line)
+        if line.endswith(b"\r"):
+            line = line[:-1] + b"\n"
+        elif line.endswith(b"\r\n"):
+            line = line[:-2] + b"\n"
+        return line.decode(self._encoding)
+
+    def _read_lines(self) -> None:
+        """Read the next complete lines of the file, a chunk at a time."""
+        rest = self._rest
+        self._lines, self._index = [], 0
+        while not self._lines:
+            chunk = self._fp.read(CSV_READ_SIZE)
+            if not chunk:
+                self._lines = [rest] if rest else []
+                rest = b""
+                break
+            # bytes are split on LF, CRLF and CR only
+            lines = (rest + chunk).splitlines(keepends=True)
+            # the last line may go on in the next chunk, and so may a CRLF
+            rest = lines.pop()
+            if rest.endswith(b"\n"):
+                lines.append(rest)
+                rest = b""
+            self._lines = lines
+        self._rest = rest
+
 
 class PagedCSVReader(BaseReader):
     """Paged CSV parser.
@@ -19,33 +96,122 @@ class PagedCSVReader(BaseReader):
     Args:
         encoding (str): Encoding used to open the file.
             utf-8 by default.
+        rows_per_document (int): Number of rows put in each document, separated
+            by a blank line. 1 by default.
+        include_byte_offsets (bool): Whether to add the `start_byte` and
+            `end_byte` of the rows of each document to its metadata, so they can
+            be read again with `byte_range`. False by default. Not supported
+            for encodings that do not end lines with a newline byte, such as
+            utf-16.
     """
 
-    def __init__(self, *args: Any, encoding: str = "utf-8", **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *args: Any,
+        encoding: str = "utf-8",
+        rows_per_document: int = 1,
+        include_byte_offsets: bool = False,
+        **kwargs: Any,
+    ) -> None:
         """Init params."""
         super().__init__(*args, **kwargs)
+        if include_byte_offsets and not _ends_lines_with_newline_byte(encoding):
+            raise ValueError(f"Byte offsets are not supported for {encoding} files")
         self._encoding = encoding
+        self._rows_per_document = max(rows_per_document, 1)
+        self._include_byte_offsets = include_byte_offsets
 
-    def load_data(
+    def _make_document(
+        self,
+        rows: List[str],
+        start_byte: int,
+        end_byte: int,
+        extra_info: Optional[Dict],
+    ) -> Document:
+        metadata = dict(extra_info or {})
+        if self._include_byte_offsets:
+            metadata.update({"start_byte": start_byte, "end_byte": end_byte})
+        return Document(text="\n\n".join(rows), extra_info=metadata)
+
+    def lazy_load_data(
         self,
         file: Path,
         extra_info: Optional[Dict] = None,
         delimiter: str = ",",
         quotechar: str = '"',
-    ) -> List[Document]:
-        """Parse file."""
+        byte_range: Optional[Tuple[int, int]] = None,
+    ) -> Iterator[Document]:
+        """Parse file, yielding documents as rows are read.
+
+        Args:
+            file (Path): Path to the CSV file.
+            extra_info (Optional[Dict]): Extra metadata added to every document.
+            delimiter (str): Field delimiter. "," by default.
+            quotechar (str): Quote character. '"' by default.
+            byte_range (Optional[Tuple[int, int]]): Byte offsets [start, end)
+                of the rows to read, as given in the metadata of documents
+                loaded with `include_byte_offsets=True`. `start` must be the
+                offset of the start of a row. All rows are read if None.
+
+        Returns:
+            Iterator[Document]: An iterator of documents.
+        """
         import csv
 
-        docs = []
-        with open(file, "r", encoding=self._encoding) as fp:
-            csv_reader = csv.DictReader(f=fp, delimiter=delimiter, quotechar=quotechar)  # type: ignore
-            for row in csv_reader:
-                docs.append(
-                    Document(
-                        text="\n".join(
-                            f"{k.strip()}: {v.strip()}" for k, v in row.items()
-                        ),
-                        extra_info=extra_info or {},
+        with open(file, "rb") as fp:
+            lines = _LineReader(fp, self._encoding)
+            csv_reader = csv.reader(lines, delimiter=delimiter, quotechar=quotechar)
+            header = next(csv_reader, None)
+            if header is None:
+                return
+            keys = [key.strip() for key in header]
+
+            end_byte = None
+            if byte_range is not None:
+                if not _ends_lines_with_newline_byte(self._encoding):
+                    raise ValueError(
+                        f"Byte ranges are not supported for {self._encoding} files"
+                    )
+                start_byte, end_byte = byte_range
+                fp.seek(max(start_byte, lines.offset))
+                lines = _LineReader(fp, self._encoding)
+                csv_reader = csv.reader(lines, delimiter=delimiter, quotechar=quotechar)
+
+            rows: List[str] = []
+            rows_start = lines.offset
+            while end_byte is None or lines.offset < end_byte:
+                row_start = lines.offset
+                row = next(csv_reader, None)
+                if row is None:
+                    break
+                # skip blank lines, as csv.DictReader does
+                if not row:
+                    continue
+                if not rows:
+                    rows_start = row_start
+                rows.append(
+                    "\n".join(
+                        f"{key}: {value.strip()}" for key, value in zip(keys, row)
                     )
                 )
-        return docs
+                if len(rows) == self._rows_per_document:
+                    yield self._make_document(
+                        rows, rows_start, lines.offset, extra_info
+                    )
+                    rows = []
+            if rows:
+                yield self._make_document(rows, rows_start, lines.offset, extra_info)
+
+    def load_data(
+        self,
+        file: Path,
+        extra_info: Optional[Dict] = None,
+        delimiter: str = ",",
+        quotechar: str = '"',
+    ) -> List[Document]:
+        """Parse file."""
+        return list(
+            self.lazy_load_data(
+                file, extra_info=extra_info, delimiter=delimiter, quotechar=quotechar
+            )
+        )
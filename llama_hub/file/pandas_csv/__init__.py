@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.file.pandas_csv.base import (
-    PandasCSVReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.file.pandas_csv.base import (
+        PandasCSVReader,
+    )
 
 __all__ = ["PandasCSVReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.file.pandas_csv.base": ["PandasCSVReader"],
+    },
+)
@@ -4,11 +4,45 @@ A parser for tabular data files using pandas.
 
 """
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _column_strings(column: "pd.Series") -> "pd.Series":
+    """Convert a column to strings, keeping missing values as e.g. "nan"."""
+    if column.dtype.kind in "mM":
+        # dates and durations formatted per element, e.g. "2020-01-01 00:00:00"
+        # rather than shortened to the precision the whole column needs
+        return column.map(str)
+    strings = column.astype(str)
+    if strings.hasnans:
+        strings = strings.fillna(column[strings.isna()].map(str))
+    return strings
+
+
+def _join_columns(df: "pd.DataFrame", col_joiner: str) -> List[str]:
+    """Join the columns of each row of `df` into a string.
+
+    The rows are built column by column with vectorized string operations,
+    rather than with a Python call per row.
+    """
+    if df.shape[1] == 0:
+        return [""] * len(df)
+    # rows used to be converted whole, in the dtype common to their columns,
+    # so integers render as e.g. "1.0" when every other column is float
+    dtype = df.iloc[:0].to_numpy().dtype
+    if dtype != object:
+        df = df.astype(dtype)
+    text = _column_strings(df.iloc[:, 0])
+    for i in range(1, df.shape[1]):
+        text = text + col_joiner + _column_strings(df.iloc[:, i])
+    return text.tolist()
+
 
 class PandasCSVReader(BaseReader):
     r"""Pandas-based CSV parser.
@@ -33,6 +67,13 @@ class PandasCSVReader(BaseReader):
             for more information.
             Set to empty dict by default, this means pandas will try to figure
             out the separators, table head, etc. on its own.
+            `{"engine": "pyarrow"}` selects the multithreaded pyarrow parser,
+            which does not support `chunksize`.
+
+        chunksize (Optional[int]): Number of rows read at a time. When set, the
+            file is streamed and, with `concat_rows=True`, a Document is created
+            per chunk of rows. The whole file is read at once if None.
+            None by default.
 
     """
 
@@ -43,6 +84,7 @@ class PandasCSVReader(BaseReader):
         col_joiner: str = ", ",
         row_joiner: str = "\n",
         pandas_config: dict = {},
+        chunksize: Optional[int] = None,
         **kwargs: Any
     ) -> None:
         """Init params."""
@@ -51,26 +93,34 @@ class PandasCSVReader(BaseReader):
         self._col_joiner = col_joiner
         self._row_joiner = row_joiner
         self._pandas_config = pandas_config
+        self._chunksize = chunksize
 
-    def load_data(
+    def lazy_load_data(
         self, file: Path, extra_info: Optional[Dict] = None
-    ) -> List[Document]:
-        """Parse file."""
+    ) -> Iterator[Document]:
+        """Parse file, yielding documents as chunks of rows are read."""
         import pandas as pd
 
-        df = pd.read_csv(file, **self._pandas_config)
+        if self._chunksize is None:
+            chunks: Iterator[pd.DataFrame] = iter(
+                [pd.read_csv(file, **self._pandas_config)]
+            )
+        else:
+            chunks = pd.read_csv(file, chunksize=self._chunksize, **self._pandas_config)
 
-        text_list = df.apply(
-            lambda row: (self._col_joiner).join(row.astype(str).tolist()), axis=1
-        ).tolist()
+        for df in chunks:
+            text_list = _join_columns(df, self._col_joiner)
 
-        if self._concat_rows:
-            return [
-                Document(
+            if self._concat_rows:
+                yield Document(
                     text=self._row_joiner.join(text_list), extra_info=extra_info or {}
                 )
-            ]
-        else:
-            return [
-                Document(text=text, extra_info=extra_info or {}) for text in text_list
-            ]
+            else:
+                for text in text_list:
+                    yield Document(text=text, extra_info=extra_info or {})
+
+    def load_data(
+        self, file: Path, extra_info: Optional[Dict] = None
+    ) -> List[Document]:
+        """Parse file."""
+        return list(self.lazy_load_data(file, extra_info=extra_info))
@@ -4,11 +4,45 @@ Pandas parser for .xlsx files.
 
 """
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _column_strings(column: "pd.Series") -> "pd.Series":
+    """Convert a column to strings, keeping missing values as e.g. "nan"."""
+    if column.dtype.kind in "mM":
+        # dates and durations formatted per element, e.g. "2020-01-01 00:00:00"
+        # rather than shortened to the precision the whole column needs
+        return column.map(str)
+    strings = column.astype(str)
+    if strings.hasnans:
+        strings = strings.fillna(column[strings.isna()].map(str))
+    return strings
+
+
+def _join_columns(df: "pd.DataFrame", col_joiner: str) -> List[str]:
+    """Join the columns of each row of `df` into a string.
+
+    The rows are built column by column with vectorized string operations,
+    rather than by converting the sheet to a list of Python rows first.
+    """
+    if df.shape[1] == 0:
+        return [""] * len(df)
+    # rows used to be converted whole, in the dtype common to their columns,
+    # so integers render as e.g. "1.0" when every other column is float
+    dtype = df.iloc[:0].to_numpy().dtype
+    if dtype != object:
+        df = df.astype(dtype)
+    text = _column_strings(df.iloc[:, 0])
+    for i in range(1, df.shape[1]):
+        text = text + col_joiner + _column_strings(df.iloc[:, i])
+    return text.tolist()
+
 
 class PandasExcelReader(BaseReader):
     r"""Pandas-based CSV parser.
@@ -71,13 +105,11 @@ class PandasExcelReader(BaseReader):
         if include_different_sheet_docs:
             documents = []
             for sheet_name, df in dfs.items():
-                sheet_data = df.values.astype(str).tolist()
+                sheet_rows = _join_columns(df, self._row_joiner)
                 if self._concat_rows:
-                    text = self._row_joiner.join(
-                        self._row_joiner.join(row) for row in sheet_data
-                    )
+                    text = self._row_joiner.join(sheet_rows)
                 else:
-                    text = [self._row_joiner.join(row) for row in sheet_data]
+                    text = sheet_rows
 
                 doc_extra_info = {"sheet_name": sheet_name}
                 if extra_info:
@@ -91,18 +123,16 @@ class PandasExcelReader(BaseReader):
                 )
             return documents
         else:
-            all_sheets_data = []
+            all_sheets_rows = []
             for sheet_name, df in dfs.items():
                 if include_sheetname:
-                    all_sheets_data.append([sheet_name])
-                all_sheets_data.extend(df.values.astype(str).tolist())
+                    all_sheets_rows.append(str(sheet_name))
+                all_sheets_rows.extend(_join_columns(df, self._row_joiner))
 
             if self._concat_rows:
-                text = self._row_joiner.join(
-                    self._row_joiner.join(row) for row in all_sheets_data
-                )
+                text = self._row_joiner.join(all_sheets_rows)
             else:
-                text = [self._row_joiner.join(row) for row in all_sheets_data]
+                text = all_sheets_rows
 
             return [
                 Document(
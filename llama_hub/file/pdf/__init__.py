@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.file.pdf.base import (
-    PDFReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.file.pdf.base import (
+        PDFReader,
+    )
 
 __all__ = ["PDFReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.file.pdf.base": ["PDFReader"],
+    },
+)
@@ -1,19 +1,85 @@
 """Read PDF files."""
 
+import io
+import math
+import multiprocessing
 from pathlib import Path
-from typing import IO, Dict, List, Optional, Union
+from typing import IO, Dict, Iterator, List, Optional, Tuple, Union
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
 
+_worker_source: Optional[Union[str, bytes]] = None
+
+
+def _init_worker(source: Union[str, bytes]) -> None:
+    """Set the PDF (path or content) read by a pool worker."""
+    global _worker_source
+    _worker_source = source
+
+
+def _extract_pages(page_range: Tuple[int, int]) -> List[Tuple[str, str]]:
+    """Extract the text and label of pages [start, end) of the worker's PDF.
+
+    Runs in worker processes, so each call opens its own pypdf reader.
+    """
+    import pypdf
+
+    assert _worker_source is not None
+    if isinstance(_worker_source, bytes):
+        pdf = pypdf.PdfReader(io.BytesIO(_worker_source))
+    else:
+        pdf = pypdf.PdfReader(_worker_source)
+    start, end = page_range
+    page_labels = pdf.page_labels
+    return [
+        (pdf.pages[page].extract_text(), page_labels[page])
+        for page in range(start, end)
+    ]
+
+
 class PDFReader(BaseReader):
-    """PDF reader."""
+    """PDF reader.
 
-    def load_data(
-        self, file: Union[IO[bytes], str, Path], extra_info: Optional[Dict] = None
-    ) -> List[Document]:
-        """Parse file."""
+    Args:
+        num_workers (Optional[int]): Number of worker processes used to
+            extract pages in parallel, each working on its own range of pages.
+            Pages are extracted in the current process if None or 1.
+            Default is None.
+        pages_per_task (Optional[int]): Number of pages handed to a worker at
+            a time. Defaults to spreading the pages over four tasks per worker.
+    """
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        pages_per_task: Optional[int] = None,
+    ) -> None:
+        """Initialize with parameters."""
+        super().__init__()
+        self.num_workers = num_workers
+        self.pages_per_task = pages_per_task
+
+    def lazy_load_data(
+        self,
+        file: Union[IO[bytes], str, Path],
+        extra_info: Optional[Dict] = None,
+        page_range: Optional[Tuple[int, int]] = None,
+    ) -> Iterator[Document]:
+        """Parse file, yielding one Document per page.
+
+        Args:
+            file (Union[IO[bytes], str, Path]): Path to the PDF or a PDF byte
+                stream.
+            extra_info (Optional[Dict]): Extra metadata added to every page.
+            page_range (Optional[Tuple[int, int]]): Zero-based range of pages
+                [start, end) to read. All pages are read if None.
+
+        Returns:
+            Iterator[Document]: An iterator of page documents.
+
+        """
         import pypdf
 
         # Check if the file is already a Path object, if not, create a Path object from the string
@@ -23,10 +89,7 @@ class PDFReader(BaseReader):
         # Open the file if it's not already open, else use it as it is
         if isinstance(file, Path):
             context = open(file, "rb")
-            if extra_info:
-                extra_info.update({"file_name": file.name})
-            else:
-                extra_info = {"file_name": file.name}
+            extra_info = {**(extra_info or {}), "file_name": file.name}
         else:
             context = file
 
@@ -36,17 +99,64 @@ class PDFReader(BaseReader):
 
             # Get the number of pages in the PDF document
             num_pages = len(pdf.pages)
+            start, end = page_range or (0, num_pages)
+            start, end = max(start, 0), min(end, num_pages)
+
+            if self.num_workers is not None and self.num_workers > 1:
+                if isinstance(file, Path):
+                    source: Union[str, bytes] = str(file)
+                else:
+                    fp.seek(0)
+                    source = fp.read()
+                pages = self._extract_pages_in_workers(source, start, end)
+            else:
+                # page_labels computes the labels of all pages on each access
+                page_labels = pdf.page_labels
+                pages = (
+                    (pdf.pages[page].extract_text(), page_labels[page])
+                    for page in range(start, end)
+                )
 
             # Iterate over every page
-            docs = []
-            for page in range(num_pages):
-                # Extract the text from the page
-                page_text = pdf.pages[page].extract_text()
-                page_label = pdf.page_labels[page]
+            for page_text, page_label in pages:
                 metadata = {"page_label": page_label}
 
                 if extra_info is not None:
                     metadata.update(extra_info)
 
-                docs.append(Document(text=page_text, extra_info=metadata))
-            return docs
+                yield Document(text=page_text, extra_info=metadata)
+
+    def _extract_pages_in_workers(
+        self, source: Union[str, bytes], start: int, end: int
+    ) -> Iterator[Tuple[str, str]]:
+        """Extract pages [start, end) with a pool of worker processes, in order."""
+        assert self.num_workers is not None
+        pages_per_task = self.pages_per_task or max(
+            1, math.ceil((end - start) / (self.num_workers * 4))
+        )
+        tasks = [
+            (task_start, min(task_start + pages_per_task, end))
+            for task_start in range(start, end, pages_per_task)
+        ]
+        if not tasks:
+            return
+        # the PDF is handed to each worker once, at start-up, rather than
+        # with every task
+        with multiprocessing.Pool(
+            min(self.num_workers, len(tasks)),
+            initializer=_init_worker,
+            initargs=(source,),
+        ) as pool:
+            for pages in pool.imap(_extract_pages, tasks):
+                yield from pages
+
+    def load_data(
+        self,
+        file: Union[IO[bytes], str, Path],
+        extra_info: Optional[Dict] = None,
+        page_range: Optional[Tuple[int, int]] = None,
+    ) -> List[Document]:
+        """Parse file."""
+        return list(
+            self.lazy_load_data(file, extra_info=extra_info, page_range=page_range)
+        )
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.file.pdf_miner.base import (
-    PDFMinerReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.file.pdf_miner.base import (
+        PDFMinerReader,
+    )
 
 __all__ = ["PDFMinerReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.file.pdf_miner.base": ["PDFMinerReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.file.pymu_pdf.base import (
-    PyMuPDFReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.file.pymu_pdf.base import (
+        PyMuPDFReader,
+    )
 
 __all__ = ["PyMuPDFReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.file.pymu_pdf.base": ["PyMuPDFReader"],
+    },
+)
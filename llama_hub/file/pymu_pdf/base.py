@@ -1,18 +1,66 @@
 """Read PDF files using PyMuPDF library."""
 
+import math
+import multiprocessing
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import IO, Dict, Iterator, List, Optional, Tuple, Union
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+_worker_source: Optional[Union[str, bytes]] = None
+
+
+def _init_worker(source: Union[str, bytes]) -> None:
+    """Set the PDF (path or content) read by a pool worker."""
+    global _worker_source
+    _worker_source = source
+
+
+def _open(source: Union[str, bytes]):
+    import fitz
+
+    if isinstance(source, bytes):
+        return fitz.open(stream=source, filetype="pdf")
+    return fitz.open(source)
+
+
+def _extract_pages(page_range: Tuple[int, int]) -> List[Tuple[int, str]]:
+    """Extract the number and text of pages [start, end) of the worker's PDF.
+
+    Runs in worker processes, so each call opens its own fitz document.
+    """
+    assert _worker_source is not None
+    start, end = page_range
+    with _open(_worker_source) as doc:
+        return [(page.number, page.get_text()) for page in doc.pages(start, end)]
+
 
 class PyMuPDFReader(BaseReader):
-    """Read PDF files using PyMuPDF library."""
+    """Read PDF files using PyMuPDF library.
+
+    Args:
+        num_workers (Optional[int]): Number of worker processes used to
+            extract pages in parallel, each opening its own handle on the PDF
+            and working on its own range of pages. Pages are extracted in the
+            current process if None or 1. Default is None.
+        pages_per_task (Optional[int]): Number of pages handed to a worker at
+            a time. Defaults to spreading the pages over four tasks per worker.
+    """
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        pages_per_task: Optional[int] = None,
+    ) -> None:
+        """Initialize with parameters."""
+        super().__init__()
+        self.num_workers = num_workers
+        self.pages_per_task = pages_per_task
 
     def load_data(
         self,
-        file_path: Union[Path, str],
+        file_path: Union[Path, str, bytes, IO[bytes]],
         metadata: bool = True,
         extra_info: Optional[Dict] = None,
     ) -> List[Document]:
@@ -21,63 +69,112 @@ class PyMuPDFReader(BaseReader):
 
     def load(
         self,
-        file_path: Union[Path, str],
+        file_path: Union[Path, str, bytes, IO[bytes]],
         metadata: bool = True,
         extra_info: Optional[Dict] = None,
     ) -> List[Document]:
         """Loads list of documents from PDF file and also accepts extra information in dict format.
 
         Args:
-            file_path (Union[Path, str]): file path of PDF file (accepts string or Path).
+            file_path (Union[Path, str, bytes, IO[bytes]]): file path of PDF file (accepts string or Path), or its content.
             metadata (bool, optional): if metadata to be included or not. Defaults to True.
             extra_info (Optional[Dict], optional): extra information related to each document in dict format. Defaults to None.
 
         Raises:
             TypeError: if extra_info is not a dictionary.
-            TypeError: if file_path is not a string or Path.
+            TypeError: if file_path is not a string, Path, bytes or byte stream.
 
         Returns:
             List[Document]: list of documents.
         """
-        import fitz
+        return list(
+            self.lazy_load_data(file_path, metadata=metadata, extra_info=extra_info)
+        )
 
-        # check if file_path is a string or Path
-        if not isinstance(file_path, str) and not isinstance(file_path, Path):
-            raise TypeError("file_path must be a string or Path.")
+    def lazy_load_data(
+        self,
+        file_path: Union[Path, str, bytes, IO[bytes]],
+        metadata: bool = True,
+        extra_info: Optional[Dict] = None,
+        page_range: Optional[Tuple[int, int]] = None,
+    ) -> Iterator[Document]:
+        """Lazily loads documents from PDF file, one page at a time.
 
-        # open PDF file
-        doc = fitz.open(file_path)
+        Args:
+            file_path (Union[Path, str, bytes, IO[bytes]]): file path of PDF file (accepts string or Path), or its content.
+            metadata (bool, optional): if metadata to be included or not. Defaults to True.
+            extra_info (Optional[Dict], optional): extra information related to each document in dict format. Defaults to None.
+            page_range (Optional[Tuple[int, int]], optional): zero-based range of pages [start, end) to read. Defaults to all pages.
+
+        Raises:
+            TypeError: if extra_info is not a dictionary.
+            TypeError: if file_path is not a string, Path, bytes or byte stream.
+
+        Returns:
+            Iterator[Document]: iterator of page documents.
+        """
+        # read in-memory buffers, and check file_path is a string or Path otherwise
+        if isinstance(file_path, (bytes, bytearray)):
+            source: Union[str, bytes] = bytes(file_path)
+        elif hasattr(file_path, "read"):
+            source = file_path.read()  # type: ignore[union-attr]
+        elif isinstance(file_path, (str, Path)):
+            source = str(file_path)
+        else:
+            raise TypeError("file_path must be a string, Path, bytes or byte stream.")
 
         # if extra_info is not None, check if it is a dictionary
         if extra_info:
             if not isinstance(extra_info, dict):
                 raise TypeError("extra_info must be a dictionary.")
+        extra_info = dict(extra_info or {})
 
-        # if metadata is True, add metadata to each document
-        if metadata:
-            if not extra_info:
-                extra_info = {}
-            extra_info["total_pages"] = len(doc)
-            extra_info["file_path"] = str(file_path)
-
-            # return list of documents
-            return [
-                Document(
-                    text=page.get_text().encode("utf-8"),
-                    extra_info=dict(
-                        extra_info,
-                        **{
-                            "source": f"{page.number+1}",
-                        },
-                    ),
-                )
-                for page in doc
-            ]
+        # open PDF file
+        with _open(source) as doc:
+            num_pages = len(doc)
+            start, end = page_range or (0, num_pages)
+            start, end = max(start, 0), min(end, num_pages)
 
-        else:
-            return [
-                Document(
-                    text=page.get_text().encode("utf-8"), extra_info=extra_info or {}
+            # if metadata is True, add metadata to each document
+            if metadata:
+                extra_info["total_pages"] = num_pages
+                if isinstance(source, str):
+                    extra_info["file_path"] = source
+
+            if self.num_workers is not None and self.num_workers > 1:
+                pages = self._extract_pages_in_workers(source, start, end)
+            else:
+                pages = (
+                    (page.number, page.get_text()) for page in doc.pages(start, end)
                 )
-                for page in doc
-            ]
+
+            for page_number, text in pages:
+                if metadata:
+                    page_info = dict(extra_info, source=f"{page_number+1}")
+                else:
+                    page_info = extra_info
+                yield Document(text=text, extra_info=page_info)
+
+    def _extract_pages_in_workers(
+        self, source: Union[str, bytes], start: int, end: int
+    ) -> Iterator[Tuple[int, str]]:
+        """Extract pages [start, end) with a pool of worker processes, in order."""
+        assert self.num_workers is not None
+        pages_per_task = self.pages_per_task or max(
+            1, math.ceil((end - start) / (self.num_workers * 4))
+        )
+        tasks = [
+            (task_start, min(task_start + pages_per_task, end))
+            for task_start in range(start, end, pages_per_task)
+        ]
+        if not tasks:
+            return
+        # the PDF is handed to each worker once, at start-up, rather than
+        # with every task
+        with multiprocessing.Pool(
+            min(self.num_workers, len(tasks)),
+            initializer=_init_worker,
+            initargs=(source,),
+        ) as pool:
+            for pages in pool.imap(_extract_pages, tasks):
+                yield from pages
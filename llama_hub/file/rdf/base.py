@@ -1,18 +1,59 @@
 """Read RDF files."""
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
 
+@lru_cache(maxsize=None)
+def _load_vocabulary() -> Any:
+    """Parse the RDF and RDF Schema vocabularies once per process."""
+    from rdflib import Graph
+    from rdflib.namespace import RDF, RDFS
+
+    graph = Graph()
+    graph.parse(str(RDF))
+    graph.parse(str(RDFS))
+    return graph
+
+
+def _index_labels(graph: Any, lang: str) -> Dict[Any, Any]:
+    """Map each URI of a graph to its first label in `lang` or without language."""
+    from rdflib import Literal
+    from rdflib.namespace import RDFS
+
+    labels: Dict[Any, Any] = {}
+    for uri in set(graph.subjects(RDFS.label)):
+        # the first label of `objects()`, as `fetch_labels` would choose
+        for label in graph.objects(uri, RDFS.label):
+            if isinstance(label, Literal) and label.language in [lang, None]:
+                labels[uri] = label.value
+                break
+    return labels
+
+
+@lru_cache(maxsize=None)
+def _vocabulary_labels(lang: str) -> Dict[Any, Any]:
+    """Labels of the RDF and RDF Schema vocabularies, indexed once per language."""
+    return _index_labels(_load_vocabulary(), lang)
+
+
 class RDFReader(BaseReader):
-    """RDF reader."""
+    """RDF reader.
+
+    Args:
+        triples_per_document (Optional[int]): Number of triples put in each
+            document. All triples of a file go in a single document if None.
+
+    """
 
     def __init__(
         self,
         *args: Any,
+        triples_per_document: Optional[int] = None,
         **kwargs: Any,
     ) -> None:
         """Initialize loader."""
@@ -24,6 +65,7 @@ class RDFReader(BaseReader):
         self.Graph = Graph
         self.RDF = RDF
         self.RDFS = RDFS
+        self.triples_per_document = triples_per_document
 
     def fetch_labels(self, uri: Any, graph: Any, lang: str):
         """Fetch all labels of a URI by language."""
@@ -48,32 +90,54 @@ class RDFReader(BaseReader):
 
         raise Exception(f"Label not found for: {uri}")
 
-    def load_data(
+    def lazy_load_data(
         self, file: Path, extra_info: Optional[Dict] = None
-    ) -> List[Document]:
-        """Parse file."""
+    ) -> Iterator[Document]:
+        """Parse file, yielding documents of `triples_per_document` triples.
+
+        Labels are looked up in dictionaries built once per file and language,
+        rather than by scanning the graphs for every triple.
+        """
 
         lang = extra_info["lang"] if extra_info is not None else "en"
 
         self.g_local = self.Graph()
         self.g_local.parse(file)
 
-        self.g_global = self.Graph()
-        self.g_global.parse(str(self.RDF))
-        self.g_global.parse(str(self.RDFS))
+        # the vocabularies are parsed once and shared by all loads
+        self.g_global = _load_vocabulary()
 
-        text_list = []
+        local_labels = _index_labels(self.g_local, lang)
+        global_labels = _vocabulary_labels(lang)
+
+        def label(uri: Any) -> Any:
+            if uri in local_labels:
+                return local_labels[uri]
+            if uri in global_labels:
+                return global_labels[uri]
+            raise Exception(f"Label not found for: {uri}")
+
+        text_list: List[str] = []
 
         for s, p, o in self.g_local:
             if p == self.RDFS.label:
                 continue
-            triple = (
-                f"<{self.fetch_label_in_graphs(s, lang=lang)}> "
-                f"<{self.fetch_label_in_graphs(p, lang=lang)}> "
-                f"<{self.fetch_label_in_graphs(o, lang=lang)}>"
-            )
+            triple = f"<{label(s)}> <{label(p)}> <{label(o)}>"
             text_list.append(triple)
 
-        text = "\n".join(text_list)
+            if (
+                self.triples_per_document is not None
+                and len(text_list) >= self.triples_per_document
+            ):
+                yield Document(text="\n".join(text_list), extra_info=extra_info or {})
+                text_list = []
 
-        return [Document(text=text, extra_info=extra_info or {})]
+        if text_list or self.triples_per_document is None:
+            text = "\n".join(text_list)
+            yield Document(text=text, extra_info=extra_info or {})
+
+    def load_data(
+        self, file: Path, extra_info: Optional[Dict] = None
+    ) -> List[Document]:
+        """Parse file."""
+        return list(self.lazy_load_data(file, extra_info=extra_info))
@@ -1,6 +1,18 @@
 ## init
-from llama_hub.file.sdl.base import (
-    SDLReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.file.sdl.base import (
+        SDLReader,
+    )
 
 __all__ = ["SDLReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.file.sdl.base": ["SDLReader"],
+    },
+)
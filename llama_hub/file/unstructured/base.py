@@ -4,15 +4,69 @@ A parser for unstructured text files using Unstructured.io.
 Supports .txt, .docx, .pptx, .jpg, .png, .eml, .html, and .pdf documents.
 
 """
+import asyncio
+import multiprocessing
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+NLTK_RESOURCES = {
+    "punkt": "tokenizers/punkt",
+    "averaged_perceptron_tagger": "taggers/averaged_perceptron_tagger",
+}
+
+# Response statuses of the Unstructured API worth retrying.
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+@lru_cache(maxsize=None)
+def _check_nltk_resources() -> None:
+    """Check once per process that the NLTK data local partitioning needs exists.
+
+    The data is not downloaded at runtime.
+    """
+    import nltk
+
+    missing = []
+    for name, path in NLTK_RESOURCES.items():
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            missing.append(name)
+    if missing:
+        raise LookupError(
+            f"Missing NLTK data required by Unstructured.io: {', '.join(missing)}\n"
+            f"Please `python -m nltk.downloader {' '.join(missing)}` to use "
+            "UnstructuredReader without an API server"
+        )
+
+
+def _partition_locally(filename: str) -> List[Any]:
+    """Partition a file with Unstructured.io in the current process."""
+    from unstructured.partition.auto import partition
+
+    return partition(filename=filename)
+
 
 class UnstructuredReader(BaseReader):
-    """General unstructured text reader for a variety of files."""
+    """General unstructured text reader for a variety of files.
+
+    Keyword Args:
+        url (str): URL of an Unstructured API server. Files are parsed through
+            the API when set, and locally otherwise.
+        api (bool): Whether to parse files through the API.
+        api_key (str): Key for the Unstructured API.
+        max_concurrency (int): Maximum number of files sent to the API at the
+            same time by `aload_batch`. 8 by default.
+        max_retries (int): Number of times a failed API request is retried,
+            with exponential backoff. 3 by default.
+        num_workers (int): Number of processes partitioning files locally in
+            `load_batch`. Files are partitioned in the current process if 1.
+            1 by default.
+    """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Init params."""
@@ -32,44 +86,22 @@ class UnstructuredReader(BaseReader):
         if "api_key" in kwargs:
             self.api_key = kwargs["api_key"]
 
-        # Prerequisite for Unstructured.io to work
-        import nltk
+        self.max_concurrency = kwargs.get("max_concurrency", 8)
+        self.max_retries = kwargs.get("max_retries", 3)
+        self.num_workers = kwargs.get("num_workers", 1)
 
-        nltk.download("punkt")
-        nltk.download("averaged_perceptron_tagger")
+    @property
+    def _api_url(self) -> str:
+        return self.server_url + "/general/v0/general"
 
-    """ Loads data usin Unstructured.io py
-    
-        Depending on the constructin if url is set or api = True
-        it'll parse file using API call, else parse it locally
-        extra_info is extended by the returned metadata if 
-        split_documents is True
-        
-        Returns list of documents  
-    """
-
-    def load_data(
+    def _elements_to_documents(
         self,
+        elements: List[Any],
         file: Path,
         extra_info: Optional[Dict] = None,
         split_documents: Optional[bool] = False,
     ) -> List[Document]:
-        """If api is set, parse through api"""
-        if self.api:
-            from unstructured.partition.api import partition_via_api
-
-            elements = partition_via_api(
-                filename=str(file),
-                api_key=self.api_key,
-                api_url=self.server_url + "/general/v0/general",
-            )
-        else:
-            """Parse file locally"""
-            from unstructured.partition.auto import partition
-
-            elements = partition(filename=str(file))
-
-        """ Process elements """
+        """Process the elements Unstructured.io partitioned a file into."""
         docs = []
         if split_documents:
             for node in elements:
@@ -107,3 +139,147 @@ class UnstructuredReader(BaseReader):
             docs.append(Document(text="\n\n".join(text_chunks), extra_info=metadata))
 
         return docs
+
+    """ Loads data usin Unstructured.io py
+    
+        Depending on the constructin if url is set or api = True
+        it'll parse file using API call, else parse it locally
+        extra_info is extended by the returned metadata if 
+        split_documents is True
+        
+        Returns list of documents  
+    """
+
+    def load_data(
+        self,
+        file: Path,
+        extra_info: Optional[Dict] = None,
+        split_documents: Optional[bool] = False,
+    ) -> List[Document]:
+        """If api is set, parse through api"""
+        if self.api:
+            from unstructured.partition.api import partition_via_api
+
+            elements = partition_via_api(
+                filename=str(file),
+                api_key=self.api_key,
+                api_url=self._api_url,
+            )
+        else:
+            """Parse file locally"""
+            _check_nltk_resources()
+            elements = _partition_locally(str(file))
+
+        return self._elements_to_documents(elements, file, extra_info, split_documents)
+
+    async def _apartition_via_api(self, client: Any, file: Path) -> str:
+        """Send a file to the API, retrying failures, and return the JSON response."""
+        import httpx
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                with open(file, "rb") as f:
+                    content = f.read()
+                response = await client.post(
+                    self._api_url,
+                    headers={"unstructured-api-key": self.api_key},
+                    files={"files": (Path(file).name, content)},
+                )
+                if (
+                    response.status_code not in RETRY_STATUS_CODES
+                    or attempt == self.max_retries
+                ):
+                    response.raise_for_status()
+                    return response.text
+            except httpx.TransportError:
+                if attempt == self.max_retries:
+                    raise
+            await asyncio.sleep(0.5 * 2**attempt)
+        raise AssertionError("unreachable")
+
+    async def aload_batch(
+        self,
+        files: List[Path],
+        extra_infos: Optional[List[Optional[Dict]]] = None,
+        split_documents: Optional[bool] = False,
+    ) -> List[Document]:
+        """Parse files concurrently through the API server.
+
+        Up to `max_concurrency` files are sent at a time over a pool of
+        connections, and failed requests are retried.
+
+        Args:
+            files (List[Path]): The files to parse.
+            extra_infos (Optional[List[Optional[Dict]]]): Metadata of each file.
+            split_documents (Optional[bool]): Whether to create a document per
+                element.
+
+        Returns:
+            List[Document]: The documents of all files, in order.
+        """
+        import httpx
+        from unstructured.staging.base import elements_from_json
+
+        infos = extra_infos or [None] * len(files)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        limits = httpx.Limits(
+            max_connections=self.max_concurrency,
+            max_keepalive_connections=self.max_concurrency,
+        )
+
+        async with httpx.AsyncClient(limits=limits, timeout=None) as client:
+
+            async def parse(file: Path, extra_info: Optional[Dict]) -> List[Document]:
+                async with semaphore:
+                    response = await self._apartition_via_api(client, file)
+                elements = elements_from_json(text=response)
+                return self._elements_to_documents(
+                    elements, file, extra_info, split_documents
+                )
+
+            results = await asyncio.gather(
+                *(parse(file, info) for file, info in zip(files, infos))
+            )
+        return [doc for docs in results for doc in docs]
+
+    def load_batch(
+        self,
+        files: List[Path],
+        extra_infos: Optional[List[Optional[Dict]]] = None,
+        split_documents: Optional[bool] = False,
+    ) -> List[Document]:
+        """Parse many files, through the API server if set, else locally.
+
+        Without a server, files are partitioned by `num_workers` processes.
+
+        Args:
+            files (List[Path]): The files to parse.
+            extra_infos (Optional[List[Optional[Dict]]]): Metadata of each file.
+            split_documents (Optional[bool]): Whether to create a document per
+                element.
+
+        Returns:
+            List[Document]: The documents of all files, in order.
+        """
+        if self.api:
+            return asyncio.run(
+                self.aload_batch(
+                    files, extra_infos=extra_infos, split_documents=split_documents
+                )
+            )
+
+        _check_nltk_resources()
+        infos = extra_infos or [None] * len(files)
+        filenames = [str(file) for file in files]
+        if self.num_workers > 1 and len(files) > 1:
+            with multiprocessing.Pool(min(self.num_workers, len(files))) as pool:
+                partitions = pool.map(_partition_locally, filenames)
+        else:
+            partitions = [_partition_locally(filename) for filename in filenames]
+
+        docs = []
+        for file, info, elements in zip(files, infos, partitions):
+            docs.extend(
+                self._elements_to_documents(elements, file, info, split_documents)
+            )
+        return docs
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.file.xml.base import (
-    XMLReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.file.xml.base import (
+        XMLReader,
+    )
 
 __all__ = ["XMLReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.file.xml.base": ["XMLReader"],
+    },
+)
@@ -2,7 +2,7 @@
 
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
@@ -19,21 +19,73 @@ def _get_leaf_nodes_up_to_level(root: ET.Element, level: int) -> List[ET.Element
     Returns:
         List[ET.Element]: List of target nodes
     """
-
-    def traverse(current_node, current_level):
+    nodes = []
+    # iterative depth first traversal, so deep trees don't hit the recursion limit
+    stack = [(root, 0)]
+    while stack:
+        current_node, current_level = stack.pop()
         if len(current_node) == 0 or level == current_level:
             # Keep leaf nodes and target level nodes
             nodes.append(current_node)
         elif current_level < level:
             # Move to the next level
-            for child in current_node:
-                traverse(child, current_level + 1)
+            stack.extend((child, current_level + 1) for child in reversed(current_node))
 
-    nodes = []
-    traverse(root, 0)
     return nodes
 
 
+def _iter_leaf_nodes_up_to_level(file: Path, level: int) -> Iterator[ET.Element]:
+    """Stream the nodes `_get_leaf_nodes_up_to_level` would return from a file.
+
+    The file is read with `iterparse`, and each node is removed from the tree
+    once yielded, so that memory use stays bounded by the size of a node.
+
+    Args:
+        file (Path): Path to the XML file.
+        level (int): Levels to traverse in the tree
+
+    Returns:
+        Iterator[ET.Element]: Iterator of target nodes, valid until the next
+            one is requested.
+    """
+    # open elements, and whether each of them had children
+    stack: List[ET.Element] = []
+    has_children: List[bool] = []
+    # a node is only yielded at the next event, once its tail text is parsed
+    pending: Optional[Tuple[ET.Element, Optional[ET.Element]]] = None
+
+    for event, elem in ET.iterparse(file, events=("start", "end")):
+        if pending is not None:
+            node, parent = pending
+            yield node
+            node.clear()
+            if parent is not None:
+                parent.remove(node)
+            pending = None
+
+        if event == "start":
+            if has_children:
+                has_children[-1] = True
+            stack.append(elem)
+            has_children.append(False)
+        else:
+            current_level = len(stack) - 1
+            stack.pop()
+            is_leaf = not has_children.pop()
+            if current_level == level or (is_leaf and current_level < level):
+                pending = (elem, stack[-1] if stack else None)
+
+    if pending is not None:
+        yield pending[0]
+
+
+def _element_to_text(node: ET.Element) -> str:
+    """Serialize an XML element without the XML declaration."""
+    content = ET.tostring(node, encoding="utf8").decode("utf-8")
+    content = re.sub(r"^<\?xml.*", "", content)
+    return content.strip()
+
+
 class XMLReader(BaseReader):
     """XML reader.
 
@@ -65,31 +117,47 @@ class XMLReader(BaseReader):
         nodes = _get_leaf_nodes_up_to_level(root, self.tree_level_split)
         documents = []
         for node in nodes:
-            content = ET.tostring(node, encoding="utf8").decode("utf-8")
-            content = re.sub(r"^<\?xml.*", "", content)
-            content = content.strip()
+            content = _element_to_text(node)
             documents.append(Document(text=content, extra_info=extra_info or {}))
 
         return documents
 
-    def load_data(
+    def lazy_load_data(
         self,
         file: Path,
         extra_info: Optional[Dict] = None,
-    ) -> List[Document]:
-        """Load data from the input file.
+    ) -> Iterator[Document]:
+        """Lazily load data from the input file.
+
+        The file is parsed incrementally, yielding a document per node at
+        `tree_level_split` (or leaf above it) as soon as it has been read, so
+        that large files are never held in memory as a whole.
 
         Args:
             file (Path): Path to the input file.
             extra_info (Optional[Dict]): Additional information. Default is None.
 
         Returns:
-            List[Document]: List of documents.
+            Iterator[Document]: Iterator of documents.
         """
         if not isinstance(file, Path):
             file = Path(file)
 
-        tree = ET.parse(file)
-        documents = self._parse_xmlelt_to_document(tree.getroot(), extra_info)
+        for node in _iter_leaf_nodes_up_to_level(file, self.tree_level_split):
+            yield Document(text=_element_to_text(node), extra_info=extra_info or {})
 
-        return documents
+    def load_data(
+        self,
+        file: Path,
+        extra_info: Optional[Dict] = None,
+    ) -> List[Document]:
+        """Load data from the input file.
+
+        Args:
+            file (Path): Path to the input file.
+            extra_info (Optional[Dict]): Additional information. Default is None.
+
+        Returns:
+            List[Document]: List of documents.
+        """
+        return list(self.lazy_load_data(file, extra_info=extra_info))
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.firebase_realtimedb.base import (
-    FirebaseRealtimeDatabaseReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.firebase_realtimedb.base import (
+        FirebaseRealtimeDatabaseReader,
+    )
 
 __all__ = ["FirebaseRealtimeDatabaseReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.firebase_realtimedb.base": ["FirebaseRealtimeDatabaseReader"],
+    },
+)
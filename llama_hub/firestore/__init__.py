@@ -1,10 +1,15 @@
 """Init file."""
-from llama_hub.firestore.base import (
-    CLIENT_INFO,
-    DEFAULT_FIRESTORE_DATABASE,
-    FirestoreReader,
-    IMPORT_ERROR_MSG,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.firestore.base import (
+        CLIENT_INFO,
+        DEFAULT_FIRESTORE_DATABASE,
+        FirestoreReader,
+        IMPORT_ERROR_MSG,
+    )
 
 __all__ = [
     "CLIENT_INFO",
@@ -12,3 +17,15 @@ __all__ = [
     "FirestoreReader",
     "IMPORT_ERROR_MSG",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.firestore.base": [
+            "CLIENT_INFO",
+            "DEFAULT_FIRESTORE_DATABASE",
+            "FirestoreReader",
+            "IMPORT_ERROR_MSG",
+        ],
+    },
+)
@@ -1,32 +1,64 @@
 """Init file."""
-from llama_hub.github_repo.base import (
-    GithubRepositoryReader,
-)
-from llama_hub.github_repo.github_client import (
-    BaseGithubClient,
-    GitBlobResponseModel,
-    GitBranchResponseModel,
-    GitCommitResponseModel,
-    GitTreeResponseModel,
-    GithubClient,
-)
-from llama_hub.github_repo.utils import (
-    BufferedAsyncIterator,
-    BufferedGitBlobDataIterator,
-    get_file_extension,
-    print_if_verbose,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.github_repo.base import (
+        GithubRepositoryReader,
+    )
+    from llama_hub.github_repo.github_client import (
+        BaseGithubClient,
+        GitBlobResponseModel,
+        GitBranchResponseModel,
+        GitCommitResponseModel,
+        GitTreeResponseModel,
+        GithubClient,
+        RateLimitScheduler,
+    )
+    from llama_hub.github_repo.utils import (
+        BufferedAsyncIterator,
+        BufferedGitBlobDataIterator,
+        GitBlobCache,
+        get_file_extension,
+        print_if_verbose,
+    )
 
 __all__ = [
     "BaseGithubClient",
     "BufferedAsyncIterator",
     "BufferedGitBlobDataIterator",
+    "GitBlobCache",
     "GitBlobResponseModel",
     "GitBranchResponseModel",
     "GitCommitResponseModel",
     "GitTreeResponseModel",
     "GithubClient",
     "GithubRepositoryReader",
+    "RateLimitScheduler",
     "get_file_extension",
     "print_if_verbose",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.github_repo.base": ["GithubRepositoryReader"],
+        "llama_hub.github_repo.github_client": [
+            "BaseGithubClient",
+            "GitBlobResponseModel",
+            "GitBranchResponseModel",
+            "GitCommitResponseModel",
+            "GitTreeResponseModel",
+            "GithubClient",
+            "RateLimitScheduler",
+        ],
+        "llama_hub.github_repo.utils": [
+            "BufferedAsyncIterator",
+            "BufferedGitBlobDataIterator",
+            "GitBlobCache",
+            "get_file_extension",
+            "print_if_verbose",
+        ],
+    },
+)
@@ -8,17 +8,35 @@ the text extracted from the files using the parser.
 import asyncio
 import base64
 import binascii
+import collections
 import enum
+import io
 import logging
 import os
 import pathlib
 import tempfile
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import Executor
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.file.base import DEFAULT_FILE_READER_CLS
 from llama_index.readers.schema.base import Document
 
+from llama_hub.file.pdf.base import PDFReader
 from llama_hub.github_repo.github_client import (
     BaseGithubClient,
     GitBranchResponseModel,
@@ -28,12 +46,21 @@ from llama_hub.github_repo.github_client import (
 )
 from llama_hub.github_repo.utils import (
     BufferedGitBlobDataIterator,
+    GitBlobCache,
     get_file_extension,
     print_if_verbose,
 )
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Readers whose load_data accepts a binary file object, so that blobs can be
+# parsed straight from memory instead of through a temporary file.
+IN_MEMORY_FILE_READER_CLS: Dict[str, Type[BaseReader]] = {
+    ".pdf": PDFReader,
+}
+
 
 class GithubRepositoryReader(BaseReader):
     """
@@ -47,6 +74,10 @@ class GithubRepositoryReader(BaseReader):
         >>> reader = GithubRepositoryReader("owner", "repo")
         >>> branch_documents = reader.load_data(branch="branch")
         >>> commit_documents = reader.load_data(commit_sha="commit_sha")
+        >>> for document in reader.lazy_load_data(branch="branch"):
+        ...     print(document.extra_info)
+        >>> async for document in reader.alazy_load_data(branch="branch"):
+        ...     print(document.extra_info)
 
     """
 
@@ -75,6 +106,10 @@ class GithubRepositoryReader(BaseReader):
         timeout: Optional[int] = 5,
         filter_directories: Optional[Tuple[List[str], FilterType]] = None,
         filter_file_extensions: Optional[Tuple[List[str], FilterType]] = None,
+        recursive_tree_listing: bool = False,
+        blob_cache: Optional[GitBlobCache] = None,
+        parse_executor: Optional[Executor] = None,
+        buffer_size: Optional[int] = None,
     ):
         """
         Initialize params.
@@ -99,6 +134,20 @@ class GithubRepositoryReader(BaseReader):
                 FilterType is INCLUDE, only the files with the extensions in the list
                 will be included. If the FilterType is EXCLUDE, the files with the
                 extensions in the list will be excluded.
+            - recursive_tree_listing (bool): Whether to list the whole
+                repository tree with a single recursive getTree call instead of
+                one call per directory. Falls back to walking the tree when
+                Github truncates the listing. Requires a github client whose
+                get_tree accepts `recursive` (e.g. GithubClient).
+            - blob_cache (Optional[GitBlobCache]): Persistent cache of blob
+                contents (and parsed text) keyed by blob SHA. Cached blobs
+                are not downloaded again.
+            - parse_executor (Optional[Executor]): Executor in which files are
+                parsed when use_parser is True, so that parsing overlaps with
+                the blob downloads. Defaults to the event loop's default
+                executor.
+            - buffer_size (Optional[int]): Number of blobs fetched ahead of
+                the documents being yielded. Defaults to concurrent_requests.
 
         Raises:
             - `ValueError`: If the github_token is not provided and
@@ -114,19 +163,21 @@ class GithubRepositoryReader(BaseReader):
         self._timeout = timeout
         self._filter_directories = filter_directories
         self._filter_file_extensions = filter_file_extensions
+        self._recursive_tree_listing = recursive_tree_listing
+        self._blob_cache = blob_cache
+        self._parse_executor = parse_executor
+        self._buffer_size = buffer_size or concurrent_requests
 
-        # Set up the event loop
-        try:
-            self._loop = asyncio.get_running_loop()
-        except RuntimeError:
-            # If there is no running loop, create a new one
-            self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
+        # Event loop used by the synchronous API, created on first use so that
+        # the reader can be constructed inside a running event loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
         self._github_client = github_client
 
         self._file_readers: Dict[str, BaseReader] = {}
-        self._supported_suffix = list(DEFAULT_FILE_READER_CLS.keys())
+        self._supported_suffix = list(
+            {**DEFAULT_FILE_READER_CLS, **IN_MEMORY_FILE_READER_CLS}.keys()
+        )
 
     def _check_filter_directories(self, tree_obj_path: str) -> bool:
         """
@@ -216,55 +267,125 @@ class GithubRepositoryReader(BaseReader):
 
         return True
 
-    def _load_data_from_commit(self, commit_sha: str) -> List[Document]:
+    def _run(self, coroutine: Coroutine[Any, Any, T]) -> T:
         """
-        Load data from a commit.
+        Run a coroutine to completion on the reader's event loop.
 
-        Loads github repository data from a specific commit sha.
+        :param `coroutine`: coroutine to run
+        :return: result of the coroutine
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coroutine)
+
+    async def _get_tree_sha(
+        self,
+        commit_sha: Optional[str] = None,
+        branch: Optional[str] = None,
+    ) -> Tuple[str, str]:
+        """
+        Get the sha of the root tree of a commit or a branch.
 
         :param `commit`: commit sha
+        :param `branch`: branch name
 
-        :return: list of documents
+        :return: tuple of the tree sha and the commit sha or branch name
         """
-        commit_response: GitCommitResponseModel = self._loop.run_until_complete(
-            self._github_client.get_commit(
-                self._owner, self._repo, commit_sha, timeout=self._timeout
+        if commit_sha is not None and branch is not None:
+            raise ValueError("You can only specify one of commit or branch.")
+
+        if commit_sha is not None:
+            commit_response: GitCommitResponseModel = (
+                await self._github_client.get_commit(
+                    self._owner, self._repo, commit_sha, timeout=self._timeout
+                )
             )
-        )
+            return commit_response.commit.tree.sha, commit_sha
 
-        tree_sha = commit_response.commit.tree.sha
-        blobs_and_paths = self._loop.run_until_complete(self._recurse_tree(tree_sha))
+        if branch is not None:
+            branch_data: GitBranchResponseModel = await self._github_client.get_branch(
+                self._owner, self._repo, branch, timeout=self._timeout
+            )
+            return branch_data.commit.commit.tree.sha, branch
+
+        raise ValueError("You must specify one of commit or branch.")
+
+    async def alazy_load_data(
+        self,
+        commit_sha: Optional[str] = None,
+        branch: Optional[str] = None,
+    ) -> AsyncIterator[Document]:
+        """
+        Lazily load data from a commit or a branch.
+
+        Documents are yielded as their blobs are downloaded, so only the blobs
+        in the buffer are held in memory at once. Can be used from inside a
+        running event loop.
+
+        :param `commit`: commit sha
+        :param `branch`: branch name
+
+        :return: async iterator of documents
+        """
+        tree_sha, id = await self._get_tree_sha(commit_sha=commit_sha, branch=branch)
+        blobs_and_paths = await self._list_tree(tree_sha)
 
         print_if_verbose(self._verbose, f"got {len(blobs_and_paths)} blobs")
 
-        return self._loop.run_until_complete(
-            self._generate_documents(blobs_and_paths=blobs_and_paths, id=commit_sha)
-        )
+        async for document in self._agenerate_documents(
+            blobs_and_paths=blobs_and_paths, id=id
+        ):
+            yield document
 
-    def _load_data_from_branch(self, branch: str) -> List[Document]:
+    def lazy_load_data(
+        self,
+        commit_sha: Optional[str] = None,
+        branch: Optional[str] = None,
+    ) -> Iterator[Document]:
         """
-        Load data from a branch.
+        Lazily load data from a commit or a branch.
 
-        Loads github repository data from a specific branch.
+        Synchronous counterpart of alazy_load_data. Use alazy_load_data
+        instead when calling from inside a running event loop.
 
+        :param `commit`: commit sha
         :param `branch`: branch name
 
+        :return: iterator of documents
+        """
+        documents = self.alazy_load_data(commit_sha=commit_sha, branch=branch)
+        try:
+            while True:
+                try:
+                    yield self._run(documents.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._run(documents.aclose())
+
+    def _load_data_from_commit(self, commit_sha: str) -> List[Document]:
+        """
+        Load data from a commit.
+
+        Loads github repository data from a specific commit sha.
+
+        :param `commit`: commit sha
+
         :return: list of documents
         """
-        branch_data: GitBranchResponseModel = self._loop.run_until_complete(
-            self._github_client.get_branch(
-                self._owner, self._repo, branch, timeout=self._timeout
-            )
-        )
+        return list(self.lazy_load_data(commit_sha=commit_sha))
 
-        tree_sha = branch_data.commit.commit.tree.sha
-        blobs_and_paths = self._loop.run_until_complete(self._recurse_tree(tree_sha))
+    def _load_data_from_branch(self, branch: str) -> List[Document]:
+        """
+        Load data from a branch.
 
-        print_if_verbose(self._verbose, f"got {len(blobs_and_paths)} blobs")
+        Loads github repository data from a specific branch.
 
-        return self._loop.run_until_complete(
-            self._generate_documents(blobs_and_paths=blobs_and_paths, id=branch)
-        )
+        :param `branch`: branch name
+
+        :return: list of documents
+        """
+        return list(self.lazy_load_data(branch=branch))
 
     def load_data(
         self,
@@ -295,6 +416,74 @@ class GithubRepositoryReader(BaseReader):
 
         raise ValueError("You must specify one of commit or branch.")
 
+    async def _list_tree(
+        self, tree_sha: str
+    ) -> List[Tuple[GitTreeResponseModel.GitTreeObject, str]]:
+        """
+        Get all allowed blob tree objects in a tree with their full paths.
+
+        :param `tree_sha`: sha of the root tree
+        :return: list of tuples of
+            (tree object, file's full path realtive to the root of the repo)
+        """
+        if self._recursive_tree_listing:
+            blobs_and_paths = await self._list_tree_recursive(tree_sha)
+            if blobs_and_paths is not None:
+                return blobs_and_paths
+        return await self._recurse_tree(tree_sha)
+
+    async def _list_tree_recursive(
+        self, tree_sha: str
+    ) -> Optional[List[Tuple[GitTreeResponseModel.GitTreeObject, str]]]:
+        """
+        Get all allowed blob tree objects with a single recursive getTree call.
+
+        The listing is filtered locally: a blob is kept only if it and all of
+        its parent directories pass the directory and extension filters, just
+        as if the tree had been walked with _recurse_tree.
+
+        :param `tree_sha`: sha of the root tree
+        :return: list of tuples of
+            (tree object, file's full path realtive to the root of the repo),
+            or None if Github truncated the listing
+        """
+        tree_data: GitTreeResponseModel = await self._github_client.get_tree(
+            self._owner, self._repo, tree_sha, timeout=self._timeout, recursive=True
+        )
+        if tree_data.truncated:
+            print_if_verbose(
+                self._verbose,
+                f"recursive listing of tree {tree_sha} is truncated"
+                " - falling back to walking the tree",
+            )
+            return None
+
+        allowed_dirs: Dict[str, bool] = {"": True}
+
+        def allow_dir(dir_path: str) -> bool:
+            if dir_path not in allowed_dirs:
+                parent = dir_path.rpartition("/")[0]
+                allowed_dirs[dir_path] = allow_dir(parent) and self._allow_tree_obj(
+                    dir_path, "tree"
+                )
+            return allowed_dirs[dir_path]
+
+        blobs_and_full_paths: List[Tuple[GitTreeResponseModel.GitTreeObject, str]] = []
+        for tree_obj in tree_data.tree:
+            if tree_obj.type != "blob":
+                continue
+            parent = tree_obj.path.rpartition("/")[0]
+            if not allow_dir(parent) or not self._allow_tree_obj(
+                tree_obj.path, tree_obj.type
+            ):
+                print_if_verbose(
+                    self._verbose, f"ignoring {tree_obj.path} due to filter"
+                )
+                continue
+            blobs_and_full_paths.append((tree_obj, tree_obj.path))
+
+        return blobs_and_full_paths
+
     async def _recurse_tree(
         self,
         tree_sha: str,
@@ -386,17 +575,95 @@ class GithubRepositoryReader(BaseReader):
         :param `id`: the branch name or commit sha used when loading the repo
         :return: list of documents
         """
+        return [
+            document
+            async for document in self._agenerate_documents(
+                blobs_and_paths=blobs_and_paths, id=id
+            )
+        ]
+
+    async def _agenerate_documents(
+        self,
+        blobs_and_paths: List[Tuple[GitTreeResponseModel.GitTreeObject, str]],
+        id: str = "",
+    ) -> AsyncIterator[Document]:
+        """
+        Generate documents from a list of blobs and their full paths.
+
+        Documents are yielded in order as their blobs arrive. Each document is
+        created in its own task, so that parsing runs in the executor while
+        the next blobs are downloaded; at most buffer_size documents are
+        pending at once.
+
+        :param `blobs_and_paths`: list of tuples of
+            (tree object, file's full path in the repo realtive to the root of the repo)
+        :param `id`: the branch name or commit sha used when loading the repo
+        :return: async iterator of documents
+        """
+        pending: Deque["asyncio.Future[Optional[Document]]"] = collections.deque()
+        try:
+            async for blob_sha, decoded_bytes, full_path in self._aiter_blobs(
+                blobs_and_paths
+            ):
+                pending.append(
+                    asyncio.ensure_future(
+                        self._create_document(blob_sha, decoded_bytes, full_path, id)
+                    )
+                )
+                while pending and (
+                    pending[0].done() or len(pending) > self._buffer_size
+                ):
+                    document = await pending.popleft()
+                    if document is not None:
+                        yield document
+
+            while pending:
+                document = await pending.popleft()
+                if document is not None:
+                    yield document
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _aiter_blobs(
+        self,
+        blobs_and_paths: List[Tuple[GitTreeResponseModel.GitTreeObject, str]],
+    ) -> AsyncIterator[Tuple[str, bytes, str]]:
+        """
+        Iterate over the decoded contents of blobs.
+
+        Blobs found in the blob cache are yielded first, the others are then
+        downloaded buffer_size at a time.
+
+        :param `blobs_and_paths`: list of tuples of
+            (tree object, file's full path in the repo realtive to the root of the repo)
+        :return: async iterator of tuples of (blob sha, decoded content, full path)
+        """
+        loop = asyncio.get_running_loop()
+        blobs_to_fetch = []
+        for blob, full_path in blobs_and_paths:
+            cached_bytes = (
+                await loop.run_in_executor(None, self._blob_cache.get, blob.sha)
+                if self._blob_cache is not None
+                else None
+            )
+            if cached_bytes is None:
+                blobs_to_fetch.append((blob, full_path))
+                continue
+            print_if_verbose(self._verbose, f"using cached blob for {full_path}")
+            yield blob.sha, cached_bytes, full_path
+
         buffered_iterator = BufferedGitBlobDataIterator(
-            blobs_and_paths=blobs_and_paths,
+            blobs_and_paths=blobs_to_fetch,
             github_client=self._github_client,
             owner=self._owner,
             repo=self._repo,
-            loop=self._loop,
-            buffer_size=self._concurrent_requests,  # TODO: make this configurable
+            loop=loop,
+            buffer_size=self._buffer_size,
             verbose=self._verbose,
+            concurrent_requests=self._concurrent_requests,
         )
 
-        documents = []
         async for blob_data, full_path in buffered_iterator:
             print_if_verbose(self._verbose, f"generating document for {full_path}")
             assert (
@@ -412,50 +679,70 @@ class GithubRepositoryReader(BaseReader):
                 )
                 continue
 
-            if self._use_parser:
-                document = self._parse_supported_file(
+            if self._blob_cache is not None:
+                await loop.run_in_executor(
+                    None, self._blob_cache.put, blob_data.sha, decoded_bytes
+                )
+
+            yield blob_data.sha, decoded_bytes, full_path
+
+    async def _create_document(
+        self,
+        sha: str,
+        decoded_bytes: bytes,
+        full_path: str,
+        id: str,
+    ) -> Optional[Document]:
+        """
+        Create a document from the decoded content of a blob.
+
+        :param `sha`: sha of the blob
+        :param `decoded_bytes`: decoded content of the blob
+        :param `full_path`: file's full path in the repo
+        :param `id`: the branch name or commit sha used when loading the repo
+        :return: Document, or None if the content could not be decoded
+        """
+        if self._use_parser and get_file_extension(full_path) in self._supported_suffix:
+            document = await asyncio.get_running_loop().run_in_executor(
+                self._parse_executor,
+                partial(
+                    self._parse_supported_file,
                     file_path=full_path,
                     file_content=decoded_bytes,
-                    tree_sha=blob_data.sha,
+                    tree_sha=sha,
                     tree_path=full_path,
-                )
-                if document is not None:
-                    documents.append(document)
-                    continue
-                print_if_verbose(
-                    self._verbose,
-                    f"could not parse {full_path} as a supported file type"
-                    + " - falling back to decoding as utf-8 raw text",
-                )
-
-            try:
-                if decoded_bytes is None:
-                    raise ValueError("decoded_bytes is None")
-                decoded_text = decoded_bytes.decode("utf-8")
-            except UnicodeDecodeError:
-                print_if_verbose(
-                    self._verbose, f"could not decode {full_path} as utf-8"
-                )
-                continue
+                ),
+            )
+            if document is not None:
+                return document
             print_if_verbose(
                 self._verbose,
-                f"got {len(decoded_text)} characters"
-                + f"- adding to documents - {full_path}",
-            )
-            url = os.path.join(
-                "https://github.com/", self._owner, self._repo, "blob/", id, full_path
-            )
-            document = Document(
-                text=decoded_text,
-                doc_id=blob_data.sha,
-                extra_info={
-                    "file_path": full_path,
-                    "file_name": full_path.split("/")[-1],
-                    "url": url,
-                },
+                f"could not parse {full_path} as a supported file type"
+                + " - falling back to decoding as utf-8 raw text",
             )
-            documents.append(document)
-        return documents
+
+        try:
+            decoded_text = decoded_bytes.decode("utf-8")
+        except UnicodeDecodeError:
+            print_if_verbose(self._verbose, f"could not decode {full_path} as utf-8")
+            return None
+        print_if_verbose(
+            self._verbose,
+            f"got {len(decoded_text)} characters"
+            + f"- adding to documents - {full_path}",
+        )
+        url = os.path.join(
+            "https://github.com/", self._owner, self._repo, "blob/", id, full_path
+        )
+        return Document(
+            text=decoded_text,
+            doc_id=sha,
+            extra_info={
+                "file_path": full_path,
+                "file_name": full_path.split("/")[-1],
+                "url": url,
+            },
+        )
 
     def _parse_supported_file(
         self,
@@ -478,49 +765,19 @@ class GithubRepositoryReader(BaseReader):
 
         if file_extension not in self._file_readers:
             # initialize reader
-            cls_ = DEFAULT_FILE_READER_CLS[file_extension]
-            self._file_readers[file_extension] = cls_()
+            cls_ = IN_MEMORY_FILE_READER_CLS.get(
+                file_extension, DEFAULT_FILE_READER_CLS.get(file_extension)
+            )
+            self._file_readers.setdefault(file_extension, cls_())
 
         reader = self._file_readers[file_extension]
 
-        print_if_verbose(
-            self._verbose,
-            f"parsing {file_path}"
-            + f"as {file_extension} with "
-            + f"{reader.__class__.__name__}",
-        )
-        with tempfile.TemporaryDirectory() as tmpdirname:
-            with tempfile.NamedTemporaryFile(
-                dir=tmpdirname,
-                suffix=f".{file_extension}",
-                mode="w+b",
-                delete=False,
-            ) as tmpfile:
-                print_if_verbose(
-                    self._verbose,
-                    "created a temporary file"
-                    + f"{tmpfile.name} for parsing {file_path}",
-                )
-                tmpfile.write(file_content)
-                tmpfile.flush()
-                tmpfile.close()
-                try:
-                    docs = reader.load_data(pathlib.Path(tmpfile.name))
-                    parsed_file = "\n\n".join([doc.get_text() for doc in docs])
-                except Exception as e:
-                    print_if_verbose(self._verbose, f"error while parsing {file_path}")
-                    logger.error(
-                        "Error while parsing "
-                        + f"{file_path} with "
-                        + f"{reader.__class__.__name__}:\n{e}"
-                    )
-                    parsed_file = None
-                finally:
-                    os.remove(tmpfile.name)
-                if parsed_file is None:
-                    return None
+        if self._blob_cache is not None:
+            cached_text = self._blob_cache.get_text(tree_sha)
+            if cached_text is not None:
+                print_if_verbose(self._verbose, f"using cached text for {file_path}")
                 return Document(
-                    text=parsed_file,
+                    text=cached_text,
                     doc_id=tree_sha,
                     extra_info={
                         "file_path": file_path,
@@ -528,6 +785,65 @@ class GithubRepositoryReader(BaseReader):
                     },
                 )
 
+        print_if_verbose(
+            self._verbose,
+            f"parsing {file_path}"
+            + f"as {file_extension} with "
+            + f"{reader.__class__.__name__}",
+        )
+        try:
+            if isinstance(reader, tuple(IN_MEMORY_FILE_READER_CLS.values())):
+                docs = reader.load_data(io.BytesIO(file_content))
+            else:
+                docs = self._load_data_from_temporary_file(
+                    reader, file_content, file_extension
+                )
+            parsed_file = "\n\n".join([doc.get_text() for doc in docs])
+        except Exception as e:
+            print_if_verbose(self._verbose, f"error while parsing {file_path}")
+            logger.error(
+                "Error while parsing "
+                + f"{file_path} with "
+                + f"{reader.__class__.__name__}:\n{e}"
+            )
+            return None
+
+        if self._blob_cache is not None:
+            self._blob_cache.put_text(tree_sha, parsed_file)
+        return Document(
+            text=parsed_file,
+            doc_id=tree_sha,
+            extra_info={
+                "file_path": file_path,
+                "file_name": tree_path,
+            },
+        )
+
+    def _load_data_from_temporary_file(
+        self,
+        reader: BaseReader,
+        file_content: bytes,
+        file_extension: str,
+    ) -> List[Document]:
+        """
+        Load data with a reader that only accepts file paths.
+
+        :param `reader`: reader to load the data with
+        :param `file_content`: content of the file
+        :param `file_extension`: extension of the file, e.g. '.docx'
+        :return: documents loaded by the reader
+        """
+        with tempfile.NamedTemporaryFile(
+            suffix=file_extension,
+            mode="w+b",
+            delete=False,
+        ) as tmpfile:
+            tmpfile.write(file_content)
+        try:
+            return reader.load_data(pathlib.Path(tmpfile.name))
+        finally:
+            os.remove(tmpfile.name)
+
 
 if __name__ == "__main__":
     import time
@@ -5,10 +5,13 @@ This module contains the Github API client for the GPT-Index library.
 It is used by the Github readers to retrieve the data from Github.
 """
 
+import asyncio
 import os
+import threading
+import time
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol
 
 from dataclasses_json import DataClassJsonMixin
 
@@ -197,6 +200,141 @@ class BaseGithubClient(Protocol):
         ...
 
 
+class RateLimitScheduler:
+    """
+    Adaptive scheduler for Github API requests.
+
+    Every request made by a GithubClient is run through the scheduler, which
+    reads Github's rate limit headers from the responses:
+
+    - when `X-RateLimit-Remaining` reaches 0, new requests are held back
+      until the time given by `X-RateLimit-Reset`;
+    - when a request is rejected with 403 or 429 because of a (primary or
+      secondary) rate limit, all requests are paused for `Retry-After`
+      seconds (or until the reset time) and the request is retried.
+
+    Examples:
+        >>> scheduler = RateLimitScheduler(max_concurrency=10, max_retries=5)
+        >>> client = GithubClient("my_github_token", rate_limit_scheduler=scheduler)
+    """
+
+    RATE_LIMITED_STATUS_CODES = (403, 429)
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        max_retries: int = 3,
+        max_wait: float = 60 * 60,
+        verbose: bool = False,
+    ) -> None:
+        """
+        Initialize params.
+
+        Args:
+            - max_concurrency (int or None): Maximum number of requests in
+                flight at once. Unbounded if None (defaults to None).
+            - max_retries (int): Number of times a rate limited request is
+                retried before its response is returned (defaults to 3).
+            - max_wait (float): Upper bound in seconds for a single pause
+                (defaults to one hour).
+            - verbose (bool): Whether to print verbose messages.
+        """
+        self._max_concurrency = max_concurrency
+        self._max_retries = max_retries
+        self._max_wait = max_wait
+        self._verbose = verbose
+        self._resume_at = 0.0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> Optional[asyncio.Semaphore]:
+        """Get the concurrency semaphore bound to the running loop."""
+        if self._max_concurrency is None:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def _pause(self, seconds: float) -> None:
+        """Hold back all requests for the given number of seconds."""
+        seconds = max(0.0, min(seconds, self._max_wait))
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+        if self._verbose:
+            print(f"Github rate limit hit, pausing requests for {seconds:.1f}s")
+
+    def _seconds_until_reset(self, response: Any) -> Optional[float]:
+        """Get the seconds until the rate limit window resets, if known."""
+        reset = response.headers.get("X-RateLimit-Reset")
+        if reset is None:
+            return None
+        try:
+            return float(reset) - time.time()
+        except ValueError:
+            return None
+
+    def update(self, response: Any) -> Optional[float]:
+        """
+        Update the schedule from the rate limit headers of a response.
+
+        Returns:
+            - `wait (float or None)`: Seconds to wait before retrying the
+                request if it was rate limited, None otherwise.
+        """
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        exhausted = remaining is not None and remaining.strip() == "0"
+        until_reset = self._seconds_until_reset(response)
+        if exhausted and until_reset is not None:
+            self._pause(until_reset)
+
+        if response.status_code not in self.RATE_LIMITED_STATUS_CODES:
+            return None
+
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                wait = float(retry_after)
+            except ValueError:
+                wait = 60.0
+        elif exhausted:
+            wait = until_reset if until_reset is not None else 60.0
+        else:
+            # a 403 that is not caused by rate limiting
+            return None
+
+        self._pause(wait)
+        return wait
+
+    async def run(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a request, pausing and retrying it while it is rate limited.
+
+        Args:
+            - `send (Callable[[], Awaitable[httpx.Response]])`: Function
+                sending the request.
+
+        Returns:
+            - `response (httpx.Response)`: The last response received.
+        """
+        attempt = 0
+        while True:
+            delay = self._resume_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            semaphore = self._get_semaphore()
+            if semaphore is None:
+                response = await send()
+            else:
+                async with semaphore:
+                    response = await send()
+
+            if self.update(response) is None or attempt >= self._max_retries:
+                return response
+            attempt += 1
+
+
 class GithubClient:
     """
     An asynchronous client for interacting with the Github API.
@@ -207,9 +345,17 @@ class GithubClient:
     which can be passed as an argument or set as an environment variable.
     If no Github token is provided, the client will raise a ValueError.
 
+    All requests go through a single pooled `httpx.AsyncClient`, so
+    connections (and their TLS sessions) are kept alive and reused across
+    tree, blob, commit and branch calls. Call `aclose()` or use the client
+    as an async context manager to release the pooled connections, before
+    the event loop they were used on is closed.
+
     Examples:
         >>> client = GithubClient("my_github_token")
         >>> branch_info = client.get_branch("owner", "repo", "branch")
+        >>> async with GithubClient("my_github_token", http2=True) as client:
+        ...     tree_info = await client.get_tree("owner", "repo", "tree_sha")
     """
 
     DEFAULT_BASE_URL = "https://api.github.com"
@@ -221,6 +367,11 @@ class GithubClient:
         base_url: str = DEFAULT_BASE_URL,
         api_version: str = DEFAULT_API_VERSION,
         verbose: bool = False,
+        max_connections: Optional[int] = 20,
+        max_keepalive_connections: Optional[int] = 10,
+        keepalive_expiry: Optional[float] = 30.0,
+        http2: bool = False,
+        rate_limit_scheduler: Optional[RateLimitScheduler] = None,
     ) -> None:
         """
         Initialize the GithubClient.
@@ -232,6 +383,17 @@ class GithubClient:
             - base_url (str): Base URL for the Github API
                 (defaults to "https://api.github.com").
             - api_version (str): Github API version (defaults to "2022-11-28").
+            - max_connections (int or None): Maximum number of concurrent
+                connections in the pool (defaults to 20).
+            - max_keepalive_connections (int or None): Maximum number of idle
+                connections kept alive in the pool (defaults to 10).
+            - keepalive_expiry (float or None): Seconds an idle connection is
+                kept alive (defaults to 30).
+            - http2 (bool): Whether to use HTTP/2. Requires the `h2` package,
+                e.g. `pip install httpx[http2]` (defaults to False).
+            - rate_limit_scheduler (RateLimitScheduler or None): Scheduler
+                that all requests go through. A RateLimitScheduler with
+                default settings is used if not provided.
 
         Raises:
             ValueError: If no Github token is provided.
@@ -262,6 +424,86 @@ class GithubClient:
             "X-GitHub-Api-Version": f"{self._api_version}",
         }
 
+        self._max_connections = max_connections
+        self._max_keepalive_connections = max_keepalive_connections
+        self._keepalive_expiry = keepalive_expiry
+        self._http2 = http2
+        self._rate_limit_scheduler = rate_limit_scheduler or RateLimitScheduler(
+            verbose=verbose
+        )
+
+        self._client: Any = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self) -> "GithubClient":
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the pooled connections when leaving the context manager."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying pooled HTTP client and its connections."""
+        client, self._client, self._client_loop = self._client, None, None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+    def _get_client(self) -> Any:
+        """
+        Get the pooled `httpx.AsyncClient`, creating it on first use.
+
+        Pooled connections are bound to the event loop they were opened on,
+        so a new client is created when called from a different loop, after
+        closing the previous one on its own loop.
+
+        Raises:
+            - ImportError: If the `httpx` library is not installed.
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "Please install httpx to use the GithubRepositoryReader. "
+                "You can do so by running `pip install httpx`."
+            )
+
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            self._close_client_of_other_loop()
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers=self._headers,
+                base_url=self._base_url,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_keepalive_connections,
+                    keepalive_expiry=self._keepalive_expiry,
+                ),
+                http2=self._http2,
+            )
+            self._client_loop = loop
+        return self._client
+
+    def _close_client_of_other_loop(self) -> None:
+        """Close the pooled client opened on another event loop, on that loop."""
+        client, loop = self._client, self._client_loop
+        self._client, self._client_loop = None, None
+        if client.is_closed or loop is None or loop.is_closed():
+            # the connections of a closed loop can no longer be closed, which
+            # `aclose()` avoids when called before the loop is closed
+            return
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        else:
+            # the current thread is running another loop, so the idle loop the
+            # client belongs to is run on a separate thread
+            thread = threading.Thread(
+                target=loop.run_until_complete, args=(client.aclose(),)
+            )
+            thread.start()
+            thread.join()
+
     def get_all_endpoints(self) -> Dict[str, str]:
         """Get all available endpoints."""
         return {**self._endpoints}
@@ -272,6 +514,7 @@ class GithubClient:
         method: str,
         headers: Dict[str, Any] = {},
         timeout: Optional[int] = 5,
+        params: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
     ) -> Any:
         """
@@ -279,12 +522,15 @@ class GithubClient:
 
         This method is used for making API requests to the Github API.
         It is used internally by the other methods in the client.
+        Requests are run through the client's RateLimitScheduler, so
+        rate limited requests are paused and retried instead of failing.
 
         Args:
             - `endpoint (str)`: Name of the endpoint to make the request to.
             - `method (str)`: HTTP method to use for the request.
             - `headers (dict)`: HTTP headers to include in the request.
             - `timeout (int or None)`: Timeout for the request in seconds. Default is 5.
+            - `params (dict or None)`: Query parameters of the request.
             - `**kwargs`: Keyword arguments to pass to the endpoint URL.
 
         Returns:
@@ -299,30 +545,24 @@ class GithubClient:
                                 owner="owner", repo="repo",
                                 tree_sha="tree_sha", timeout=5)
         """
-        try:
-            import httpx
-        except ImportError:
-            raise ImportError(
-                "Please install httpx to use the GithubRepositoryReader. "
-                "You can do so by running `pip install httpx`."
-            )
+        _client = self._get_client()
 
-        _headers = {**self._headers, **headers}
+        import httpx
 
-        _client: httpx.AsyncClient
-        async with httpx.AsyncClient(
-            headers=_headers,
-            base_url=self._base_url,
-            timeout=timeout,
-        ) as _client:
-            try:
-                response = await _client.request(
-                    method, url=self._endpoints[endpoint].format(**kwargs)
+        try:
+            response = await self._rate_limit_scheduler.run(
+                lambda: _client.request(
+                    method,
+                    url=self._endpoints[endpoint].format(**kwargs),
+                    headers=headers,
+                    params=params,
+                    timeout=timeout,
                 )
-            except httpx.HTTPError as excp:
-                print(f"HTTP Exception for {excp.request.url} - {excp}")
-                raise excp
-            return response
+            )
+        except httpx.HTTPError as excp:
+            print(f"HTTP Exception for {excp.request.url} - {excp}")
+            raise excp
+        return response
 
     async def get_branch(
         self,
@@ -370,6 +610,7 @@ class GithubClient:
         repo: str,
         tree_sha: str,
         timeout: Optional[int] = 5,
+        recursive: bool = False,
     ) -> GitTreeResponseModel:
         """
         Get information about a tree. (Github API endpoint: getTree).
@@ -379,6 +620,10 @@ class GithubClient:
             - `repo (str)`: Name of the repository.
             - `tree_sha (str)`: SHA of the tree.
             - `timeout (int or None)`: Timeout for the request in seconds. Default is 5.
+            - `recursive (bool)`: Whether to list the whole tree, including
+                the objects of all subtrees, in one call. The listing is
+                truncated by Github for very large trees, see
+                `GitTreeResponseModel.truncated`. Default is False.
 
         Returns:
             - `tree_info (GitTreeResponseModel)`: Information about the tree.
@@ -395,6 +640,7 @@ class GithubClient:
                     repo=repo,
                     tree_sha=tree_sha,
                     timeout=timeout,
+                    params={"recursive": 1} if recursive else None,
                 )
             ).text
         )
@@ -471,7 +717,6 @@ class GithubClient:
 
 
 if __name__ == "__main__":
-    import asyncio
 
     async def main() -> None:
         """Test the GithubClient."""
@@ -488,5 +733,6 @@ if __name__ == "__main__":
                     owner="ahmetkca", repo="CommitAI", file_sha=obj.sha
                 )
                 print(blob_response.content)
+        await client.aclose()
 
     asyncio.run(main())
@@ -5,10 +5,12 @@ This module contains utility functions for the Github readers.
 """
 import asyncio
 import os
+import sqlite3
 import sys
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 if "pytest" in sys.modules:
     from llama_hub.github_repo.github_client import (
@@ -112,6 +114,7 @@ class BufferedGitBlobDataIterator(BufferedAsyncIterator):
         loop: asyncio.AbstractEventLoop,
         buffer_size: int,
         verbose: bool = False,
+        concurrent_requests: Optional[int] = None,
     ):
         """
         Initialize params.
@@ -124,6 +127,9 @@ class BufferedGitBlobDataIterator(BufferedAsyncIterator):
             - repo (str): Name of the repository.
             - loop (asyncio.AbstractEventLoop): Event loop.
             - buffer_size (int): Size of the buffer.
+            - concurrent_requests (Optional[int]): Maximum number of get_blob
+                requests in flight while filling the buffer.
+                Defaults to buffer_size.
         """
         super().__init__(buffer_size)
         self._blobs_and_paths = blobs_and_paths
@@ -131,6 +137,7 @@ class BufferedGitBlobDataIterator(BufferedAsyncIterator):
         self._owner = owner
         self._repo = repo
         self._verbose = verbose
+        self._concurrent_requests = concurrent_requests or buffer_size
         if loop is None:
             loop = asyncio.get_event_loop()
             if loop is None:
@@ -153,13 +160,14 @@ class BufferedGitBlobDataIterator(BufferedAsyncIterator):
 
         if self._verbose:
             start_t = time.time()
+        semaphore = asyncio.Semaphore(self._concurrent_requests)
+
+        async def get_blob(sha: str) -> GitBlobResponseModel:
+            async with semaphore:
+                return await self._github_client.get_blob(self._owner, self._repo, sha)
+
         results: List[GitBlobResponseModel] = await asyncio.gather(
-            *[
-                self._github_client.get_blob(self._owner, self._repo, blob.sha)
-                for blob, _ in self._blobs_and_paths[
-                    start:end
-                ]  # TODO: use batch_size instead of buffer_size for concurrent requests
-            ]
+            *[get_blob(blob.sha) for blob, _ in self._blobs_and_paths[start:end]]
         )
         if self._verbose:
             end_t = time.time()
@@ -176,3 +184,169 @@ class BufferedGitBlobDataIterator(BufferedAsyncIterator):
             (result, path)
             for result, (_, path) in zip(results, self._blobs_and_paths[start:end])
         ]
+
+
+class GitBlobCache:
+    """
+    Persistent cache of Git blob contents keyed by blob SHA.
+
+    Git blobs are content-addressed, so a blob with a given SHA never
+    changes and can be reused across loads, branches and commits. The cache
+    is a single sqlite database holding the decoded bytes of each blob and,
+    optionally, the text extracted from it by a parser.
+
+    When the cache grows beyond `max_size_bytes`, the least recently used
+    blobs are evicted. Reads are recorded in memory and written with the
+    next write, every `access_batch_size` reads, or when the cache is closed,
+    so that reading a blob does not commit a transaction.
+
+    Examples:
+        >>> cache = GitBlobCache("~/.cache/llama_hub/github_blobs.sqlite3")
+        >>> reader = GithubRepositoryReader(client, "owner", "repo", blob_cache=cache)
+    """
+
+    def __init__(
+        self,
+        cache_path: str,
+        max_size_bytes: Optional[int] = 1024 * 1024 * 1024,
+        access_batch_size: int = 1000,
+    ):
+        """
+        Initialize params.
+
+        Args:
+            - cache_path (str): Path of the sqlite database file.
+                It is created if it does not exist.
+            - max_size_bytes (Optional[int]): Maximum total size of the cached
+                contents. Unbounded if None. Defaults to 1 GiB.
+            - access_batch_size (int): Number of reads recorded in memory
+                before their access times are written. Defaults to 1000.
+        """
+        cache_path = os.path.expanduser(cache_path)
+        cache_dir = os.path.dirname(cache_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        self._max_size_bytes = max_size_bytes
+        self._access_batch_size = access_batch_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(cache_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS blobs ("
+                "sha TEXT PRIMARY KEY, "
+                "content BLOB NOT NULL, "
+                "text TEXT, "
+                "size INTEGER NOT NULL, "
+                "last_access REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS blobs_last_access ON blobs (last_access)"
+            )
+        # last access of the blobs read since the last write
+        self._accessed: Dict[str, float] = {}
+        # total size of the cached contents, kept up to date by the writes
+        self._size: int = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM blobs"
+        ).fetchone()[0]
+
+    def _get_column(self, sha: str, column: str) -> Optional[Any]:
+        """Get a column of a cached blob and mark the blob as recently used."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {column} FROM blobs WHERE sha = ?", (sha,)
+            ).fetchone()
+            if row is None or row[0] is None:
+                return None
+            self._accessed[sha] = time.time()
+            if len(self._accessed) >= self._access_batch_size:
+                with self._conn:
+                    self._write_accesses()
+            return row[0]
+
+    def _row_size(self, sha: str) -> int:
+        row = self._conn.execute(
+            "SELECT size FROM blobs WHERE sha = ?", (sha,)
+        ).fetchone()
+        return row[0] if row is not None else 0
+
+    def _write_accesses(self) -> None:
+        """Write the last access of the blobs read since the last write."""
+        self._conn.executemany(
+            "UPDATE blobs SET last_access = ? WHERE sha = ?",
+            [(last_access, sha) for sha, last_access in self._accessed.items()],
+        )
+        self._accessed.clear()
+
+    def get(self, sha: str) -> Optional[bytes]:
+        """Get the decoded content of a blob, or None if it is not cached."""
+        content = self._get_column(sha, "content")
+        return bytes(content) if content is not None else None
+
+    def get_text(self, sha: str) -> Optional[str]:
+        """Get the parsed text of a blob, or None if it is not cached."""
+        return self._get_column(sha, "text")
+
+    def put(self, sha: str, content: bytes) -> None:
+        """Cache the decoded content of a blob."""
+        with self._lock, self._conn:
+            if not self._row_size(sha):
+                # the content of a blob never changes, nor its size
+                self._size += len(content)
+            self._accessed.pop(sha, None)
+            self._conn.execute(
+                "INSERT INTO blobs (sha, content, size, last_access) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT (sha) DO UPDATE SET "
+                "content = excluded.content, last_access = excluded.last_access",
+                (sha, content, len(content), time.time()),
+            )
+            self._evict()
+
+    def put_text(self, sha: str, text: str) -> None:
+        """Cache the parsed text of a blob whose content is already cached."""
+        with self._lock, self._conn:
+            self._size -= self._row_size(sha)
+            self._accessed.pop(sha, None)
+            self._conn.execute(
+                "UPDATE blobs SET text = ?, size = length(content) + ?, "
+                "last_access = ? WHERE sha = ?",
+                (text, len(text.encode("utf-8")), time.time(), sha),
+            )
+            self._size += self._row_size(sha)
+            self._evict()
+
+    def size(self) -> int:
+        """Get the total size in bytes of the cached contents."""
+        with self._lock:
+            return self._size
+
+    def __len__(self) -> int:
+        """Get the number of cached blobs."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+
+    def _evict(self) -> None:
+        """Evict least recently used blobs until the size limit is met.
+
+        Also writes the pending accesses, in the transaction of the write.
+        """
+        self._write_accesses()
+        if self._max_size_bytes is None or self._size <= self._max_size_bytes:
+            return
+
+        evicted = []
+        for sha, size in self._conn.execute(
+            "SELECT sha, size FROM blobs ORDER BY last_access"
+        ):
+            if self._size <= self._max_size_bytes:
+                break
+            evicted.append((sha,))
+            self._size -= size
+        self._conn.executemany("DELETE FROM blobs WHERE sha = ?", evicted)
+
+    def close(self) -> None:
+        """Write the pending accesses and close the database connection."""
+        with self._lock:
+            with self._conn:
+                self._write_accesses()
+            self._conn.close()
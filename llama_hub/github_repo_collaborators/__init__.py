@@ -1,12 +1,17 @@
 """Init file."""
-from llama_hub.github_repo_collaborators.base import (
-    GitHubRepositoryCollaboratorsReader,
-    print_if_verbose,
-)
-from llama_hub.github_repo_collaborators.github_client import (
-    BaseGitHubCollaboratorsClient,
-    GitHubCollaboratorsClient,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.github_repo_collaborators.base import (
+        GitHubRepositoryCollaboratorsReader,
+        print_if_verbose,
+    )
+    from llama_hub.github_repo_collaborators.github_client import (
+        BaseGitHubCollaboratorsClient,
+        GitHubCollaboratorsClient,
+    )
 
 __all__ = [
     "BaseGitHubCollaboratorsClient",
@@ -14,3 +19,17 @@ __all__ = [
     "GitHubRepositoryCollaboratorsReader",
     "print_if_verbose",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.github_repo_collaborators.base": [
+            "GitHubRepositoryCollaboratorsReader",
+            "print_if_verbose",
+        ],
+        "llama_hub.github_repo_collaborators.github_client": [
+            "BaseGitHubCollaboratorsClient",
+            "GitHubCollaboratorsClient",
+        ],
+    },
+)
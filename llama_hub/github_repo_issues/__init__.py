@@ -1,12 +1,17 @@
 """Init file."""
-from llama_hub.github_repo_issues.base import (
-    GitHubRepositoryIssuesReader,
-    print_if_verbose,
-)
-from llama_hub.github_repo_issues.github_client import (
-    BaseGitHubIssuesClient,
-    GitHubIssuesClient,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.github_repo_issues.base import (
+        GitHubRepositoryIssuesReader,
+        print_if_verbose,
+    )
+    from llama_hub.github_repo_issues.github_client import (
+        BaseGitHubIssuesClient,
+        GitHubIssuesClient,
+    )
 
 __all__ = [
     "BaseGitHubIssuesClient",
@@ -14,3 +19,17 @@ __all__ = [
     "GitHubRepositoryIssuesReader",
     "print_if_verbose",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.github_repo_issues.base": [
+            "GitHubRepositoryIssuesReader",
+            "print_if_verbose",
+        ],
+        "llama_hub.github_repo_issues.github_client": [
+            "BaseGitHubIssuesClient",
+            "GitHubIssuesClient",
+        ],
+    },
+)
@@ -1,7 +1,19 @@
 """Init file."""
-from llama_hub.gmail.base import (
-    GmailReader,
-    SCOPES,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.gmail.base import (
+        GmailReader,
+        SCOPES,
+    )
 
 __all__ = ["GmailReader", "SCOPES"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.gmail.base": ["GmailReader", "SCOPES"],
+    },
+)
@@ -1,7 +1,19 @@
 """Init file."""
-from llama_hub.google_calendar.base import (
-    GoogleCalendarReader,
-    SCOPES,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.google_calendar.base import (
+        GoogleCalendarReader,
+        SCOPES,
+    )
 
 __all__ = ["GoogleCalendarReader", "SCOPES"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.google_calendar.base": ["GoogleCalendarReader", "SCOPES"],
+    },
+)
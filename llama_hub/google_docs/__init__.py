@@ -1,7 +1,19 @@
 """Init file."""
-from llama_hub.google_docs.base import (
-    GoogleDocsReader,
-    SCOPES,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.google_docs.base import (
+        GoogleDocsReader,
+        SCOPES,
+    )
 
 __all__ = ["GoogleDocsReader", "SCOPES"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.google_docs.base": ["GoogleDocsReader", "SCOPES"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.google_drive.base import (
-    GoogleDriveReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.google_drive.base import (
+        GoogleDriveReader,
+    )
 
 __all__ = ["GoogleDriveReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.google_drive.base": ["GoogleDriveReader"],
+    },
+)
@@ -1,5 +1,17 @@
-from llama_hub.google_keep.base import (
-    GoogleKeepReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.google_keep.base import (
+        GoogleKeepReader,
+    )
 
 __all__ = ["GoogleKeepReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.google_keep.base": ["GoogleKeepReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.google_sheets.base import (
-    GoogleSheetsReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.google_sheets.base import (
+        GoogleSheetsReader,
+    )
 
 __all__ = ["GoogleSheetsReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.google_sheets.base": ["GoogleSheetsReader"],
+    },
+)
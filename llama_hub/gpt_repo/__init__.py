@@ -1,10 +1,15 @@
 """Init file."""
-from llama_hub.gpt_repo.base import (
-    GPTRepoReader,
-    get_ignore_list,
-    process_repository,
-    should_ignore,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.gpt_repo.base import (
+        GPTRepoReader,
+        get_ignore_list,
+        process_repository,
+        should_ignore,
+    )
 
 __all__ = [
     "GPTRepoReader",
@@ -12,3 +17,15 @@ __all__ = [
     "process_repository",
     "should_ignore",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.gpt_repo.base": [
+            "GPTRepoReader",
+            "get_ignore_list",
+            "process_repository",
+            "should_ignore",
+        ],
+    },
+)
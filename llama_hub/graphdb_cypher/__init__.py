@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.graphdb_cypher.base import (
-    GraphDBCypherReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.graphdb_cypher.base import (
+        GraphDBCypherReader,
+    )
 
 __all__ = ["GraphDBCypherReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.graphdb_cypher.base": ["GraphDBCypherReader"],
+    },
+)
@@ -1,5 +1,17 @@
-from llama_hub.guru.base import (
-    GuruReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.guru.base import (
+        GuruReader,
+    )
 
 __all__ = ["GuruReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.guru.base": ["GuruReader"],
+    },
+)
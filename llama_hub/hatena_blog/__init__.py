@@ -1,8 +1,24 @@
 """Init file."""
-from llama_hub.hatena_blog.base import (
-    ATOM_PUB_ENTRY_URL,
-    Article,
-    HatenaBlogReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.hatena_blog.base import (
+        ATOM_PUB_ENTRY_URL,
+        Article,
+        HatenaBlogReader,
+    )
 
 __all__ = ["ATOM_PUB_ENTRY_URL", "Article", "HatenaBlogReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.hatena_blog.base": [
+            "ATOM_PUB_ENTRY_URL",
+            "Article",
+            "HatenaBlogReader",
+        ],
+    },
+)
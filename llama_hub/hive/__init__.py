@@ -1,5 +1,17 @@
-from llama_hub.hive.base import (
-    HiveReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.hive.base import (
+        HiveReader,
+    )
 
 __all__ = ["HiveReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.hive.base": ["HiveReader"],
+    },
+)
@@ -0,0 +1,465 @@
+"""On-disk HTTP cache for web loaders.
+
+Responses are stored with their `ETag` and `Last-Modified` headers, and
+later requests for the same URL are sent as conditional requests: when the
+server answers 304 Not Modified, the stored body is used instead of being
+downloaded again. Readers can also store what they derived from a body
+(e.g. its text), to skip parsing it again for as long as it is unchanged.
+
+Usage:
+
+    cache = HTTPCache("~/.cache/llama_hub/http", max_size=10 * 1024**3)
+    reader = SimpleWebPageReader(html_to_text=True, http_cache=cache)
+    documents = reader.load_data(urls)
+    print(cache.stats)
+
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional, Union
+
+DEFAULT_MAX_SIZE = 1024**3
+
+# headers kept with a stored body
+STORED_HEADERS = ["content-type", "etag", "last-modified"]
+
+
+@dataclass
+class CacheStats:
+    """Counters of an `HTTPCache`.
+
+    Attributes:
+        hits (int): Requests answered with 304, served from the cache.
+        misses (int): Requests that downloaded a full response.
+        evictions (int): Entries removed to stay under the size bound.
+        bytes_saved (int): Body bytes not downloaded thanks to hits.
+        derived_hits (int): Derived results reused instead of parsing a body.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    bytes_saved: int = 0
+    derived_hits: int = 0
+
+
+@dataclass
+class CachedResponse:
+    """A response fetched through an `HTTPCache`.
+
+    Attributes:
+        url (str): Final URL of the response, after redirects.
+        status (int): HTTP status, 200 when served from the cache.
+        headers (Dict[str, str]): Response headers, with lowercase names.
+        content (bytes): Body of the response.
+        from_cache (bool): Whether the body was served from the cache.
+        stored (bool): Whether the body is the one stored for the URL, so that
+            results derived from it can be stored with it.
+    """
+
+    url: str
+    status: int
+    headers: Dict[str, str]
+    content: bytes
+    from_cache: bool = False
+    stored: bool = False
+
+    @property
+    def content_type(self) -> str:
+        """MIME type of the body, e.g. "text/html"."""
+        return self.headers.get("content-type", "").split(";")[0].strip().lower()
+
+    @property
+    def encoding(self) -> Optional[str]:
+        """Charset declared in the `Content-Type` header, if any."""
+        for param in self.headers.get("content-type", "").split(";")[1:]:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "charset":
+                return value.strip().strip("\"'")
+        return None
+
+    @property
+    def text(self) -> str:
+        """Body decoded with its declared charset, UTF-8 by default."""
+        try:
+            return self.content.decode(self.encoding or "utf-8", errors="replace")
+        except LookupError:
+            return self.content.decode("utf-8", errors="replace")
+
+
+def _lower_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+    return {name.lower(): value for name, value in headers.items()}
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file so that readers never see it partially written."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class HTTPCache:
+    """On-disk cache of HTTP responses, revalidated with conditional requests.
+
+    Only successful responses carrying an `ETag` or `Last-Modified` header
+    are stored, as others cannot be revalidated. When the cache grows over
+    `max_size` bytes, the least recently used entries are evicted. The cache
+    can be shared by threads of a process.
+
+    Args:
+        cache_dir (Union[str, Path]): Directory the responses are stored in.
+        max_size (int): Maximum size in bytes of the stored files. 1 GiB by
+            default.
+    """
+
+    def __init__(
+        self, cache_dir: Union[str, Path], max_size: int = DEFAULT_MAX_SIZE
+    ) -> None:
+        """Initialize with parameters."""
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        # size of the files of each entry, by name, least recently used first,
+        # so that the directory is only listed when the cache is opened
+        self._entries: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+        self._size = 0
+        self._load_index()
+
+    @property
+    def stats(self) -> CacheStats:
+        """A snapshot of the counters of the cache."""
+        with self._lock:
+            return dataclasses.replace(self._stats)
+
+    @property
+    def size(self) -> int:
+        """Size in bytes of the stored files."""
+        return self._size
+
+    def _load_index(self) -> None:
+        """Index the entries already on disk, by their last use."""
+        files: Dict[str, Dict[str, int]] = {}
+        last_used: Dict[str, float] = {}
+        for path in self.cache_dir.iterdir():
+            if path.suffix == ".tmp":
+                # left over by an interrupted write
+                path.unlink()
+                continue
+            key = path.name[:64]
+            stat = path.stat()
+            files.setdefault(key, {})[path.name] = stat.st_size
+            if path.name == f"{key}.json":
+                last_used[key] = stat.st_mtime
+
+        for key in sorted(last_used, key=last_used.__getitem__):
+            self._entries[key] = files[key]
+            self._size += sum(files[key].values())
+        for key in files.keys() - last_used.keys():
+            self._remove_files(files[key])
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _body_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.body"
+
+    def _derived_path(self, key: str, name: str) -> Path:
+        name_key = hashlib.sha256(name.encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"{key}-{name_key}.derived"
+
+    def _remove_files(self, names: Iterable[str]) -> None:
+        for name in names:
+            try:
+                (self.cache_dir / name).unlink()
+            except FileNotFoundError:
+                pass
+
+    def _remove_entry(self, key: str) -> None:
+        """Remove an entry and its files. Must be called with the lock held."""
+        files = self._entries.pop(key, {})
+        self._size -= sum(files.values())
+        self._remove_files(files)
+
+    def _read_meta(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self._meta_path(key).read_bytes())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _update_entry(self, key: str, sizes: Mapping[str, int]) -> None:
+        """Record the sizes of files written for an entry, as its most recent use.
+
+        Must be called with the lock held.
+        """
+        files = self._entries.pop(key, {})
+        for name, size in sizes.items():
+            self._size += size - files.get(name, 0)
+            files[name] = size
+        self._entries[key] = files
+        while self._size > self.max_size and len(self._entries) > 1:
+            evicted, evicted_files = self._entries.popitem(last=False)
+            self._remove_files(evicted_files)
+            self._size -= sum(evicted_files.values())
+            self._stats.evictions += 1
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Headers making a request for the URL conditional on its stored body."""
+        meta = self._read_meta(self._key(url))
+        if meta is None:
+            return {}
+        headers = {}
+        if "etag" in meta["headers"]:
+            headers["If-None-Match"] = meta["headers"]["etag"]
+        if "last-modified" in meta["headers"]:
+            headers["If-Modified-Since"] = meta["headers"]["last-modified"]
+        return headers
+
+    def revalidated(
+        self, url: str, headers: Mapping[str, str]
+    ) -> Optional[CachedResponse]:
+        """Serve the stored response for the URL after a 304 answer.
+
+        Args:
+            url (str): The requested URL.
+            headers (Mapping[str, str]): Headers of the 304 response, which
+                may update the validators of the stored response.
+
+        Returns:
+            Optional[CachedResponse]: The stored response, or None if it was
+                evicted in the meantime.
+        """
+        key = self._key(url)
+        meta = self._read_meta(key)
+        try:
+            content = self._body_path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+        if meta is None:
+            return None
+
+        validators = {
+            name: value
+            for name, value in _lower_headers(headers).items()
+            if name in ("etag", "last-modified")
+        }
+        sizes = {}
+        if any(
+            meta["headers"].get(name) != value for name, value in validators.items()
+        ):
+            meta["headers"].update(validators)
+            data = json.dumps(meta).encode("utf-8")
+            _write_atomic(self._meta_path(key), data)
+            sizes[self._meta_path(key).name] = len(data)
+        else:
+            # the modification time orders entries by last use across runs
+            try:
+                os.utime(self._meta_path(key))
+            except FileNotFoundError:
+                pass
+
+        with self._lock:
+            if key in self._entries:
+                self._update_entry(key, sizes)
+            self._stats.hits += 1
+            self._stats.bytes_saved += len(content)
+
+        return CachedResponse(
+            url=meta["url"],
+            status=200,
+            headers=meta["headers"],
+            content=content,
+            from_cache=True,
+            stored=True,
+        )
+
+    def store(self, url: str, response: CachedResponse) -> bool:
+        """Store a downloaded response, replacing the stored one for the URL.
+
+        Responses that are not 200, cannot be revalidated, forbid storing or
+        are larger than the cache are not stored, and the stored response for
+        the URL is removed, as it is no longer the current one.
+
+        Returns:
+            bool: Whether the response was stored.
+        """
+        with self._lock:
+            self._stats.misses += 1
+
+        key = self._key(url)
+        headers = response.headers
+        if (
+            response.status != 200
+            or not ("etag" in headers or "last-modified" in headers)
+            or "no-store" in headers.get("cache-control", "")
+            or len(response.content) > self.max_size
+        ):
+            with self._lock:
+                self._remove_entry(key)
+            return False
+
+        meta = {
+            "url": response.url,
+            "headers": {
+                name: headers[name] for name in STORED_HEADERS if name in headers
+            },
+        }
+        with self._lock:
+            # results derived from the previous body no longer apply
+            files = self._entries.get(key, {})
+            derived = [name for name in files if name.endswith(".derived")]
+            for name in derived:
+                self._size -= files.pop(name)
+            self._remove_files(derived)
+        data = json.dumps(meta).encode("utf-8")
+        _write_atomic(self._body_path(key), response.content)
+        _write_atomic(self._meta_path(key), data)
+
+        with self._lock:
+            self._update_entry(
+                key,
+                {
+                    self._body_path(key).name: len(response.content),
+                    self._meta_path(key).name: len(data),
+                },
+            )
+        return True
+
+    def load_derived(self, url: str, name: str) -> Optional[Any]:
+        """Load a result derived from the stored body of the URL.
+
+        Args:
+            url (str): The requested URL.
+            name (str): Name of the result, which should identify how it was
+                derived, e.g. "html2text".
+
+        Returns:
+            Optional[Any]: The result, or None if it was not stored.
+        """
+        try:
+            value = json.loads(self._derived_path(self._key(url), name).read_bytes())
+        except (FileNotFoundError, ValueError):
+            return None
+        with self._lock:
+            self._stats.derived_hits += 1
+        return value
+
+    def store_derived(self, url: str, name: str, value: Any) -> None:
+        """Store a JSON serializable result derived from the stored body of the URL.
+
+        It is discarded with the body, when a different body is stored for the
+        URL or the entry is evicted. Nothing is stored if the URL has no entry.
+        """
+        key = self._key(url)
+        if key not in self._entries:
+            return
+        path = self._derived_path(key, name)
+        data = json.dumps(value).encode("utf-8")
+        _write_atomic(path, data)
+        with self._lock:
+            if key in self._entries:
+                self._update_entry(key, {path.name: len(data)})
+            else:
+                # evicted while writing
+                self._remove_files([path.name])
+
+    def get(self, session: Any, url: str, **kwargs: Any) -> CachedResponse:
+        """Fetch the URL with a `requests` session, through the cache.
+
+        Args:
+            session (Any): A `requests.Session`, or the `requests` module.
+            url (str): The URL to fetch.
+            **kwargs: Arguments of `session.get`.
+
+        Returns:
+            CachedResponse: The response.
+        """
+        headers = kwargs.pop("headers", None) or {}
+        response = session.get(
+            url, headers={**headers, **self.conditional_headers(url)}, **kwargs
+        )
+        if response.status_code == 304:
+            cached = self.revalidated(url, response.headers)
+            if cached is not None:
+                return cached
+            response = session.get(url, headers=headers, **kwargs)
+
+        result = CachedResponse(
+            url=response.url,
+            status=response.status_code,
+            headers=_lower_headers(response.headers),
+            content=response.content,
+        )
+        result.stored = self.store(url, result)
+        return result
+
+    async def aget(self, session: Any, url: str, **kwargs: Any) -> CachedResponse:
+        """Fetch the URL with an `aiohttp.ClientSession`, through the cache.
+
+        Files are read and written in the default executor of the event loop.
+
+        Args:
+            session (Any): An `aiohttp.ClientSession`.
+            url (str): The URL to fetch.
+            **kwargs: Arguments of `session.get`.
+
+        Returns:
+            CachedResponse: The response.
+        """
+        loop = asyncio.get_running_loop()
+        headers = kwargs.pop("headers", None) or {}
+        conditional_headers = await loop.run_in_executor(
+            None, self.conditional_headers, url
+        )
+
+        async with session.get(
+            url, headers={**headers, **conditional_headers}, **kwargs
+        ) as response:
+            if response.status == 304:
+                cached = await loop.run_in_executor(
+                    None, self.revalidated, url, dict(response.headers)
+                )
+                if cached is not None:
+                    return cached
+            else:
+                result = CachedResponse(
+                    url=str(response.url),
+                    status=response.status,
+                    headers=_lower_headers(response.headers),
+                    content=await response.read(),
+                )
+                result.stored = await loop.run_in_executor(
+                    None, self.store, url, result
+                )
+                return result
+
+        # the stored body was evicted in the meantime
+        async with session.get(url, headers=headers, **kwargs) as response:
+            result = CachedResponse(
+                url=str(response.url),
+                status=response.status,
+                headers=_lower_headers(response.headers),
+                content=await response.read(),
+            )
+        result.stored = await loop.run_in_executor(None, self.store, url, result)
+        return result
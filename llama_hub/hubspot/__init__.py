@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.hubspot.base import (
-    HubspotReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.hubspot.base import (
+        HubspotReader,
+    )
 
 __all__ = ["HubspotReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.hubspot.base": ["HubspotReader"],
+    },
+)
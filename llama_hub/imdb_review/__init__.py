@@ -1,12 +1,17 @@
-from llama_hub.imdb_review.base import (
-    IMDBReviews,
-)
-from llama_hub.imdb_review.scraper import (
-    clean_text,
-    main_scraper,
-    scrape_data,
-    process_muted_text,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.imdb_review.base import (
+        IMDBReviews,
+    )
+    from llama_hub.imdb_review.scraper import (
+        clean_text,
+        main_scraper,
+        scrape_data,
+        process_muted_text,
+    )
 
 __all__ = [
     "IMDBReviews",
@@ -15,3 +20,16 @@ __all__ = [
     "scrape_data",
     "process_muted_text",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.imdb_review.base": ["IMDBReviews"],
+        "llama_hub.imdb_review.scraper": [
+            "clean_text",
+            "main_scraper",
+            "scrape_data",
+            "process_muted_text",
+        ],
+    },
+)
@@ -1,7 +1,19 @@
-from llama_hub.jira.base import (
-    BasicAuth,
-    JiraReader,
-    Oauth2,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.jira.base import (
+        BasicAuth,
+        JiraReader,
+        Oauth2,
+    )
 
 __all__ = ["BasicAuth", "JiraReader", "Oauth2"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.jira.base": ["BasicAuth", "JiraReader", "Oauth2"],
+    },
+)
@@ -1,6 +1,18 @@
-from llama_hub.joplin.base import (
-    JoplinReader,
-    LINK_NOTE_TEMPLATE,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.joplin.base import (
+        JoplinReader,
+        LINK_NOTE_TEMPLATE,
+    )
 
 __all__ = ["JoplinReader", "LINK_NOTE_TEMPLATE"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.joplin.base": ["JoplinReader", "LINK_NOTE_TEMPLATE"],
+    },
+)
@@ -1,7 +1,19 @@
 """Init file."""
-from llama_hub.jsondata.base import (
-    JSONDataReader,
-    JsonDataReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.jsondata.base import (
+        JSONDataReader,
+        JsonDataReader,
+    )
 
 __all__ = ["JSONDataReader", "JsonDataReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.jsondata.base": ["JSONDataReader", "JsonDataReader"],
+    },
+)
@@ -1,11 +1,30 @@
 """Init file."""
-from llama_hub.kibela.base import (
-    Connection,
-    Edge,
-    KibelaReader,
-    NodeType,
-    Note,
-    PageInfo,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.kibela.base import (
+        Connection,
+        Edge,
+        KibelaReader,
+        NodeType,
+        Note,
+        PageInfo,
+    )
 
 __all__ = ["Connection", "Edge", "KibelaReader", "NodeType", "Note", "PageInfo"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.kibela.base": [
+            "Connection",
+            "Edge",
+            "KibelaReader",
+            "NodeType",
+            "Note",
+            "PageInfo",
+        ],
+    },
+)
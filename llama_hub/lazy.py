@@ -0,0 +1,44 @@
+"""Lazy exports for package init files.
+
+Package `__init__` modules declare their exports with `lazy_exports`, so
+that importing a package does not import its `base` module (and the
+dependencies it imports) until one of the exported names is used.
+
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package_name: str, exports: Dict[str, List[str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build the module `__getattr__` and `__dir__` of a package (PEP 562).
+
+    Exported names are imported from their module on first access, then
+    stored on the package so that later accesses are plain attribute lookups.
+
+    Args:
+        package_name (str): `__name__` of the package.
+        exports (Dict[str, List[str]]): Names exported by the package, by the
+            module they are defined in. Modules may be relative to the package.
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: The `__getattr__`
+            and `__dir__` functions of the package.
+    """
+    modules = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        if name not in modules:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        module = importlib.import_module(modules[name], package_name)
+        value = getattr(module, name)
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(modules))
+
+    return __getattr__, __dir__
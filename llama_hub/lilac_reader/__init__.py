@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.lilac_reader.base import LilacReader
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.lilac_reader.base import LilacReader
 
 __all__ = [
     "LilacReader",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.lilac_reader.base": ["LilacReader"],
+    },
+)
@@ -1,3 +1,19 @@
-from llama_hub.llama_packs.agent_search_retriever.base import AgentSearchRetrieverPack
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.agent_search_retriever.base import (
+        AgentSearchRetrieverPack,
+    )
 
 __all__ = ["AgentSearchRetrieverPack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.agent_search_retriever.base": [
+            "AgentSearchRetrieverPack"
+        ],
+    },
+)
@@ -1,5 +1,19 @@
-from llama_hub.llama_packs.arize_phoenix_query_engine.base import (
-    ArizePhoenixQueryEnginePack,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.arize_phoenix_query_engine.base import (
+        ArizePhoenixQueryEnginePack,
+    )
 
 __all__ = ["ArizePhoenixQueryEnginePack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.arize_phoenix_query_engine.base": [
+            "ArizePhoenixQueryEnginePack"
+        ],
+    },
+)
@@ -1,3 +1,15 @@
-from llama_hub.llama_packs.cogniswitch_agent.base import CogniswitchAgentPack
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.cogniswitch_agent.base import CogniswitchAgentPack
 
 __all__ = ["CogniswitchAgentPack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.cogniswitch_agent.base": ["CogniswitchAgentPack"],
+    },
+)
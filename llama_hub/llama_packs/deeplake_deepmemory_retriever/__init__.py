@@ -1,6 +1,19 @@
-from llama_hub.llama_packs.deeplake_deepmemory_retriever.base import (
-    DeepMemoryRetrieverPack,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
 
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.deeplake_deepmemory_retriever.base import (
+        DeepMemoryRetrieverPack,
+    )
 
 __all__ = ["DeepMemoryRetrieverPack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.deeplake_deepmemory_retriever.base": [
+            "DeepMemoryRetrieverPack"
+        ],
+    },
+)
@@ -1,6 +1,19 @@
-from llama_hub.llama_packs.deeplake_multimodal_retrieval.base import (
-    DeepLakeMultimodalRetrieverPack,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
 
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.deeplake_multimodal_retrieval.base import (
+        DeepLakeMultimodalRetrieverPack,
+    )
 
 __all__ = ["DeepLakeMultimodalRetrieverPack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.deeplake_multimodal_retrieval.base": [
+            "DeepLakeMultimodalRetrieverPack"
+        ],
+    },
+)
@@ -1,5 +1,17 @@
-from llama_hub.llama_packs.docugami_kg_rag.base import (
-    DocugamiKgRagPack,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.docugami_kg_rag.base import (
+        DocugamiKgRagPack,
+    )
 
 __all__ = ["DocugamiKgRagPack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.docugami_kg_rag.base": ["DocugamiKgRagPack"],
+    },
+)
@@ -1,3 +1,15 @@
-from llama_hub.llama_packs.fuzzy_citation.base import FuzzyCitationEnginePack
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.fuzzy_citation.base import FuzzyCitationEnginePack
 
 __all__ = ["FuzzyCitationEnginePack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.fuzzy_citation.base": ["FuzzyCitationEnginePack"],
+    },
+)
@@ -1,3 +1,15 @@
-from llama_hub.llama_packs.gmail_openai_agent.base import GmailOpenAIAgentPack
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.gmail_openai_agent.base import GmailOpenAIAgentPack
 
 __all__ = ["GmailOpenAIAgentPack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.gmail_openai_agent.base": ["GmailOpenAIAgentPack"],
+    },
+)
@@ -1,3 +1,15 @@
-from llama_hub.llama_packs.gradio_agent_chat.base import GradioAgentChatPack
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.gradio_agent_chat.base import GradioAgentChatPack
 
 __all__ = ["GradioAgentChatPack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.gradio_agent_chat.base": ["GradioAgentChatPack"],
+    },
+)
@@ -1,3 +1,19 @@
-from llama_hub.llama_packs.gradio_react_agent_chatbot.base import GradioReActAgentPack
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.gradio_react_agent_chatbot.base import (
+        GradioReActAgentPack,
+    )
 
 __all__ = ["GradioReActAgentPack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.gradio_react_agent_chatbot.base": [
+            "GradioReActAgentPack"
+        ],
+    },
+)
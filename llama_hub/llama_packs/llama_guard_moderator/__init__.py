@@ -1,3 +1,15 @@
-from llama_hub.llama_packs.llama_guard_moderator.base import LlamaGuardModeratorPack
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.llama_guard_moderator.base import LlamaGuardModeratorPack
 
 __all__ = ["LlamaGuardModeratorPack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.llama_guard_moderator.base": ["LlamaGuardModeratorPack"],
+    },
+)
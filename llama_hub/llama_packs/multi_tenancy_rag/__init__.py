@@ -1,3 +1,15 @@
-from llama_hub.llama_packs.multi_tenancy_rag.base import MultiTenancyRAGPack
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.multi_tenancy_rag.base import MultiTenancyRAGPack
 
 __all__ = ["MultiTenancyRAGPack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.multi_tenancy_rag.base": ["MultiTenancyRAGPack"],
+    },
+)
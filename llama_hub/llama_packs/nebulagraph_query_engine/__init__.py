@@ -1,5 +1,19 @@
-from llama_hub.llama_packs.nebulagraph_query_engine.base import (
-    NebulaGraphQueryEnginePack,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.nebulagraph_query_engine.base import (
+        NebulaGraphQueryEnginePack,
+    )
 
 __all__ = ["NebulaGraphQueryEnginePack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.nebulagraph_query_engine.base": [
+            "NebulaGraphQueryEnginePack"
+        ],
+    },
+)
@@ -1,3 +1,15 @@
-from llama_hub.llama_packs.neo4j_query_engine.base import Neo4jQueryEnginePack
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.neo4j_query_engine.base import Neo4jQueryEnginePack
 
 __all__ = ["Neo4jQueryEnginePack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.neo4j_query_engine.base": ["Neo4jQueryEnginePack"],
+    },
+)
@@ -1,3 +1,15 @@
-from llama_hub.llama_packs.ollama_query_engine.base import OllamaQueryEnginePack
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.ollama_query_engine.base import OllamaQueryEnginePack
 
 __all__ = ["OllamaQueryEnginePack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.ollama_query_engine.base": ["OllamaQueryEnginePack"],
+    },
+)
@@ -1,3 +1,15 @@
-from llama_hub.llama_packs.retry_engine_weaviate.base import WeaviateRetryEngine
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.retry_engine_weaviate.base import WeaviateRetryEngine
 
 __all__ = ["WeaviateRetryEngine"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.retry_engine_weaviate.base": ["WeaviateRetryEngine"],
+    },
+)
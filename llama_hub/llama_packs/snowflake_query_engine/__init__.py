@@ -1,3 +1,19 @@
-from llama_hub.llama_packs.snowflake_query_engine.base import SnowflakeQueryEnginePack
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.snowflake_query_engine.base import (
+        SnowflakeQueryEnginePack,
+    )
 
 __all__ = ["SnowflakeQueryEnginePack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.snowflake_query_engine.base": [
+            "SnowflakeQueryEnginePack"
+        ],
+    },
+)
@@ -1,3 +1,15 @@
-from llama_hub.llama_packs.sub_question_weaviate.base import WeaviateSubQuestion
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.sub_question_weaviate.base import WeaviateSubQuestion
 
 __all__ = ["WeaviateSubQuestion"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.sub_question_weaviate.base": ["WeaviateSubQuestion"],
+    },
+)
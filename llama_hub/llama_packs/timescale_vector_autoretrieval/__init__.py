@@ -1,5 +1,19 @@
-from llama_hub.llama_packs.timescale_vector_autoretrieval.base import (
-    TimescaleVectorAutoretrievalPack,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.timescale_vector_autoretrieval.base import (
+        TimescaleVectorAutoretrievalPack,
+    )
 
 __all__ = ["TimescaleVectorAutoretrievalPack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.timescale_vector_autoretrieval.base": [
+            "TimescaleVectorAutoretrievalPack"
+        ],
+    },
+)
@@ -1,7 +1,23 @@
-from llama_hub.llama_packs.trulens_eval_packs.base import (
-    TruLensRAGTriadPack,
-    TruLensHarmlessPack,
-    TruLensHelpfulPack,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.trulens_eval_packs.base import (
+        TruLensRAGTriadPack,
+        TruLensHarmlessPack,
+        TruLensHelpfulPack,
+    )
 
 __all__ = ["TruLensRAGTriadPack", "TruLensHarmlessPack", "TruLensHelpfulPack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.trulens_eval_packs.base": [
+            "TruLensRAGTriadPack",
+            "TruLensHarmlessPack",
+            "TruLensHelpfulPack",
+        ],
+    },
+)
@@ -1,6 +1,17 @@
-from llama_hub.llama_packs.vectara_rag.base import (
-    VectaraRagPack,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
 
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.vectara_rag.base import (
+        VectaraRagPack,
+    )
 
 __all__ = ["VectaraRagPack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.vectara_rag.base": ["VectaraRagPack"],
+    },
+)
@@ -1,3 +1,15 @@
-from llama_hub.llama_packs.voyage_query_engine.base import VoyageQueryEnginePack
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.voyage_query_engine.base import VoyageQueryEnginePack
 
 __all__ = ["VoyageQueryEnginePack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.voyage_query_engine.base": ["VoyageQueryEnginePack"],
+    },
+)
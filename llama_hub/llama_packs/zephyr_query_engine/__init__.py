@@ -1,3 +1,15 @@
-from llama_hub.llama_packs.zephyr_query_engine.base import ZephyrQueryEnginePack
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.llama_packs.zephyr_query_engine.base import ZephyrQueryEnginePack
 
 __all__ = ["ZephyrQueryEnginePack"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.llama_packs.zephyr_query_engine.base": ["ZephyrQueryEnginePack"],
+    },
+)
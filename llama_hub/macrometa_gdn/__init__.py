@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.macrometa_gdn.base import (
-    MacrometaGDNReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.macrometa_gdn.base import (
+        MacrometaGDNReader,
+    )
 
 __all__ = ["MacrometaGDNReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.macrometa_gdn.base": ["MacrometaGDNReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.make_com.base import (
-    MakeWrapper,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.make_com.base import (
+        MakeWrapper,
+    )
 
 __all__ = ["MakeWrapper"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.make_com.base": ["MakeWrapper"],
+    },
+)
@@ -1,4 +1,16 @@
 """Init file."""
-from llama_hub.mangadex.base import MangaDexReader
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.mangadex.base import MangaDexReader
 
 __all__ = ["MangaDexReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.mangadex.base": ["MangaDexReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.mangoapps_guides.base import (
-    MangoppsGuidesReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.mangoapps_guides.base import (
+        MangoppsGuidesReader,
+    )
 
 __all__ = ["MangoppsGuidesReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.mangoapps_guides.base": ["MangoppsGuidesReader"],
+    },
+)
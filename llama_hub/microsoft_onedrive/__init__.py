@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.microsoft_onedrive.base import (
-    OneDriveReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.microsoft_onedrive.base import (
+        OneDriveReader,
+    )
 
 __all__ = ["OneDriveReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.microsoft_onedrive.base": ["OneDriveReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.microsoft_sharepoint.base import (
-    SharePointReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.microsoft_sharepoint.base import (
+        SharePointReader,
+    )
 
 __all__ = ["SharePointReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.microsoft_sharepoint.base": ["SharePointReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init params."""
-from llama_hub.milvus.base import (
-    MilvusReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.milvus.base import (
+        MilvusReader,
+    )
 
 __all__ = ["MilvusReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.milvus.base": ["MilvusReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.mongo.base import (
-    SimpleMongoReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.mongo.base import (
+        SimpleMongoReader,
+    )
 
 __all__ = ["SimpleMongoReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.mongo.base": ["SimpleMongoReader"],
+    },
+)
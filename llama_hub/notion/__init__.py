@@ -1,11 +1,16 @@
 """Init file."""
-from llama_hub.notion.base import (
-    BLOCK_CHILD_URL_TMPL,
-    DATABASE_URL_TMPL,
-    INTEGRATION_TOKEN_NAME,
-    NotionPageReader,
-    SEARCH_URL,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.notion.base import (
+        BLOCK_CHILD_URL_TMPL,
+        DATABASE_URL_TMPL,
+        INTEGRATION_TOKEN_NAME,
+        NotionPageReader,
+        SEARCH_URL,
+    )
 
 __all__ = [
     "BLOCK_CHILD_URL_TMPL",
@@ -14,3 +19,16 @@ __all__ = [
     "NotionPageReader",
     "SEARCH_URL",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.notion.base": [
+            "BLOCK_CHILD_URL_TMPL",
+            "DATABASE_URL_TMPL",
+            "INTEGRATION_TOKEN_NAME",
+            "NotionPageReader",
+            "SEARCH_URL",
+        ],
+    },
+)
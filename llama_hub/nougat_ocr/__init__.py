@@ -1,5 +1,17 @@
-from llama_hub.nougat_ocr.base import (
-    PDFNougatOCR,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.nougat_ocr.base import (
+        PDFNougatOCR,
+    )
 
 __all__ = ["PDFNougatOCR"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.nougat_ocr.base": ["PDFNougatOCR"],
+    },
+)
@@ -1,4 +1,16 @@
 """Init file."""
-from llama_hub.openalex.base import OpenAlexReader
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.openalex.base import OpenAlexReader
 
 __all__ = ["OpenAlexReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.openalex.base": ["OpenAlexReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.opendal_reader.azblob.base import (
-    OpendalAzblobReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.opendal_reader.azblob.base import (
+        OpendalAzblobReader,
+    )
 
 __all__ = ["OpendalAzblobReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.opendal_reader.azblob.base": ["OpendalAzblobReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.opendal_reader.gcs.base import (
-    OpendalGcsReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.opendal_reader.gcs.base import (
+        OpendalGcsReader,
+    )
 
 __all__ = ["OpendalGcsReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.opendal_reader.gcs.base": ["OpendalGcsReader"],
+    },
+)
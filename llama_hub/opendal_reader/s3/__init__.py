@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.opendal_reader.s3.base import (
-    OpendalS3Reader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.opendal_reader.s3.base import (
+        OpendalS3Reader,
+    )
 
 __all__ = ["OpendalS3Reader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.opendal_reader.s3.base": ["OpendalS3Reader"],
+    },
+)
@@ -1,5 +1,17 @@
-from llama_hub.opensearch.base import (
-    OpensearchReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.opensearch.base import (
+        OpensearchReader,
+    )
 
 __all__ = ["OpensearchReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.opensearch.base": ["OpensearchReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init params."""
-from llama_hub.pandas_ai.base import (
-    PandasAIReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.pandas_ai.base import (
+        PandasAIReader,
+    )
 
 __all__ = ["PandasAIReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.pandas_ai.base": ["PandasAIReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.patentsview.base import (
-    PatentsviewReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.patentsview.base import (
+        PatentsviewReader,
+    )
 
 __all__ = ["PatentsviewReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.patentsview.base": ["PatentsviewReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.pdf_table.base import (
-    PDFTableReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.pdf_table.base import (
+        PDFTableReader,
+    )
 
 __all__ = ["PDFTableReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.pdf_table.base": ["PDFTableReader"],
+    },
+)
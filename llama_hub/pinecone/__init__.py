@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.pinecone.base import (
-    PineconeReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.pinecone.base import (
+        PineconeReader,
+    )
 
 __all__ = ["PineconeReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.pinecone.base": ["PineconeReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.preprocess.base import (
-    PreprocessReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.preprocess.base import (
+        PreprocessReader,
+    )
 
 __all__ = ["PreprocessReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.preprocess.base": ["PreprocessReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.reddit.base import (
-    RedditReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.reddit.base import (
+        RedditReader,
+    )
 
 __all__ = ["RedditReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.reddit.base": ["RedditReader"],
+    },
+)
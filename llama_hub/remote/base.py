@@ -5,26 +5,39 @@ A loader that fetches an arbitrary remote page or file by URL and parses its con
 """
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from llama_index import download_loader
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+if TYPE_CHECKING:
+    from llama_hub.http_cache import HTTPCache
+
 
 class RemoteReader(BaseReader):
-    """General reader for any remote page or file."""
+    """General reader for any remote page or file.
+
+    Args:
+        file_extractor (Optional[Dict[str, Union[str, BaseReader]]]): Readers
+            used for files, by extension.
+        http_cache (Optional[HTTPCache]): Cache revalidating the URL with a
+            conditional request. Unless `file_extractor` is set, the documents
+            are stored too, and reused while the content is unchanged.
+    """
 
     def __init__(
         self,
         *args: Any,
         file_extractor: Optional[Dict[str, Union[str, BaseReader]]] = None,
+        http_cache: Optional["HTTPCache"] = None,
         **kwargs: Any,
     ) -> None:
         """Init params."""
         super().__init__(*args, **kwargs)
 
         self.file_extractor = file_extractor
+        self.http_cache = http_cache
 
     @staticmethod
     def _is_youtube_video(url: str) -> bool:
@@ -47,18 +60,63 @@ class RemoteReader(BaseReader):
 
     def load_data(self, url: str) -> List[Document]:
         """Parse whatever is at the URL."""
-        import tempfile
-        from urllib.parse import urlparse
         from urllib.request import Request, urlopen
 
-        extra_info = {"Source": url}
+        if self.http_cache is not None:
+            return self._load_cached(url)
 
         req = Request(url, headers={"User-Agent": "Magic Browser"})
         result = urlopen(req)
         url_type = result.info().get_content_type()
+        return self.load_content(url, url_type, result.read())
+
+    def _load_cached(self, url: str) -> List[Document]:
+        """Parse whatever is at the URL, fetched through the HTTP cache."""
+        import requests
+
+        response = self.http_cache.get(
+            requests, url, headers={"User-Agent": "Magic Browser"}
+        )
+        if response.status >= 400:
+            raise ValueError(
+                f"error fetching {url}: server returned status {response.status}"
+            )
+        # custom extractors may parse the same content differently
+        reuse_documents = self.file_extractor is None
+        if response.from_cache and reuse_documents:
+            documents = self.http_cache.load_derived(url, "RemoteReader")
+            if documents is not None:
+                return [Document.from_dict(document) for document in documents]
+
+        documents = self.load_content(url, response.content_type, response.content)
+        if reuse_documents and response.stored:
+            self.http_cache.store_derived(
+                url, "RemoteReader", [document.to_dict() for document in documents]
+            )
+        return documents
+
+    def load_content(self, url: str, url_type: str, content: bytes) -> List[Document]:
+        """Parse content already fetched from the URL.
+
+        Args:
+            url (str): The URL the content was fetched from.
+            url_type (str): The MIME type of the content, e.g. "text/html".
+            content (bytes): The body of the response.
+
+        Returns:
+            List[Document]: The documents parsed from the content.
+        """
+        import io
+        import tempfile
+        from urllib.parse import urlparse
+
+        extra_info = {"Source": url}
+
         documents = []
         if url_type == "text/html" or url_type == "text/plain":
-            text = "\n\n".join([str(el.decode("utf-8-sig")) for el in result])
+            text = "\n\n".join(
+                [str(el.decode("utf-8-sig")) for el in io.BytesIO(content)]
+            )
             documents = [Document(text=text, extra_info=extra_info)]
         elif self._is_youtube_video(url):
             try:
@@ -75,7 +133,7 @@ class RemoteReader(BaseReader):
             with tempfile.TemporaryDirectory() as temp_dir:
                 filepath = f"{temp_dir}/temp{suffix}"
                 with open(filepath, "wb") as output:
-                    output.write(result.read())
+                    output.write(content)
 
                 SimpleDirectoryReader = download_loader("SimpleDirectoryReader")
                 loader = SimpleDirectoryReader(
@@ -1,5 +1,17 @@
-from llama_hub.remote_depth.base import (
-    RemoteDepthReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.remote_depth.base import (
+        RemoteDepthReader,
+    )
 
 __all__ = ["RemoteDepthReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.remote_depth.base": ["RemoteDepthReader"],
+    },
+)
@@ -2,7 +2,19 @@
 
 A loader that fetches any remote page or file by URL and retrieves child pages with certain constraints. The class also parses the contents of each page and provides access to the parsed data.
 """
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import requests
 from llama_index import download_loader
@@ -11,12 +23,33 @@ from llama_index.readers.schema.base import Document
 
 
 class RemoteDepthReader(BaseReader):
+    """Reader for a remote page and the pages it links to, up to a depth.
+
+    Pages are crawled asynchronously, a depth level at a time, and each page
+    is downloaded once: its body is used both to find links and to build
+    documents.
+
+    Args:
+        file_extractor (Optional[Dict[str, Union[str, BaseReader]]]): Readers
+            used for files, by extension.
+        depth (int): Number of levels of links to follow.
+        domain_lock (bool): Whether to only follow links containing the
+            starting URL.
+        max_concurrency (int): Maximum number of pages fetched at a time.
+        max_connections_per_host (int): Maximum number of pages fetched at a
+            time from the same host.
+        timeout (float): Timeout in seconds for fetching a page.
+    """
+
     def __init__(
         self,
         *args: Any,
         file_extractor: Optional[Dict[str, Union[str, BaseReader]]] = None,
         depth: int = 1,
         domain_lock: bool = False,
+        max_concurrency: int = 20,
+        max_connections_per_host: int = 4,
+        timeout: float = 60.0,
         **kwargs: Any,
     ) -> None:
         """Init params."""
@@ -24,67 +57,154 @@ class RemoteDepthReader(BaseReader):
         self.file_extractor = file_extractor
         self.depth = depth
         self.domain_lock = domain_lock
+        self.max_concurrency = max_concurrency
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
 
-    def load_data(self, url: str) -> List[Document]:
-        from tqdm.auto import tqdm
-
-        """Parse whatever is at the URL.""" ""
+    def _get_remote_reader(self) -> BaseReader:
         try:
             from llama_hub.utils import import_loader
 
             RemoteReader = import_loader("RemoteReader")
         except ImportError:
             RemoteReader = download_loader("RemoteReader")
-        remote_reader = RemoteReader(file_extractor=self.file_extractor)
-        documents = []
-        links = self.get_links(url)
-        urls = {-1: [url]}  # -1 is the starting point
-        links_visited = []
-        for i in range(self.depth + 1):
-            urls[i] = []
-            new_links = []
-            print(f"Reading links at depth {i}...")
-            for link in tqdm(links):
-                """Checking if the link belongs the provided domain."""
-                if (self.domain_lock and link.find(url) > -1) or (not self.domain_lock):
-                    print("Loading link: " + link)
-                    if link in links_visited:
-                        continue
-                    if link:
-                        urls[i].append(link)
-                        new_links.extend(self.get_links(link))
-                    links_visited.append(link)
-                else:
-                    print("Link ignored: " + link)
-            new_links = list(set(new_links))
-            links = new_links
-        print(f"Found {len(urls)} links at depth {self.depth}.")
-        for depth_i in urls:
-            for url in urls[depth_i]:
+        return RemoteReader(file_extractor=self.file_extractor)
+
+    async def _fetch(self, session: Any, url: str) -> Optional[Tuple[str, str, bytes]]:
+        """Fetch a page, returning its final URL, content type and body."""
+        try:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                return str(response.url), response.content_type, await response.read()
+        except Exception as e:
+            print(f"Error fetching {url}: {e}")
+            return None
+
+    async def alazy_load_data(self, url: str) -> AsyncIterator[Document]:
+        """Crawl from the URL, yielding the documents of each depth level in turn.
+
+        The pages of the next level are fetched while the current level's
+        pages are parsed.
+        """
+        import aiohttp
+
+        remote_reader = self._get_remote_reader()
+        loop = asyncio.get_running_loop()
+        visited = {url}
+
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrency, limit_per_host=self.max_connections_per_host
+        )
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers={"User-Agent": "Magic Browser"},
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        ) as session:
+
+            def fetch_all(links: List[str]) -> "asyncio.Future":
+                return asyncio.gather(*(self._fetch(session, link) for link in links))
+
+            # -1 is the starting point
+            links = [url]
+            pages_future = fetch_all(links)
+            try:
+                for depth_i in range(-1, self.depth + 1):
+                    if depth_i >= 0:
+                        print(f"Reading {len(links)} links at depth {depth_i}...")
+                    pages = await pages_future
+
+                    next_links: List[str] = []
+                    if depth_i < self.depth:
+                        for page in pages:
+                            if page is None or page[1] != "text/html":
+                                continue
+                            for link in self._extract_links(page[0], page[2]):
+                                # Checking if the link belongs the provided domain
+                                if self.domain_lock and link.find(url) == -1:
+                                    continue
+                                if link not in visited:
+                                    visited.add(link)
+                                    next_links.append(link)
+                        pages_future = fetch_all(next_links)
+
+                    for link, page in zip(links, pages):
+                        if page is None:
+                            continue
+                        _, content_type, content = page
+                        try:
+                            documents = await loop.run_in_executor(
+                                None,
+                                remote_reader.load_content,
+                                link,
+                                content_type,
+                                content,
+                            )
+                        except Exception as e:
+                            print(f"Error reading {link} at depth {depth_i}: {e}")
+                            continue
+                        for document in documents:
+                            yield document
+
+                    links = next_links
+                    if not links:
+                        break
+            finally:
+                # stop fetching if the consumer stops early
+                pages_future.cancel()
+
+    def lazy_load_data(self, url: str) -> Iterator[Document]:
+        """Crawl from the URL, yielding the documents of each depth level in turn.
+
+        Can be called from inside a running event loop, in which case the crawl
+        runs on a separate thread.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            executor = None
+        else:
+            # a running loop can't run another one in the same thread
+            executor = ThreadPoolExecutor(1)
+
+        loop = asyncio.new_event_loop()
+
+        def run(awaitable: Awaitable) -> Any:
+            if executor is None:
+                return loop.run_until_complete(awaitable)
+            return executor.submit(loop.run_until_complete, awaitable).result()
+
+        documents = self.alazy_load_data(url)
+        try:
+            while True:
                 try:
-                    documents.extend(remote_reader.load_data(url))
-                except Exception as e:
-                    print(f"Error reading {url} at depth {depth_i}: {e}")
-                    continue
+                    yield run(documents.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            run(documents.aclose())
+            loop.close()
+            if executor is not None:
+                executor.shutdown()
 
-        return documents
+    def load_data(self, url: str) -> List[Document]:
+        """Parse whatever is at the URL and the pages it links to."""
+        return list(self.lazy_load_data(url))
 
     @staticmethod
     def is_url(href) -> bool:
         """Check if a link is a URL."""
         return href.startswith("http")
 
-    def get_links(self, url) -> List[str]:
+    def _extract_links(self, url: str, content: bytes) -> List[str]:
+        """Extract the unique links of an HTML page, without query strings."""
         from urllib.parse import urljoin, urlparse, urlunparse
 
         from bs4 import BeautifulSoup
 
-        """Get all links from a page."""
-        page = requests.get(url)
-        soup = BeautifulSoup(page.content, "html.parser")
+        soup = BeautifulSoup(content, "html.parser")
 
         links = soup.find_all("a")
-        result = []
+        result: Dict[str, None] = {}
         for link in links:
             if isinstance(link, str):
                 href = link
@@ -99,10 +219,11 @@ class RemoteDepthReader(BaseReader):
                 (url_parsed.scheme, url_parsed.netloc, url_parsed.path, "", "", "")
             )
 
-            if (
-                url_without_query_string not in result
-                and url_without_query_string
-                and url_without_query_string.startswith("http")
-            ):
-                result.append(url_without_query_string)
-        return result
+            if url_without_query_string and url_without_query_string.startswith("http"):
+                result[url_without_query_string] = None
+        return list(result)
+
+    def get_links(self, url) -> List[str]:
+        """Get all links from a page."""
+        page = requests.get(url)
+        return self._extract_links(url, page.content)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.s3.base import (
-    S3Reader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.s3.base import (
+        S3Reader,
+    )
 
 __all__ = ["S3Reader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.s3.base": ["S3Reader"],
+    },
+)
@@ -1,8 +1,20 @@
 """Init file."""
-from llama_hub.semanticscholar.base import (
-    SemanticScholarReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.semanticscholar.base import (
+        SemanticScholarReader,
+    )
 
 __all__ = [
     "SemanticScholarReader",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.semanticscholar.base": ["SemanticScholarReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.singlestore.base import (
-    SingleStoreReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.singlestore.base import (
+        SingleStoreReader,
+    )
 
 __all__ = ["SingleStoreReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.singlestore.base": ["SingleStoreReader"],
+    },
+)
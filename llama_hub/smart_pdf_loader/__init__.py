@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.smart_pdf_loader.base import (
-    SmartPDFLoader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.smart_pdf_loader.base import (
+        SmartPDFLoader,
+    )
 
 __all__ = ["SmartPDFLoader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.smart_pdf_loader.base": ["SmartPDFLoader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.snscrape_twitter.base import (
-    SnscrapeTwitterReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.snscrape_twitter.base import (
+        SnscrapeTwitterReader,
+    )
 
 __all__ = ["SnscrapeTwitterReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.snscrape_twitter.base": ["SnscrapeTwitterReader"],
+    },
+)
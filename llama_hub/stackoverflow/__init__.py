@@ -1,10 +1,15 @@
 """Init file."""
-from llama_hub.stackoverflow.base import (
-    StackOverflowPost,
-    StackoverflowReader,
-    rate_limit,
-    rate_limited_get,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.stackoverflow.base import (
+        StackOverflowPost,
+        StackoverflowReader,
+        rate_limit,
+        rate_limited_get,
+    )
 
 __all__ = [
     "StackOverflowPost",
@@ -12,3 +17,15 @@ __all__ = [
     "rate_limit",
     "rate_limited_get",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.stackoverflow.base": [
+            "StackOverflowPost",
+            "StackoverflowReader",
+            "rate_limit",
+            "rate_limited_get",
+        ],
+    },
+)
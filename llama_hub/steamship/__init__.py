@@ -1,5 +1,17 @@
-from llama_hub.steamship.base import (
-    SteamshipFileReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.steamship.base import (
+        SteamshipFileReader,
+    )
 
 __all__ = ["SteamshipFileReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.steamship.base": ["SteamshipFileReader"],
+    },
+)
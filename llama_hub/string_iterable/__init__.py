@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.string_iterable.base import (
-    StringIterableReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.string_iterable.base import (
+        StringIterableReader,
+    )
 
 __all__ = ["StringIterableReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.string_iterable.base": ["StringIterableReader"],
+    },
+)
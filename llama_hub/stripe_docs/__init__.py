@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.stripe_docs.base import (
-    StripeDocsReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.stripe_docs.base import (
+        StripeDocsReader,
+    )
 
 __all__ = ["StripeDocsReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.stripe_docs.base": ["StripeDocsReader"],
+    },
+)
@@ -1,6 +1,18 @@
 ## init
-from llama_hub.tools.arxiv.base import (
-    ArxivToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.arxiv.base import (
+        ArxivToolSpec,
+    )
 
 __all__ = ["ArxivToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.arxiv.base": ["ArxivToolSpec"],
+    },
+)
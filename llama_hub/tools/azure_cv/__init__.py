@@ -1,7 +1,19 @@
 ## init
-from llama_hub.tools.azure_cv.base import (
-    AzureCVToolSpec,
-    CV_URL_TMPL,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.azure_cv.base import (
+        AzureCVToolSpec,
+        CV_URL_TMPL,
+    )
 
 __all__ = ["AzureCVToolSpec", "CV_URL_TMPL"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.azure_cv.base": ["AzureCVToolSpec", "CV_URL_TMPL"],
+    },
+)
@@ -1,6 +1,18 @@
 ## init file
-from llama_hub.tools.azure_speech.base import (
-    AzureSpeechToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.azure_speech.base import (
+        AzureSpeechToolSpec,
+    )
 
 __all__ = ["AzureSpeechToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.azure_speech.base": ["AzureSpeechToolSpec"],
+    },
+)
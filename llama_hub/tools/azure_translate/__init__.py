@@ -1,7 +1,22 @@
 ## init
-from llama_hub.tools.azure_translate.base import (
-    AzureTranslateToolSpec,
-    ENDPOINT_BASE_URL,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.azure_translate.base import (
+        AzureTranslateToolSpec,
+        ENDPOINT_BASE_URL,
+    )
 
 __all__ = ["AzureTranslateToolSpec", "ENDPOINT_BASE_URL"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.azure_translate.base": [
+            "AzureTranslateToolSpec",
+            "ENDPOINT_BASE_URL",
+        ],
+    },
+)
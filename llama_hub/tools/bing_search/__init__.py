@@ -1,7 +1,19 @@
 ## init
-from llama_hub.tools.bing_search.base import (
-    BingSearchToolSpec,
-    ENDPOINT_BASE_URL,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.bing_search.base import (
+        BingSearchToolSpec,
+        ENDPOINT_BASE_URL,
+    )
 
 __all__ = ["BingSearchToolSpec", "ENDPOINT_BASE_URL"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.bing_search.base": ["BingSearchToolSpec", "ENDPOINT_BASE_URL"],
+    },
+)
@@ -1,6 +1,18 @@
 """init.py"""
-from llama_hub.tools.chatgpt_plugin.base import (
-    ChatGPTPluginToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.chatgpt_plugin.base import (
+        ChatGPTPluginToolSpec,
+    )
 
 __all__ = ["ChatGPTPluginToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.chatgpt_plugin.base": ["ChatGPTPluginToolSpec"],
+    },
+)
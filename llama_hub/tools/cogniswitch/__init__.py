@@ -1,5 +1,17 @@
-from llama_hub.tools.cogniswitch.base import CogniswitchToolSpec
-
-__all__ = [
-    "CogniswitchToolSpec",
-]
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.cogniswitch.base import CogniswitchToolSpec
+
+__all__ = [
+    "CogniswitchToolSpec",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.cogniswitch.base": ["CogniswitchToolSpec"],
+    },
+)
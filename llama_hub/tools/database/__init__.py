@@ -1,6 +1,18 @@
 # __init__.py
-from llama_hub.tools.database.base import (
-    DatabaseToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.database.base import (
+        DatabaseToolSpec,
+    )
 
 __all__ = ["DatabaseToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.database.base": ["DatabaseToolSpec"],
+    },
+)
@@ -1,6 +1,18 @@
 ## init
-from llama_hub.tools.exa.base import (
-    ExaToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.exa.base import (
+        ExaToolSpec,
+    )
 
 __all__ = ["ExaToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.exa.base": ["ExaToolSpec"],
+    },
+)
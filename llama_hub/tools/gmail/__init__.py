@@ -1,7 +1,19 @@
 """__init__.py"""
-from llama_hub.tools.gmail.base import (
-    GmailToolSpec,
-    SCOPES,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.gmail.base import (
+        GmailToolSpec,
+        SCOPES,
+    )
 
 __all__ = ["GmailToolSpec", "SCOPES"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.gmail.base": ["GmailToolSpec", "SCOPES"],
+    },
+)
@@ -1,7 +1,19 @@
 """Google Calendar Tool Spec"""
-from llama_hub.tools.google_calendar.base import (
-    GoogleCalendarToolSpec,
-    SCOPES,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.google_calendar.base import (
+        GoogleCalendarToolSpec,
+        SCOPES,
+    )
 
 __all__ = ["GoogleCalendarToolSpec", "SCOPES"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.google_calendar.base": ["GoogleCalendarToolSpec", "SCOPES"],
+    },
+)
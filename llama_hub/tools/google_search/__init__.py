@@ -1,7 +1,22 @@
 # init
-from llama_hub.tools.google_search.base import (
-    GoogleSearchToolSpec,
-    QUERY_URL_TMPL,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.google_search.base import (
+        GoogleSearchToolSpec,
+        QUERY_URL_TMPL,
+    )
 
 __all__ = ["GoogleSearchToolSpec", "QUERY_URL_TMPL"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.google_search.base": [
+            "GoogleSearchToolSpec",
+            "QUERY_URL_TMPL",
+        ],
+    },
+)
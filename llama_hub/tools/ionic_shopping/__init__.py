@@ -1,6 +1,18 @@
 """Ionic Shopping Tool"""
-from llama_hub.tools.ionic_shopping.base import (
-    IonicShoppingToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.ionic_shopping.base import (
+        IonicShoppingToolSpec,
+    )
 
 __all__ = ["IonicShoppingToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.ionic_shopping.base": ["IonicShoppingToolSpec"],
+    },
+)
@@ -1,6 +1,18 @@
 ## init
-from llama_hub.tools.metaphor.base import (
-    MetaphorToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.metaphor.base import (
+        MetaphorToolSpec,
+    )
 
 __all__ = ["MetaphorToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.metaphor.base": ["MetaphorToolSpec"],
+    },
+)
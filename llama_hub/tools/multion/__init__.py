@@ -1,6 +1,18 @@
 ## init
-from llama_hub.tools.multion.base import (
-    MultionToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.multion.base import (
+        MultionToolSpec,
+    )
 
 __all__ = ["MultionToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.multion.base": ["MultionToolSpec"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.tools.neo4j_db.base import (
-    Neo4jQueryToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.neo4j_db.base import (
+        Neo4jQueryToolSpec,
+    )
 
 __all__ = ["Neo4jQueryToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.neo4j_db.base": ["Neo4jQueryToolSpec"],
+    },
+)
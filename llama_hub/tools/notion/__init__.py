@@ -1,12 +1,17 @@
 """Notion tool spec."""
-from llama_hub.tools.notion.base import (
-    BLOCK_CHILD_URL_TMPL,
-    DATABASE_URL_TMPL,
-    INTEGRATION_TOKEN_NAME,
-    NotionToolSpec,
-    SEARCH_URL,
-    UUID_REGEX,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.notion.base import (
+        BLOCK_CHILD_URL_TMPL,
+        DATABASE_URL_TMPL,
+        INTEGRATION_TOKEN_NAME,
+        NotionToolSpec,
+        SEARCH_URL,
+        UUID_REGEX,
+    )
 
 __all__ = [
     "BLOCK_CHILD_URL_TMPL",
@@ -16,3 +21,17 @@ __all__ = [
     "SEARCH_URL",
     "UUID_REGEX",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.notion.base": [
+            "BLOCK_CHILD_URL_TMPL",
+            "DATABASE_URL_TMPL",
+            "INTEGRATION_TOKEN_NAME",
+            "NotionToolSpec",
+            "SEARCH_URL",
+            "UUID_REGEX",
+        ],
+    },
+)
@@ -1,6 +1,20 @@
 ## init file
-from llama_hub.tools.openai_image_generation.base import (
-    OpenAIImageGenerationToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.openai_image_generation.base import (
+        OpenAIImageGenerationToolSpec,
+    )
 
 __all__ = ["OpenAIImageGenerationToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.openai_image_generation.base": [
+            "OpenAIImageGenerationToolSpec"
+        ],
+    },
+)
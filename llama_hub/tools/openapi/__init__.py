@@ -1,6 +1,18 @@
 # __init__.py
-from llama_hub.tools.openapi.base import (
-    OpenAPIToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.openapi.base import (
+        OpenAPIToolSpec,
+    )
 
 __all__ = ["OpenAPIToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.openapi.base": ["OpenAPIToolSpec"],
+    },
+)
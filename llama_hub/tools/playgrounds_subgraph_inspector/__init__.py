@@ -1,5 +1,19 @@
-from llama_hub.tools.playgrounds_subgraph_inspector.base import (
-    PlaygroundsSubgraphInspectorToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.playgrounds_subgraph_inspector.base import (
+        PlaygroundsSubgraphInspectorToolSpec,
+    )
 
 __all__ = ["PlaygroundsSubgraphInspectorToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.playgrounds_subgraph_inspector.base": [
+            "PlaygroundsSubgraphInspectorToolSpec"
+        ],
+    },
+)
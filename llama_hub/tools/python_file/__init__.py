@@ -1,6 +1,18 @@
 # init file
-from llama_hub.tools.python_file.base import (
-    PythonFileToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.python_file.base import (
+        PythonFileToolSpec,
+    )
 
 __all__ = ["PythonFileToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.python_file.base": ["PythonFileToolSpec"],
+    },
+)
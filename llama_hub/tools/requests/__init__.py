@@ -1,7 +1,19 @@
 #
-from llama_hub.tools.requests.base import (
-    INVALID_URL_PROMPT,
-    RequestsToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.requests.base import (
+        INVALID_URL_PROMPT,
+        RequestsToolSpec,
+    )
 
 __all__ = ["INVALID_URL_PROMPT", "RequestsToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.requests.base": ["INVALID_URL_PROMPT", "RequestsToolSpec"],
+    },
+)
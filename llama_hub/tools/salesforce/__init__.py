@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.tools.salesforce.base import (
-    SalesforceToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.salesforce.base import (
+        SalesforceToolSpec,
+    )
 
 __all__ = ["SalesforceToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.salesforce.base": ["SalesforceToolSpec"],
+    },
+)
@@ -1,6 +1,18 @@
 ## Init.py
-from llama_hub.tools.shopify.base import (
-    ShopifyToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.shopify.base import (
+        ShopifyToolSpec,
+    )
 
 __all__ = ["ShopifyToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.shopify.base": ["ShopifyToolSpec"],
+    },
+)
@@ -1,6 +1,18 @@
 # __init__.py
-from llama_hub.tools.slack.base import (
-    SlackToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.slack.base import (
+        SlackToolSpec,
+    )
 
 __all__ = ["SlackToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.slack.base": ["SlackToolSpec"],
+    },
+)
@@ -1,6 +1,18 @@
 # init
-from llama_hub.tools.tavily_research.base import (
-    TavilyToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.tavily_research.base import (
+        TavilyToolSpec,
+    )
 
 __all__ = ["TavilyToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.tavily_research.base": ["TavilyToolSpec"],
+    },
+)
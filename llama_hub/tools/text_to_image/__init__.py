@@ -1,6 +1,18 @@
 ## Init.py
-from llama_hub.tools.text_to_image.base import (
-    TextToImageToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.text_to_image.base import (
+        TextToImageToolSpec,
+    )
 
 __all__ = ["TextToImageToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.text_to_image.base": ["TextToImageToolSpec"],
+    },
+)
@@ -1,7 +1,19 @@
 # init
-from llama_hub.tools.vector_db.base import (
-    VectorDB,
-    VectorDBToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.vector_db.base import (
+        VectorDB,
+        VectorDBToolSpec,
+    )
 
 __all__ = ["VectorDB", "VectorDBToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.vector_db.base": ["VectorDB", "VectorDBToolSpec"],
+    },
+)
@@ -1,5 +1,17 @@
-from llama_hub.tools.weather.base import (
-    OpenWeatherMapToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.weather.base import (
+        OpenWeatherMapToolSpec,
+    )
 
 __all__ = ["OpenWeatherMapToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.weather.base": ["OpenWeatherMapToolSpec"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.tools.wikipedia.base import (
-    WikipediaToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.wikipedia.base import (
+        WikipediaToolSpec,
+    )
 
 __all__ = ["WikipediaToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.wikipedia.base": ["WikipediaToolSpec"],
+    },
+)
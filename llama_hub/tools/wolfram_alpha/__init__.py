@@ -1,7 +1,22 @@
 # init
-from llama_hub.tools.wolfram_alpha.base import (
-    QUERY_URL_TMPL,
-    WolframAlphaToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.wolfram_alpha.base import (
+        QUERY_URL_TMPL,
+        WolframAlphaToolSpec,
+    )
 
 __all__ = ["QUERY_URL_TMPL", "WolframAlphaToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.wolfram_alpha.base": [
+            "QUERY_URL_TMPL",
+            "WolframAlphaToolSpec",
+        ],
+    },
+)
@@ -1,7 +1,19 @@
 """Init file."""
-from llama_hub.tools.zapier.base import (
-    ACTION_URL_TMPL,
-    ZapierToolSpec,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.tools.zapier.base import (
+        ACTION_URL_TMPL,
+        ZapierToolSpec,
+    )
 
 __all__ = ["ACTION_URL_TMPL", "ZapierToolSpec"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.tools.zapier.base": ["ACTION_URL_TMPL", "ZapierToolSpec"],
+    },
+)
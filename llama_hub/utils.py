@@ -2,20 +2,30 @@
 
 import importlib
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Type
+from typing import Any, Dict, Type
 
 from llama_index.readers.base import BaseReader
 
 LIBRARY_JSON_PATH = Path(__file__).parent / "library.json"
 
 
+@lru_cache(maxsize=None)
+def load_library() -> Dict[str, Any]:
+    """Load the library json manifest, parsing it only once per process."""
+    with open(LIBRARY_JSON_PATH, "r") as json_file:
+        return json.load(json_file)
+
+
+@lru_cache(maxsize=None)
 def import_loader(reader_str: str) -> Type[BaseReader]:
-    """Import or download loader."""
+    """Import or download loader.
 
-    # read library json file
-    with open(LIBRARY_JSON_PATH, "r") as json_file:
-        json_dict = json.load(json_file)
+    Resolved loader classes are memoized, so repeated lookups of the same
+    loader neither re-read the manifest nor re-import the module.
+    """
+    json_dict = load_library()
 
     dir_name = str(json_dict[reader_str]["id"])
 
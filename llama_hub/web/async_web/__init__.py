@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.web.async_web.base import (
-    AsyncWebPageReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.web.async_web.base import (
+        AsyncWebPageReader,
+    )
 
-__all__ = ["AsyncWebPageReader"]
+__all__ = ["AsyncWebPageReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.web.async_web.base": ["AsyncWebPageReader"],
+    },
+)
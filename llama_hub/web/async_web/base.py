@@ -1,12 +1,19 @@
 import asyncio
 import logging
-from typing import List
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, AsyncIterator, List, Optional, Tuple
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+if TYPE_CHECKING:
+    from llama_hub.http_cache import HTTPCache
+
 logger = logging.getLogger(__name__)
 
+# statuses worth retrying, as the server may succeed on a later attempt
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
 
 class AsyncWebPageReader(BaseReader):
     """Asynchronous web page reader.
@@ -19,6 +26,18 @@ class AsyncWebPageReader(BaseReader):
         limit (int): Maximum number of concurrent requests.
         dedupe (bool): to deduplicate urls if there is exact-match within given list
         fail_on_error (bool): if requested url does not return status code 200 the routine will raise an ValueError
+        max_connections_per_host (int): Maximum number of concurrent requests to
+            the same host. 0 (the default) means no limit besides `limit`.
+        max_retries (int): Number of times a request failing with a connection
+            error, a timeout or a transient status (429, 5xx) is retried.
+        retry_backoff (float): Seconds to wait before the first retry, doubled
+            on each following one.
+        timeout (Optional[float]): Total timeout in seconds of each request.
+        text_workers (Optional[int]): Number of processes converting HTML to
+            text. Pages are converted in a thread if None or 1.
+        http_cache (Optional[HTTPCache]): Cache revalidating the pages with
+            conditional requests, and storing their text so that unchanged
+            pages are not converted again.
     """
 
     def __init__(
@@ -27,6 +46,12 @@ class AsyncWebPageReader(BaseReader):
         limit: int = 10,
         dedupe: bool = True,
         fail_on_error: bool = False,
+        max_connections_per_host: int = 0,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        timeout: Optional[float] = None,
+        text_workers: Optional[int] = None,
+        http_cache: Optional["HTTPCache"] = None,
     ) -> None:
         """Initialize with parameters."""
 
@@ -46,71 +71,216 @@ class AsyncWebPageReader(BaseReader):
         self._html_to_text = html_to_text
         self._dedupe = dedupe
         self._fail_on_error = fail_on_error
+        self._max_connections_per_host = max_connections_per_host
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+        self._timeout = timeout
+        self._text_workers = text_workers
+        self._http_cache = http_cache
 
-    def load_data(self, urls: List[str]) -> List[Document]:
-        """Load data from the input urls.
+    async def _get(self, session: Any, url: str) -> Tuple[int, str, str, bool, bool]:
+        """Fetch a page once, through the HTTP cache if there is one."""
+        if self._http_cache is not None:
+            response = await self._http_cache.aget(session, url)
+            return (
+                response.status,
+                response.url,
+                response.text,
+                response.from_cache,
+                response.stored,
+            )
 
-        Args:
-            urls (List[str]): List of URLs to scrape.
+        async with session.get(url) as response:
+            return (
+                response.status,
+                str(response.url),
+                await response.text(),
+                False,
+                False,
+            )
+
+    async def _fetch(self, session: Any, url: str) -> Tuple[int, str, str, bool, bool]:
+        """Fetch a page, retrying transient errors with exponential backoff.
 
         Returns:
-            List[Document]: List of documents.
+            Tuple[int, str, str, bool, bool]: Status, final URL and body of the
+                last response, whether the body was served from the HTTP cache
+                and whether it is stored in it.
+        """
+        import aiohttp
+
+        attempt = 0
+        while True:
+            try:
+                page = await self._get(session, url)
+                status = page[0]
+                if status not in RETRY_STATUS_CODES or attempt == self._max_retries:
+                    return page
+                logger.info(f"retrying {url} after status {status}")
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt == self._max_retries:
+                    raise ValueError(f"error fetching page from {url}: {e!r}") from e
+                logger.info(f"retrying {url} after {e!r}")
+            except Exception as e:
+                raise ValueError(f"One of the inputs is not a valid url: {url}") from e
+            await asyncio.sleep(self._retry_backoff * 2**attempt)
+            attempt += 1
 
+    async def _load_page(
+        self, session: Any, url: str, executor: Optional[Executor]
+    ) -> Optional[Document]:
+        """Fetch a page and build its document, or None if it failed."""
+        status, source, raw_page, from_cache, stored = await self._fetch(session, url)
+
+        if status != 200:
+            logger.warning(f"error fetching page from {url}")
+            logger.info(f"status {status}: {raw_page}")
+
+            if self._fail_on_error:
+                raise ValueError(
+                    f"error fetching page from {url}. server returned status:"
+                    f" {status} and response {raw_page}"
+                )
+
+            return None
+
+        if self._html_to_text:
+            import html2text
+
+            loop = asyncio.get_running_loop()
+            response_text = None
+            if from_cache:
+                response_text = await loop.run_in_executor(
+                    None, self._http_cache.load_derived, url, "html2text"
+                )
+            if response_text is None:
+                # the conversion is CPU bound, keep it off the event loop
+                response_text = await loop.run_in_executor(
+                    executor, html2text.html2text, raw_page
+                )
+                if stored:
+                    await loop.run_in_executor(
+                        None,
+                        self._http_cache.store_derived,
+                        url,
+                        "html2text",
+                        response_text,
+                    )
+        else:
+            response_text = raw_page
+
+        return Document(text=response_text, extra_info={"Source": source})
+
+    async def _aload_indexed(
+        self, urls: List[str]
+    ) -> AsyncIterator[Tuple[int, Document]]:
+        """Yield the documents of the urls with their index, as pages complete.
+
+        `limit` workers fetch the urls and hand their documents over a queue
+        of the same size, so that at most a few pages wait in memory for the
+        consumer.
         """
+        import aiohttp
+
+        if not isinstance(urls, list):
+            raise ValueError("urls must be a list of strings.")
         if self._dedupe:
             urls = list(dict.fromkeys(urls))
 
-        import aiohttp
+        executor: Optional[Executor] = None
+        if self._html_to_text and self._text_workers and self._text_workers > 1:
+            executor = ProcessPoolExecutor(self._text_workers)
 
-        def chunked_http_client(limit: int):
-            semaphore = asyncio.Semaphore(limit)
+        pending = iter(enumerate(urls))
+        results: asyncio.Queue = asyncio.Queue(maxsize=self._limit)
 
-            async def http_get(url: str, session: aiohttp.ClientSession):
-                async with semaphore:
-                    async with session.get(url) as response:
-                        return response, await response.text()
+        session_kwargs: dict = {}
+        if self._timeout is not None:
+            session_kwargs["timeout"] = aiohttp.ClientTimeout(total=self._timeout)
+        connector = aiohttp.TCPConnector(
+            limit=self._limit, limit_per_host=self._max_connections_per_host
+        )
 
-            return http_get
+        async def worker(session: aiohttp.ClientSession) -> None:
+            try:
+                for i, url in pending:
+                    document = await self._load_page(session, url, executor)
+                    await results.put((i, document, None))
+            except Exception as e:
+                await results.put((None, None, e))
+            finally:
+                await results.put(None)
 
-        async def fetch_urls(urls: List[str]):
-            http_client = chunked_http_client(self._limit)
-            async with aiohttp.ClientSession() as session:
-                tasks = [http_client(url, session) for url in urls]
-                return await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            async with aiohttp.ClientSession(
+                connector=connector, **session_kwargs
+            ) as session:
+                num_workers = max(min(self._limit, len(urls)), 1)
+                workers = [
+                    asyncio.create_task(worker(session)) for _ in range(num_workers)
+                ]
+                try:
+                    while num_workers:
+                        result = await results.get()
+                        if result is None:
+                            num_workers -= 1
+                            continue
+                        i, document, error = result
+                        if error is not None:
+                            raise error
+                        if document is not None:
+                            yield i, document
+                finally:
+                    for task in workers:
+                        task.cancel()
+                    await asyncio.gather(*workers, return_exceptions=True)
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
-        if not isinstance(urls, list):
-            raise ValueError("urls must be a list of strings.")
+    async def alazy_load_data(self, urls: List[str]) -> AsyncIterator[Document]:
+        """Yield the documents of the input urls as their pages complete.
 
-        documents = []
-        responses = asyncio.run(fetch_urls(urls))
+        Args:
+            urls (List[str]): List of URLs to scrape.
 
-        for i, response_tuple in enumerate(responses):
-            if not isinstance(response_tuple, tuple):
-                raise ValueError(f"One of the inputs is not a valid url: {urls[i]}")
+        Returns:
+            AsyncIterator[Document]: Documents, in completion order.
 
-            response, raw_page = response_tuple
+        """
+        async for _, document in self._aload_indexed(urls):
+            yield document
 
-            if response.status != 200:
-                logger.warning(f"error fetching page from {urls[i]}")
-                logger.info(response)
+    async def aload_data(self, urls: List[str]) -> List[Document]:
+        """Load data from the input urls asynchronously.
 
-                if self._fail_on_error:
-                    raise ValueError(
-                        f"error fetching page from {urls[i]}. server returned status:"
-                        f" {response.status} and response {raw_page}"
-                    )
+        Args:
+            urls (List[str]): List of URLs to scrape.
 
-                continue
+        Returns:
+            List[Document]: List of documents, in the order of the urls.
 
-            if self._html_to_text:
-                import html2text
+        """
+        documents = [item async for item in self._aload_indexed(urls)]
+        return [document for _, document in sorted(documents, key=lambda x: x[0])]
 
-                response_text = html2text.html2text(raw_page)
-            else:
-                response_text = raw_page
+    def load_data(self, urls: List[str]) -> List[Document]:
+        """Load data from the input urls.
 
-            documents.append(
-                Document(text=response_text, extra_info={"Source": str(response.url)})
-            )
+        Can be called from inside a running event loop, in which case the
+        pages are loaded on a separate thread.
+
+        Args:
+            urls (List[str]): List of URLs to scrape.
+
+        Returns:
+            List[Document]: List of documents.
+
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.aload_data(urls))
 
-        return documents
+        with ThreadPoolExecutor(1) as executor:
+            return executor.submit(asyncio.run, self.aload_data(urls)).result()
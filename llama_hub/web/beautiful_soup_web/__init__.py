@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.web.beautiful_soup_web.base import (
-    BeautifulSoupWebReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.web.beautiful_soup_web.base import (
+        BeautifulSoupWebReader,
+    )
 
 __all__ = ["BeautifulSoupWebReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.web.beautiful_soup_web.base": ["BeautifulSoupWebReader"],
+    },
+)
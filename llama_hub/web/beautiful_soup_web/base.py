@@ -1,12 +1,15 @@
 """Beautiful Soup Web scraper."""
 
 import logging
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+if TYPE_CHECKING:
+    from llama_hub.http_cache import HTTPCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -141,14 +144,19 @@ class BeautifulSoupWebReader(BaseReader):
         website_extractor (Optional[Dict[str, Callable]]): A mapping of website
             hostname (e.g. google.com) to a function that specifies how to
             extract text from the BeautifulSoup obj. See DEFAULT_WEBSITE_EXTRACTOR.
+        http_cache (Optional[HTTPCache]): Cache revalidating the pages with
+            conditional requests. The text of pages read without a website
+            extractor is stored too, and reused while they are unchanged.
     """
 
     def __init__(
         self,
         website_extractor: Optional[Dict[str, Callable]] = None,
+        http_cache: Optional["HTTPCache"] = None,
     ) -> None:
         """Initialize with parameters."""
         self.website_extractor = website_extractor or DEFAULT_WEBSITE_EXTRACTOR
+        self.http_cache = http_cache
 
     def load_data(
         self,
@@ -176,13 +184,27 @@ class BeautifulSoupWebReader(BaseReader):
         documents = []
         for url in urls:
             try:
-                page = requests.get(url)
+                if self.http_cache is None:
+                    content = requests.get(url).content
+                    from_cache, stored = False, False
+                else:
+                    page = self.http_cache.get(requests, url)
+                    content = page.content
+                    from_cache, stored = page.from_cache, page.stored
             except Exception:
                 raise ValueError(f"One of the inputs is not a valid url: {url}")
 
             hostname = custom_hostname or urlparse(url).hostname or ""
 
-            soup = BeautifulSoup(page.content, "html.parser")
+            # website extractors may fetch other pages, so only the text of
+            # pages read whole is reused
+            if from_cache and hostname not in self.website_extractor:
+                data = self.http_cache.load_derived(url, "BeautifulSoupWebReader")
+                if data is not None:
+                    documents.append(Document(text=data, extra_info={"URL": url}))
+                    continue
+
+            soup = BeautifulSoup(content, "html.parser")
 
             data = ""
             extra_info = {"URL": url}
@@ -194,6 +216,8 @@ class BeautifulSoupWebReader(BaseReader):
 
             else:
                 data = soup.getText()
+                if stored:
+                    self.http_cache.store_derived(url, "BeautifulSoupWebReader", data)
 
             documents.append(Document(text=data, extra_info=extra_info))
 
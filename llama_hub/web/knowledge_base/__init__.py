@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.web.knowledge_base.base import (
-    KnowledgeBaseWebReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.web.knowledge_base.base import (
+        KnowledgeBaseWebReader,
+    )
 
 __all__ = ["KnowledgeBaseWebReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.web.knowledge_base.base": ["KnowledgeBaseWebReader"],
+    },
+)
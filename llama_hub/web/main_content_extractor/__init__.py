@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.web.main_content_extractor.base import (
-    MainContentExtractorReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.web.main_content_extractor.base import (
+        MainContentExtractorReader,
+    )
 
 __all__ = ["MainContentExtractorReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.web.main_content_extractor.base": ["MainContentExtractorReader"],
+    },
+)
@@ -1,3 +1,15 @@
-from .base import NewsArticleReader
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import NewsArticleReader
 
 __all__ = ["NewsArticleReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".base": ["NewsArticleReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.web.readability_web.base import (
-    ReadabilityWebPageReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.web.readability_web.base import (
+        ReadabilityWebPageReader,
+    )
 
 __all__ = ["ReadabilityWebPageReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.web.readability_web.base": ["ReadabilityWebPageReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.web.rss.base import (
-    RssReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.web.rss.base import (
+        RssReader,
+    )
 
 __all__ = ["RssReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.web.rss.base": ["RssReader"],
+    },
+)
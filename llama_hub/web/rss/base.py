@@ -1,6 +1,8 @@
 """Rss reader."""
 
-from typing import List
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
@@ -13,12 +15,23 @@ class RssReader(BaseReader):
 
     """
 
-    def __init__(self, html_to_text: bool = False) -> None:
+    def __init__(
+        self,
+        html_to_text: bool = False,
+        num_workers: int = 1,
+        text_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
         """Initialize with parameters.
 
         Args:
             html_to_text (bool): Whether to convert HTML to text.
                 Requires `html2text` package.
+            num_workers (int): Number of threads fetching feeds at the same
+                time, over a shared pool of keep-alive connections. 1 by default.
+            text_workers (Optional[int]): Number of processes converting HTML to
+                text. Entries are converted in the current process if None or 1.
+            timeout (Optional[float]): Timeout in seconds for fetching a feed.
 
         """
         try:
@@ -36,6 +49,41 @@ class RssReader(BaseReader):
                     "`html2text` package not found, please run `pip install html2text`"
                 )
         self._html_to_text = html_to_text
+        self._num_workers = max(num_workers, 1)
+        self._text_workers = text_workers
+        self._timeout = timeout
+
+    def _fetch_feeds(self, urls: List[str]) -> List[Any]:
+        """Fetch and parse feeds concurrently over a shared session, in order."""
+        import feedparser
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        with requests.Session() as session, ThreadPoolExecutor(
+            self._num_workers
+        ) as executor:
+            adapter = HTTPAdapter(
+                pool_connections=self._num_workers, pool_maxsize=self._num_workers
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers["User-Agent"] = feedparser.USER_AGENT
+
+            def fetch(url: str) -> Any:
+                try:
+                    response = session.get(url, timeout=self._timeout)
+                except requests.RequestException as e:
+                    # like feedparser.parse(url), a dead feed is a bozo result
+                    return feedparser.FeedParserDict(
+                        entries=[], bozo=True, bozo_exception=e
+                    )
+                # feedparser looks up lowercase headers, for the feed's encoding
+                # and the URL relative links are resolved against
+                headers = {k.lower(): v for k, v in response.headers.items()}
+                headers["content-location"] = response.url
+                return feedparser.parse(response.content, response_headers=headers)
+
+            return list(executor.map(fetch, urls))
 
     def load_data(self, urls: List[str]) -> List[Document]:
         """Load data from RSS feeds.
@@ -47,27 +95,32 @@ class RssReader(BaseReader):
             List[Document]: List of documents.
 
         """
-        import feedparser
-
         if not isinstance(urls, list):
             raise ValueError("urls must be a list of strings.")
 
-        documents = []
+        texts = []
+        extra_infos = []
 
-        for url in urls:
-            parsed = feedparser.parse(url)
+        for parsed in self._fetch_feeds(urls):
             for entry in parsed.entries:
                 if "content" in entry:
                     data = entry.content[0].value
                 else:
                     data = entry.description or entry.summary
 
-                if self._html_to_text:
-                    import html2text
+                texts.append(data)
+                extra_infos.append({"title": entry.title, "link": entry.link})
 
-                    data = html2text.html2text(data)
+        if self._html_to_text:
+            import html2text
 
-                extra_info = {"title": entry.title, "link": entry.link}
-                documents.append(Document(text=data, extra_info=extra_info))
+            if self._text_workers is not None and self._text_workers > 1:
+                with multiprocessing.Pool(self._text_workers) as pool:
+                    texts = pool.map(html2text.html2text, texts)
+            else:
+                texts = [html2text.html2text(text) for text in texts]
 
-        return documents
+        return [
+            Document(text=text, extra_info=extra_info)
+            for text, extra_info in zip(texts, extra_infos)
+        ]
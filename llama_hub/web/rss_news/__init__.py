@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.web.rss_news.base import (
-    RssNewsReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.web.rss_news.base import (
+        RssNewsReader,
+    )
 
-__all__ = ["RssNewsReader"]
+__all__ = ["RssNewsReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.web.rss_news.base": ["RssNewsReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.web.simple_web.base import (
-    SimpleWebPageReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.web.simple_web.base import (
+        SimpleWebPageReader,
+    )
 
 __all__ = ["SimpleWebPageReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.web.simple_web.base": ["SimpleWebPageReader"],
+    },
+)
@@ -1,10 +1,25 @@
 """Simple Web scraper."""
-from typing import List
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple
 
 import requests
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+if TYPE_CHECKING:
+    from llama_hub.http_cache import HTTPCache
+
+
+def _page_to_text(page: Tuple[str, bool, bool]) -> Tuple[str, bool, bool]:
+    """Convert a page from HTML to text, unless it is already converted."""
+    import html2text
+
+    content, converted, stored = page
+    if not converted:
+        content = html2text.html2text(content)
+    return content, converted, stored
+
 
 class SimpleWebPageReader(BaseReader):
     """Simple web page reader.
@@ -14,12 +29,74 @@ class SimpleWebPageReader(BaseReader):
     Args:
         html_to_text (bool): Whether to convert HTML to text.
             Requires `html2text` package.
+        num_workers (int): Number of threads fetching pages at the same time,
+            over a shared pool of keep-alive connections. 1 by default.
+        text_workers (Optional[int]): Number of processes converting HTML to
+            text while pages are fetched. Pages are converted in the current
+            process if None or 1.
+        timeout (Optional[float]): Timeout in seconds for fetching a page.
+        http_cache (Optional[HTTPCache]): Cache revalidating the pages with
+            conditional requests, and storing their text so that unchanged
+            pages are not converted again.
 
     """
 
-    def __init__(self, html_to_text: bool = False) -> None:
+    def __init__(
+        self,
+        html_to_text: bool = False,
+        num_workers: int = 1,
+        text_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        http_cache: Optional["HTTPCache"] = None,
+    ) -> None:
         """Initialize with parameters."""
         self._html_to_text = html_to_text
+        self._num_workers = max(num_workers, 1)
+        self._text_workers = text_workers
+        self._timeout = timeout
+        self._http_cache = http_cache
+
+    def _fetch_pages(self, urls: List[str]) -> Iterator[Tuple[str, bool, bool]]:
+        """Fetch pages concurrently over a shared session, in order.
+
+        Pages are yielded with whether they were already converted to text,
+        and whether their body is stored in the HTTP cache.
+        """
+        from requests.adapters import HTTPAdapter
+
+        with requests.Session() as session, ThreadPoolExecutor(
+            self._num_workers
+        ) as executor:
+            adapter = HTTPAdapter(
+                pool_connections=self._num_workers, pool_maxsize=self._num_workers
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+
+            def fetch(url: str) -> Tuple[str, bool, bool]:
+                if self._http_cache is None:
+                    return session.get(url, timeout=self._timeout).text, False, False
+
+                response = self._http_cache.get(session, url, timeout=self._timeout)
+                if self._html_to_text and response.from_cache:
+                    text = self._http_cache.load_derived(url, "html2text")
+                    if text is not None:
+                        return text, True, True
+                return response.text, False, response.stored
+
+            yield from executor.map(fetch, urls)
+
+    def _to_text(
+        self, pages: Iterable[Tuple[str, bool, bool]]
+    ) -> Iterator[Tuple[str, bool, bool]]:
+        """Convert pages from HTML to text, in worker processes if configured."""
+        if self._text_workers is not None and self._text_workers > 1:
+            # pages are handed to the workers as they are fetched
+            with multiprocessing.Pool(self._text_workers) as pool:
+                yield from pool.imap(_page_to_text, pages)
+        else:
+            for page in pages:
+                yield _page_to_text(page)
 
     def load_data(self, urls: List[str]) -> List[Document]:
         """Load data from the input directory.
@@ -34,14 +111,15 @@ class SimpleWebPageReader(BaseReader):
         if not isinstance(urls, list):
             raise ValueError("urls must be a list of strings.")
 
-        documents = []
-        for url in urls:
-            response = requests.get(url).text
-            if self._html_to_text:
-                import html2text
-
-                response = html2text.html2text(response)
+        pages = self._fetch_pages(urls)
+        if self._html_to_text:
+            pages = self._to_text(pages)
 
-            documents.append(Document(text=response))
+        documents = []
+        for url, (page, converted, stored) in zip(urls, pages):
+            # only the text of the stored body is valid when it is revalidated
+            if self._html_to_text and stored and not converted:
+                self._http_cache.store_derived(url, "html2text", page)
+            documents.append(Document(text=page))
 
         return documents
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.web.sitemap.base import (
-    SitemapReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.web.sitemap.base import (
+        SitemapReader,
+    )
 
-__all__ = ["SitemapReader"]
+__all__ = ["SitemapReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.web.sitemap.base": ["SitemapReader"],
+    },
+)
@@ -1,28 +1,147 @@
-import urllib.request
+import asyncio
+import json
+import logging
+import os
+import tempfile
 import xml.etree.ElementTree as ET
-from typing import List
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from llama_index import download_loader
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+if TYPE_CHECKING:
+    from llama_hub.http_cache import HTTPCache
+
+logger = logging.getLogger(__name__)
+
+# size of the chunks sitemaps are downloaded and parsed by
+SITEMAP_READ_SIZE = 64 * 1024
+
+# a sitemap entry: its tag ("url" or "sitemap"), location and last modification
+SitemapEntry = Tuple[str, str, Optional[datetime]]
+
+
+def _local_name(tag: str) -> str:
+    """Tag name without its namespace."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _parse_lastmod(value: Optional[str]) -> Optional[datetime]:
+    """Parse a W3C datetime of a `<lastmod>`, as UTC if it has no timezone."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        lastmod = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if lastmod.tzinfo is None:
+        lastmod = lastmod.replace(tzinfo=timezone.utc)
+    return lastmod
+
+
+class _SitemapParser:
+    """Incremental parser of sitemaps and sitemap indexes, gzipped or not.
+
+    Entries are returned as soon as their element is parsed, and removed from
+    the tree, so that memory use does not grow with the size of the sitemap.
+    """
+
+    def __init__(self) -> None:
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._decompressor: Optional[Any] = None
+        self._started = False
+        self._root: Optional[ET.Element] = None
+
+    def feed(self, data: bytes) -> List[SitemapEntry]:
+        if not data:
+            return []
+        if not self._started:
+            self._started = True
+            # gzipped sitemaps are usually served as files, not content encoded
+            if data[:2] == b"\x1f\x8b":
+                self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if self._decompressor is not None:
+            data = self._decompressor.decompress(data)
+        self._parser.feed(data)
+        return self._read_entries()
+
+    def close(self) -> List[SitemapEntry]:
+        if self._decompressor is not None:
+            self._parser.feed(self._decompressor.flush())
+        self._parser.close()
+        return self._read_entries()
+
+    def _read_entries(self) -> List[SitemapEntry]:
+        entries = []
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = elem
+                continue
+
+            tag = _local_name(elem.tag)
+            if tag not in ("url", "sitemap"):
+                continue
+            loc, lastmod = None, None
+            for child in elem:
+                name = _local_name(child.tag)
+                if name == "loc":
+                    loc = (child.text or "").strip()
+                elif name == "lastmod":
+                    lastmod = _parse_lastmod(child.text)
+            if loc:
+                entries.append((tag, loc, lastmod))
+
+            elem.clear()
+            if self._root is not None:
+                try:
+                    self._root.remove(elem)
+                except ValueError:
+                    # not a direct child of the root
+                    pass
+        return entries
+
 
 class SitemapReader(BaseReader):
     """Asynchronous sitemap reader for web.
 
-    Reads pages from the web based on their sitemap.xml.
+    Reads pages from the web based on their sitemap.xml. Sitemap indexes are
+    followed, fetching the sitemaps they list concurrently, and sitemaps are
+    parsed as they are downloaded, whether they are gzipped or not.
 
     Args:
         sitemap_url (string): Path to the sitemap.xml. e.g. https://gpt-index.readthedocs.io/sitemap.xml
         html_to_text (bool): Whether to convert HTML to text.
             Requires `html2text` package.
         limit (int): Maximum number of concurrent requests.
+        http_cache (Optional[HTTPCache]): Cache revalidating the sitemap and
+            its pages with conditional requests.
+        watermark_path (Optional[Union[str, Path]]): JSON file recording the
+            newest `<lastmod>` seen in each sitemap, and the pages that failed
+            to load. When set, only the pages (and sitemaps of an index)
+            modified since the previous load are fetched, along with those
+            without a `<lastmod>` and those that failed before. Nothing is
+            recorded when a sitemap of an index failed to load.
 
     """
 
     xml_schema_sitemap = "http://www.sitemaps.org/schemas/sitemap/0.9"
 
-    def __init__(self, html_to_text: bool = False, limit: int = 10) -> None:
+    def __init__(
+        self,
+        html_to_text: bool = False,
+        limit: int = 10,
+        http_cache: Optional["HTTPCache"] = None,
+        watermark_path: Optional[Union[str, Path]] = None,
+    ) -> None:
         """Initialize with parameters."""
 
         try:
@@ -32,29 +151,180 @@ class SitemapReader(BaseReader):
         except ImportError:
             AsyncWebPageReader = download_loader("AsyncWebPageReader")
 
-        self._async_loader = AsyncWebPageReader(html_to_text=html_to_text, limit=limit)
+        self._async_loader = AsyncWebPageReader(
+            html_to_text=html_to_text, limit=limit, http_cache=http_cache
+        )
         self._html_to_text = html_to_text
         self._limit = limit
+        self._http_cache = http_cache
+        self._watermark_path = Path(watermark_path) if watermark_path else None
+
+    def _load_watermarks(self) -> Dict[str, Dict[str, str]]:
+        """Load the watermarks, by sitemap URL and filter."""
+        if self._watermark_path is None or not self._watermark_path.exists():
+            return {}
+        with open(self._watermark_path, "r") as f:
+            return json.load(f)
+
+    def _load_watermark(
+        self, sitemap_url: str, filter_locs: Optional[str]
+    ) -> Tuple[Optional[datetime], List[str]]:
+        """Load the watermark of a sitemap and the pages that failed to load."""
+        state = self._load_watermarks().get(sitemap_url, {}).get(filter_locs or "")
+        if isinstance(state, str):
+            # recorded before failed pages were
+            state = {"watermark": state}
+        state = state or {}
+        return _parse_lastmod(state.get("watermark")), state.get("failed", [])
+
+    def _save_watermark(
+        self,
+        sitemap_url: str,
+        filter_locs: Optional[str],
+        watermark: Optional[datetime],
+        failed: List[str],
+    ) -> None:
+        assert self._watermark_path is not None
+        watermarks = self._load_watermarks()
+        watermarks.setdefault(sitemap_url, {})[filter_locs or ""] = {
+            "watermark": watermark.isoformat() if watermark else None,
+            "failed": failed,
+        }
+        # replace the file at once, so that an interrupted save loses nothing
+        fd, tmp_path = tempfile.mkstemp(dir=self._watermark_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(watermarks, f, indent=2)
+        os.replace(tmp_path, self._watermark_path)
+
+    async def _read_sitemap(self, session: Any, sitemap_url: str) -> List[SitemapEntry]:
+        """Download and parse a sitemap, chunk by chunk."""
+        parser = _SitemapParser()
+        entries = []
+        if self._http_cache is not None:
+            response = await self._http_cache.aget(session, sitemap_url)
+            if response.status != 200:
+                raise ValueError(
+                    f"error fetching sitemap {sitemap_url}: server returned status"
+                    f" {response.status}"
+                )
+            for start in range(0, len(response.content), SITEMAP_READ_SIZE):
+                chunk = response.content[start : start + SITEMAP_READ_SIZE]
+                entries.extend(parser.feed(chunk))
+        else:
+            async with session.get(sitemap_url) as response:
+                if response.status != 200:
+                    raise ValueError(
+                        f"error fetching sitemap {sitemap_url}: server returned"
+                        f" status {response.status}"
+                    )
+                async for chunk in response.content.iter_chunked(SITEMAP_READ_SIZE):
+                    entries.extend(parser.feed(chunk))
+        entries.extend(parser.close())
+        return entries
+
+    async def _collect_urls(
+        self, sitemap_url: str, watermark: Optional[datetime]
+    ) -> Tuple[Dict[str, Optional[datetime]], bool]:
+        """Collect the pages of a sitemap, following sitemap indexes.
+
+        The sitemaps listed by an index are read concurrently, a level at a
+        time. Entries not modified since the watermark are skipped, and so are
+        the sitemaps of an index that fail to load, after logging the error.
 
-    def _load_sitemap(self, sitemap_url: str) -> str:
-        sitemap_url_request = urllib.request.urlopen(sitemap_url)
+        Returns:
+            Tuple[Dict[str, Optional[datetime]], bool]: Last modification of
+                each page, in the order of the sitemaps, and whether every
+                sitemap of the index was read.
+        """
+        import aiohttp
 
-        return sitemap_url_request.read()
+        urls: Dict[str, Optional[datetime]] = {}
+        visited = {sitemap_url}
+        sitemaps = [sitemap_url]
+        complete = True
 
-    def _parse_sitemap(self, raw_sitemap: str, filter_locs: str = None) -> list:
-        sitemap = ET.fromstring(raw_sitemap)
-        sitemap_urls = []
+        connector = aiohttp.TCPConnector(limit=self._limit)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            while sitemaps:
+                results = await asyncio.gather(
+                    *(self._read_sitemap(session, url) for url in sitemaps),
+                    return_exceptions=True,
+                )
+                level, sitemaps = sitemaps, []
+                for url, entries in zip(level, results):
+                    if isinstance(entries, Exception):
+                        if url == sitemap_url:
+                            raise entries
+                        logger.warning(f"skipping sitemap {url}: {entries}")
+                        complete = False
+                        continue
+                    for tag, loc, lastmod in entries:
+                        if watermark and lastmod and lastmod <= watermark:
+                            continue
+                        if tag == "url":
+                            urls.setdefault(loc, lastmod)
+                        elif loc not in visited:
+                            visited.add(loc)
+                            sitemaps.append(loc)
 
-        for url in sitemap.findall(f"{{{self.xml_schema_sitemap}}}url"):
-            location = url.find(f"{{{self.xml_schema_sitemap}}}loc").text
+        return urls, complete
 
-            if filter_locs is None or filter_locs in location:
-                sitemap_urls.append(location)
+    async def aload_data(
+        self, sitemap_url: str, filter: Optional[str] = None
+    ) -> List[Document]:
+        """Load the pages of a sitemap asynchronously.
 
-        return sitemap_urls
+        Args:
+            sitemap_url (str): URL of the sitemap or sitemap index.
+            filter (Optional[str]): Only load the pages whose URL contains it.
+
+        Returns:
+            List[Document]: List of documents.
+
+        """
+        if self._watermark_path is None:
+            sitemap_urls, _ = await self._collect_urls(sitemap_url, None)
+            urls = [url for url in sitemap_urls if filter is None or filter in url]
+            return await self._async_loader.aload_data(urls=urls)
+
+        watermark, failed = self._load_watermark(sitemap_url, filter)
+        sitemap_urls, complete = await self._collect_urls(sitemap_url, watermark)
+        urls = [url for url in sitemap_urls if filter is None or filter in url]
+        # pages that failed before are retried, even if older than the watermark
+        urls.extend(url for url in failed if url not in sitemap_urls)
+
+        # documents are matched to their URL by index, as redirected pages
+        # have a different source
+        indexed = [item async for item in self._async_loader._aload_indexed(urls=urls)]
+        indexed.sort(key=lambda item: item[0])
+        documents = [document for _, document in indexed]
+
+        # pages of a skipped sitemap were not seen, so they may be older than
+        # any watermark computed from the others
+        if complete:
+            loaded = {i for i, _ in indexed}
+            # failed pages are recorded, so the watermark can pass them
+            lastmods = [
+                sitemap_urls[url] for url in urls if sitemap_urls.get(url) is not None
+            ]
+            if watermark is not None:
+                lastmods.append(watermark)
+            self._save_watermark(
+                sitemap_url,
+                filter,
+                max(lastmods) if lastmods else None,
+                [url for i, url in enumerate(urls) if i not in loaded],
+            )
+
+        return documents
 
     def load_data(self, sitemap_url: str, filter: str = None) -> List[Document]:
-        sitemap = self._load_sitemap(sitemap_url=sitemap_url)
-        sitemap_urls = self._parse_sitemap(sitemap, filter)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.aload_data(sitemap_url, filter))
 
-        return self._async_loader.load_data(urls=sitemap_urls)
+        with ThreadPoolExecutor(1) as executor:
+            return executor.submit(
+                asyncio.run, self.aload_data(sitemap_url, filter)
+            ).result()
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.web.trafilatura_web.base import (
-    TrafilaturaWebReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.web.trafilatura_web.base import (
+        TrafilaturaWebReader,
+    )
 
 __all__ = ["TrafilaturaWebReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.web.trafilatura_web.base": ["TrafilaturaWebReader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.web.unstructured_web.base import (
-    UnstructuredURLLoader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.web.unstructured_web.base import (
+        UnstructuredURLLoader,
+    )
 
-__all__ = ["UnstructuredURLLoader"]
+__all__ = ["UnstructuredURLLoader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.web.unstructured_web.base": ["UnstructuredURLLoader"],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.web.whole_site.base import (
-    WholeSiteReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.web.whole_site.base import (
+        WholeSiteReader,
+    )
 
 __all__ = ["WholeSiteReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.web.whole_site.base": ["WholeSiteReader"],
+    },
+)
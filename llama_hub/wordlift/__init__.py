@@ -1,18 +1,23 @@
 """Init file."""
-from llama_hub.wordlift.base import (
-    APICallError,
-    DATA_KEY,
-    DataTransformError,
-    ERRORS_KEY,
-    WordLiftLoader,
-    WordLiftLoaderError,
-    clean_html,
-    clean_value,
-    flatten_list,
-    get_separated_value,
-    is_url,
-    is_valid_html,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.wordlift.base import (
+        APICallError,
+        DATA_KEY,
+        DataTransformError,
+        ERRORS_KEY,
+        WordLiftLoader,
+        WordLiftLoaderError,
+        clean_html,
+        clean_value,
+        flatten_list,
+        get_separated_value,
+        is_url,
+        is_valid_html,
+    )
 
 __all__ = [
     "APICallError",
@@ -28,3 +33,23 @@ __all__ = [
     "is_url",
     "is_valid_html",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.wordlift.base": [
+            "APICallError",
+            "DATA_KEY",
+            "DataTransformError",
+            "ERRORS_KEY",
+            "WordLiftLoader",
+            "WordLiftLoaderError",
+            "clean_html",
+            "clean_value",
+            "flatten_list",
+            "get_separated_value",
+            "is_url",
+            "is_valid_html",
+        ],
+    },
+)
@@ -1,13 +1,29 @@
-from llama_hub.youtube_transcript.base import (
-    YoutubeTranscriptReader,
-)
-from llama_hub.youtube_transcript.utils import (
-    YOUTUBE_URL_PATTERNS,
-    is_youtube_video,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.youtube_transcript.base import (
+        YoutubeTranscriptReader,
+    )
+    from llama_hub.youtube_transcript.utils import (
+        YOUTUBE_URL_PATTERNS,
+        is_youtube_video,
+    )
 
 __all__ = [
     "YOUTUBE_URL_PATTERNS",
     "YoutubeTranscriptReader",
     "is_youtube_video",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.youtube_transcript.base": ["YoutubeTranscriptReader"],
+        "llama_hub.youtube_transcript.utils": [
+            "YOUTUBE_URL_PATTERNS",
+            "is_youtube_video",
+        ],
+    },
+)
@@ -1,6 +1,18 @@
 """Init file."""
-from llama_hub.zendesk.base import (
-    ZendeskReader,
-)
+from typing import TYPE_CHECKING
+
+from llama_hub.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llama_hub.zendesk.base import (
+        ZendeskReader,
+    )
 
 __all__ = ["ZendeskReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "llama_hub.zendesk.base": ["ZendeskReader"],
+    },
+)
@@ -44,3 +44,38 @@ def load_remote_audio_sample():
     with open(filepath, "wb") as output:
         output.write(remote_audio_sample.read())
         yield filepath
+
+
+def test_model_shared_and_batch_order(monkeypatch) -> None:
+    import sys
+
+    from llama_hub.file.audio import base
+
+    loaded = []
+
+    class FakeModel:
+        def transcribe(self, audio):
+            return {"text": f"transcript of {audio}"}
+
+    def load_model(version):
+        loaded.append(version)
+        return FakeModel()
+
+    whisper_mock = type(sys)("whisper")
+    whisper_mock.Whisper = FakeModel
+    whisper_mock.load_model = load_model
+    whisper_mock.load_audio = lambda file: Path(file).name
+    monkeypatch.setitem(sys.modules, "whisper", whisper_mock)
+    base._load_model.cache_clear()
+
+    transcriber = AudioTranscriber(model_version="tiny", num_workers=1)
+    AudioTranscriber(model_version="tiny")
+    assert loaded == ["tiny"]
+
+    files = [Path(f"{i}.mp3") for i in range(5)]
+    documents = transcriber.load_batch(files, [{"i": i} for i in range(5)])
+    assert [doc.text for doc in documents] == [
+        f"transcript of {i}.mp3" for i in range(5)
+    ]
+    assert documents[3].extra_info == {"i": 3}
+    base._load_model.cache_clear()
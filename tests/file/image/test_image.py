@@ -3,6 +3,8 @@ import os
 import sys
 import tempfile
 
+import pytest
+
 
 BLACK_PIXEL_PNG = b64decode(
     "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNk+A8AAQUBAScY42YAAAAASUVORK5CYII="
@@ -27,17 +29,25 @@ class DummyModel:
         return ""
 
 
-def test_model_kwargs_with_pytesseract():
-    from llama_hub.file.image.base import ImageReader
-
-    # Mock subdependencies to just test the kwargs passing
+@pytest.fixture
+def pil_mock(monkeypatch):
     pil_mock = type(sys)("PIL")
     pil_mock.Image = ImageMock
-    sys.modules["PIL"] = pil_mock
+    monkeypatch.setitem(sys.modules, "PIL", pil_mock)
+    return pil_mock
+
 
+@pytest.fixture
+def pytesseract_mock(monkeypatch):
     pytesseract_mock = type(sys)("pytesseract")
-    sys.modules["pytesseract"] = pytesseract_mock
+    monkeypatch.setitem(sys.modules, "pytesseract", pytesseract_mock)
+    return pytesseract_mock
 
+
+def test_model_kwargs_with_pytesseract(pil_mock, pytesseract_mock):
+    from llama_hub.file.image.base import ImageReader
+
+    # Mock subdependencies to just test the kwargs passing
     dummy_model = DummyModel()
 
     parser_config = dict(model=dummy_model, processor=None)
@@ -57,3 +67,117 @@ def test_model_kwargs_with_pytesseract():
         dummy_model.received_kwargs[model_key] == model_val
         for model_key, model_val in model_kwargs.items()
     )
+
+
+def test_donut_model_shared_between_readers(monkeypatch):
+    from llama_hub.file.image import base
+
+    loaded = []
+
+    class Pretrained:
+        @classmethod
+        def from_pretrained(cls, name):
+            loaded.append((cls.__name__, name))
+            return cls()
+
+    transformers_mock = type(sys)("transformers")
+    transformers_mock.DonutProcessor = type("DonutProcessor", (Pretrained,), {})
+    transformers_mock.VisionEncoderDecoderModel = type(
+        "VisionEncoderDecoderModel", (Pretrained,), {}
+    )
+    monkeypatch.setitem(sys.modules, "transformers", transformers_mock)
+    base._load_donut.cache_clear()
+    try:
+        first = base.ImageReader(model_name="donut")
+        second = base.ImageReader(model_name="donut")
+    finally:
+        base._load_donut.cache_clear()
+
+    assert len(loaded) == 2
+    assert first._parser_config["model"] is second._parser_config["model"]
+
+
+def test_load_batch_with_pytesseract(pil_mock, pytesseract_mock):
+    from llama_hub.file.image.base import ImageReader
+
+    parser_config = dict(model=DummyModel(), processor=None)
+    loader = ImageReader(parser_config=parser_config, batch_size=2)
+
+    files = [f"{i}.png" for i in range(3)]
+    documents = loader.load_batch(files, [{"file": file} for file in files])
+    assert [doc.extra_info for doc in documents] == [{"file": file} for file in files]
+
+
+class TensorMock:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def repeat(self, rows, columns):
+        return TensorMock(self.rows * rows)
+
+    def to(self, device):
+        return self
+
+
+class DonutProcessorMock:
+    class tokenizer:
+        eos_token = "</s>"
+        pad_token = "<pad>"
+        eos_token_id = pad_token_id = unk_token_id = 0
+
+        def __new__(cls, prompt, add_special_tokens, return_tensors):
+            return type("Encoding", (), {"input_ids": TensorMock(1)})
+
+    def __call__(self, images, return_tensors):
+        return type("Features", (), {"pixel_values": TensorMock(len(images))})
+
+    def batch_decode(self, sequences):
+        return [
+            f"<s_cord-v2><s_item>{i}</s_item></s><pad>" for i in range(sequences.rows)
+        ]
+
+
+class DonutModelMock:
+    class decoder:
+        class config:
+            max_position_embeddings = 16
+
+    def __init__(self):
+        self.batches = []
+
+    def to(self, device):
+        self.device = device
+
+    def generate(self, pixel_values, decoder_input_ids, **kwargs):
+        assert decoder_input_ids.rows == pixel_values.rows
+        self.batches.append(pixel_values.rows)
+        return type("Output", (), {"sequences": TensorMock(pixel_values.rows)})
+
+
+def test_load_batch_with_donut(monkeypatch, pil_mock):
+    from llama_hub.file.image.base import ImageReader
+
+    threads = []
+    torch_mock = type(sys)("torch")
+    torch_mock.set_num_threads = threads.append
+    torch_mock.cuda = type(sys)("torch.cuda")
+    torch_mock.cuda.is_available = lambda: False
+    monkeypatch.setitem(sys.modules, "torch", torch_mock)
+
+    model = DonutModelMock()
+    parser_config = dict(model=model, processor=DonutProcessorMock())
+    loader = ImageReader(parser_config=parser_config, batch_size=2, num_threads=3)
+
+    files = [f"{i}.png" for i in range(3)]
+    documents = loader.load_batch(files)
+
+    # images go through the model two at a time, and each batch is decoded
+    # without the task prompt, end and padding tokens
+    assert model.batches == [2, 1]
+    assert model.device == "cpu"
+    assert threads == [3, 3]
+    assert [doc.text for doc in documents] == [
+        "<s_item>0</s_item>",
+        "<s_item>1</s_item>",
+        "<s_item>0</s_item>",
+    ]
@@ -57,3 +57,58 @@ def test_load_data_jsonl(jsonl_file):
     assert len(documents) == 2
     assert "Jane Doe" in documents[1].text
     assert "25" in documents[1].text
+
+
+def test_load_data_json_array_streamed(tmp_path, monkeypatch):
+    import llama_hub.file.json.base as json_base
+
+    # force the array to be parsed across many small reads
+    monkeypatch.setattr(json_base, "JSON_READ_SIZE", 7)
+    records = [SAMPLE_JSON, {"n": 12345678, "l": [1, {}, []]}, "text", 1.5, None]
+    file = tmp_path / "array.json"
+    file.write_text(json.dumps(records, indent=2))
+
+    reader = JSONReader()
+    documents = list(reader.lazy_load_data(file))
+    assert len(documents) == len(records)
+    assert "12345678" in documents[1].text
+    assert documents[3].text == "1.5"
+
+
+@pytest.mark.parametrize("read_size", [1, 2, 3, 4, 5])
+def test_load_data_json_array_numbers_across_reads(tmp_path, monkeypatch, read_size):
+    import llama_hub.file.json.base as json_base
+
+    # numbers are cut by reads at every possible position
+    monkeypatch.setattr(json_base, "JSON_READ_SIZE", read_size)
+    records = [1.5, -22, 3e10, 0.25, 4, 1e-3, 7]
+    file = tmp_path / "numbers.json"
+    file.write_text(json.dumps(records))
+
+    documents = list(JSONReader().lazy_load_data(file))
+    assert [float(doc.text) for doc in documents] == records
+
+
+def test_formatted_text_matches_json_dumps():
+    import re
+
+    data = {"a": [{"b": 1}, {"c": {}}, []], "d": {"e": "f"}, "g": None}
+    lines = json.dumps(data, indent=0).split("\n")
+    expected = "\n".join(
+        line for line in lines if not re.match(r"^[{}\\[\\],]*$", line)
+    )
+    assert JSONReader()._parse_jsonobj_to_document(data).text == expected
+
+
+def test_load_data_jsonl_num_workers(tmp_path, monkeypatch):
+    import llama_hub.file.json.base as json_base
+
+    # small byte ranges so that records straddle range boundaries
+    monkeypatch.setattr(json_base, "JSONL_CHUNK_SIZE", 10)
+    file = tmp_path / "many.jsonl"
+    file.write_text("\n".join(json.dumps({"i": i}) for i in range(50)) + "\n")
+
+    expected = [doc.text for doc in JSONReader().load_data(file, is_jsonl=True)]
+    documents = JSONReader(num_workers=2).load_data(file, is_jsonl=True)
+    assert [doc.text for doc in documents] == expected
+    assert len(documents) == 50
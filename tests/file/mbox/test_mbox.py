@@ -0,0 +1,107 @@
+import mailbox
+
+import pytest
+
+from llama_hub.file.mbox import MboxReader
+from llama_hub.file.mbox.base import _iter_message_spans
+
+SAMPLE_MBOX = b"""From alice@example.com Mon Jan  1 00:00:00 2024
+Date: Mon, 1 Jan 2024 00:00:00 +0000
+From: alice@example.com
+To: bob@example.com
+Subject: Hello
+
+Hi Bob,
+  how are you?
+
+From bob@example.com Tue Jan  2 00:00:00 2024
+Date: Tue, 2 Jan 2024 00:00:00 +0000
+From: bob@example.com
+To: alice@example.com
+Subject: Re: Hello
+MIME-Version: 1.0
+Content-Type: multipart/mixed; boundary="XYZ"
+
+--XYZ
+Content-Type: text/plain; charset="latin-1"
+Content-Transfer-Encoding: quoted-printable
+
+Tr=E8s bien, merci.
+--XYZ--
+
+From carol@example.com Wed Jan  3 00:00:00 2024
+Date: Wed, 3 Jan 2024 00:00:00 +0000
+From: carol@example.com
+To: alice@example.com
+Subject: Empty
+
+From dave@example.com Thu Jan  4 00:00:00 2024
+Date: Thu, 4 Jan 2024 00:00:00 +0000
+From: dave@example.com
+To: alice@example.com
+Subject: Last
+
+Bye.
+"""
+
+
+@pytest.fixture
+def mbox_file(tmp_path):
+    file = tmp_path / "test.mbox"
+    file.write_bytes(SAMPLE_MBOX)
+    return file
+
+
+def test_message_spans_match_mailbox(mbox_file):
+    mbox = mailbox.mbox(mbox_file)
+    mbox._generate_toc()
+    with open(mbox_file, "rb") as fp:
+        spans = list(_iter_message_spans(fp))
+    assert spans == [mbox._toc[key] for key in sorted(mbox._toc)]
+
+
+def test_load_data(mbox_file):
+    documents = MboxReader().load_data(mbox_file)
+    assert len(documents) == 3
+    assert documents[0].text.endswith("Content: Hi Bob, how are you?")
+    assert "Subject: Re: Hello" in documents[1].text
+    assert documents[1].text.endswith("Content: Très bien, merci.")
+
+
+def test_load_data_num_workers(mbox_file):
+    expected = [doc.text for doc in MboxReader().load_data(mbox_file)]
+    documents = MboxReader(num_workers=2).load_data(mbox_file)
+    assert [doc.text for doc in documents] == expected
+
+
+def test_lazy_load_data_resume(mbox_file):
+    reader = MboxReader(include_byte_offsets=True)
+    first = next(reader.lazy_load_data(mbox_file))
+    rest = list(
+        reader.lazy_load_data(mbox_file, start_byte=first.extra_info["end_byte"])
+    )
+    assert [doc.text for doc in rest] == [
+        doc.text for doc in reader.load_data(mbox_file)[1:]
+    ]
+    assert MboxReader(max_count=2).load_data(mbox_file)[-1].text == rest[0].text
+
+
+def test_lazy_load_data_num_workers_reads_ahead_boundedly(tmp_path, monkeypatch):
+    from llama_hub.file.mbox import base
+
+    file = tmp_path / "large.mbox"
+    file.write_bytes(SAMPLE_MBOX * 100)
+    read_spans = []
+
+    def counting_spans(fp, start_byte=0):
+        for span in _iter_message_spans(fp, start_byte):
+            read_spans.append(span)
+            yield span
+
+    monkeypatch.setattr(base, "_iter_message_spans", counting_spans)
+    documents = MboxReader(num_workers=2).lazy_load_data(file)
+
+    assert next(documents).text.endswith("Content: Hi Bob, how are you?")
+    # the batches of at most 2 tasks per worker, and the one being filled
+    assert len(read_spans) <= 5 * base.MESSAGES_PER_TASK
+    assert len(list(documents)) == 299
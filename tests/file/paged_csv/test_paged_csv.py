@@ -0,0 +1,86 @@
+import pytest
+
+from llama_hub.file.paged_csv import PagedCSVReader
+
+SAMPLE_CSV = " First Name , Age\n" "Bruce,28\n" '"Clark\nKent",35\n' "\n" "Diana, 30\n"
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    file = tmp_path / "test.csv"
+    file.write_bytes(SAMPLE_CSV.encode("utf-8"))
+    return file
+
+
+def test_load_data(csv_file):
+    reader = PagedCSVReader()
+    documents = reader.load_data(csv_file, extra_info={"source": "test"})
+    assert [doc.text for doc in documents] == [
+        "First Name: Bruce\nAge: 28",
+        "First Name: Clark\nKent\nAge: 35",
+        "First Name: Diana\nAge: 30",
+    ]
+    assert documents[0].extra_info == {"source": "test"}
+
+
+def test_lazy_load_data_batches_and_offsets(csv_file):
+    reader = PagedCSVReader(rows_per_document=2, include_byte_offsets=True)
+    documents = list(reader.lazy_load_data(csv_file))
+    assert len(documents) == 2
+    assert documents[0].text == (
+        "First Name: Bruce\nAge: 28\n\nFirst Name: Clark\nKent\nAge: 35"
+    )
+
+    # rows can be read again from their byte offsets
+    for document in documents:
+        byte_range = (
+            document.extra_info["start_byte"],
+            document.extra_info["end_byte"],
+        )
+        reread = list(reader.lazy_load_data(csv_file, byte_range=byte_range))
+        assert [doc.text for doc in reread] == [document.text]
+
+
+@pytest.mark.parametrize("encoding", ["utf-16", "utf-16-le", "utf-8-sig", "gb18030"])
+def test_load_data_encodings(tmp_path, encoding):
+    file = tmp_path / "test.csv"
+    file.write_bytes("名前,Age\n李雷,28\n韩梅梅,30\n".encode(encoding))
+    reader = PagedCSVReader(encoding=encoding)
+    documents = reader.load_data(file)
+    assert [doc.text for doc in documents] == [
+        "名前: 李雷\nAge: 28",
+        "名前: 韩梅梅\nAge: 30",
+    ]
+
+
+def test_byte_offsets_of_utf16_files_are_rejected(csv_file):
+    with pytest.raises(ValueError):
+        PagedCSVReader(encoding="utf-16", include_byte_offsets=True)
+    reader = PagedCSVReader(encoding="utf-16")
+    with pytest.raises(ValueError):
+        list(reader.lazy_load_data(csv_file, byte_range=(0, 10)))
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+def test_load_data_line_endings(tmp_path, monkeypatch, newline):
+    from llama_hub.file.paged_csv import base
+
+    # lines and CRLF pairs cut across reads
+    monkeypatch.setattr(base, "CSV_READ_SIZE", 3)
+    file = tmp_path / "test.csv"
+    file.write_bytes(SAMPLE_CSV.replace("\n", newline).encode("utf-8"))
+    reader = PagedCSVReader(include_byte_offsets=True)
+
+    documents = reader.load_data(file)
+
+    assert [doc.text for doc in documents] == [
+        "First Name: Bruce\nAge: 28",
+        "First Name: Clark\nKent\nAge: 35",
+        "First Name: Diana\nAge: 30",
+    ]
+    last = documents[-1].extra_info
+    assert last["end_byte"] == file.stat().st_size
+    reread = reader.lazy_load_data(
+        file, byte_range=(last["start_byte"], last["end_byte"])
+    )
+    assert [doc.text for doc in reread] == [documents[-1].text]
@@ -0,0 +1,64 @@
+import pytest
+
+from llama_hub.file.pandas_csv import PandasCSVReader
+
+pd = pytest.importorskip("pandas")
+
+SAMPLE_CSV = "name,age,score\nJohn Doe,30,1.5\nJane Doe,25,\nJim Beam,41,3.0\n"
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    file = tmp_path / "test.csv"
+    file.write_text(SAMPLE_CSV)
+    return file
+
+
+def test_load_data(csv_file):
+    reader = PandasCSVReader()
+    documents = reader.load_data(csv_file)
+    assert len(documents) == 1
+    assert documents[0].text == (
+        "John Doe, 30, 1.5\nJane Doe, 25, nan\nJim Beam, 41, 3.0"
+    )
+
+
+def test_load_data_rows(csv_file):
+    reader = PandasCSVReader(concat_rows=False, col_joiner="|")
+    documents = reader.load_data(csv_file)
+    assert [doc.text for doc in documents] == [
+        "John Doe|30|1.5",
+        "Jane Doe|25|nan",
+        "Jim Beam|41|3.0",
+    ]
+
+
+def test_lazy_load_data_chunksize(csv_file):
+    reader = PandasCSVReader(chunksize=2)
+    documents = list(reader.lazy_load_data(csv_file, extra_info={"a": 1}))
+    assert [doc.text for doc in documents] == [
+        "John Doe, 30, 1.5\nJane Doe, 25, nan",
+        "Jim Beam, 41, 3.0",
+    ]
+    assert documents[1].extra_info == {"a": 1}
+
+
+def test_load_data_numeric_columns(tmp_path):
+    # integers of an all-numeric table are formatted as floats, as they were
+    # when each row was converted whole
+    file = tmp_path / "numbers.csv"
+    file.write_text("a,b,c\n1,2.5,3\n4,,6\n")
+    reader = PandasCSVReader(concat_rows=False)
+    documents = reader.load_data(file)
+    assert [doc.text for doc in documents] == ["1.0, 2.5, 3.0", "4.0, nan, 6.0"]
+
+
+def test_load_data_date_columns(tmp_path):
+    file = tmp_path / "dates.csv"
+    file.write_text("name,born\nBruce,2020-01-01\nDiana,\n")
+    reader = PandasCSVReader(concat_rows=False, pandas_config={"parse_dates": ["born"]})
+    documents = reader.load_data(file)
+    assert [doc.text for doc in documents] == [
+        "Bruce, 2020-01-01 00:00:00",
+        "Diana, NaT",
+    ]
@@ -0,0 +1,61 @@
+import pytest
+
+from llama_hub.file.pandas_excel import PandasExcelReader
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("openpyxl")
+
+
+@pytest.fixture
+def excel_file(tmp_path):
+    file = tmp_path / "test.xlsx"
+    with pd.ExcelWriter(file) as writer:
+        pd.DataFrame(
+            {"name": ["John Doe", "Jane Doe"], "age": [30, 25], "score": [1.5, None]}
+        ).to_excel(writer, sheet_name="people", index=False)
+        pd.DataFrame({"a": [1, 4], "b": [2.5, None]}).to_excel(
+            writer, sheet_name="numbers", index=False
+        )
+    return file
+
+
+def test_load_data(excel_file):
+    reader = PandasExcelReader()
+    documents = reader.load_data(excel_file, include_sheetname=True)
+    assert len(documents) == 1
+    assert documents[0].text == "\n".join(
+        [
+            "people",
+            "John Doe\n30\n1.5",
+            "Jane Doe\n25\nnan",
+            # integers of an all-numeric sheet are formatted as floats
+            "numbers",
+            "1.0\n2.5",
+            "4.0\nnan",
+        ]
+    )
+
+
+def test_load_data_sheet_docs(excel_file):
+    reader = PandasExcelReader(row_joiner="|")
+    documents = reader.load_data(
+        excel_file, include_different_sheet_docs=True, extra_info={"a": 1}
+    )
+    assert [doc.text for doc in documents] == [
+        "John Doe|30|1.5|Jane Doe|25|nan",
+        "1.0|2.5|4.0|nan",
+    ]
+    assert [doc.extra_info for doc in documents] == [
+        {"sheet_name": "people", "a": 1},
+        {"sheet_name": "numbers", "a": 1},
+    ]
+
+
+def test_load_data_date_columns(tmp_path):
+    file = tmp_path / "dates.xlsx"
+    pd.DataFrame(
+        {"name": ["Bruce", "Diana"], "born": pd.to_datetime(["2020-01-01", None])}
+    ).to_excel(file, index=False)
+    reader = PandasExcelReader(row_joiner="|")
+    documents = reader.load_data(file)
+    assert documents[0].text == "Bruce|2020-01-01 00:00:00|Diana|NaT"
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import pytest
+
+from llama_hub.file.pdf.base import PDFReader
+
+pytest.importorskip("pypdf")
+
+TEST_PDF = Path(__file__).parent.parent.parent / "test_preprocess/preprocess_test.pdf"
+
+
+def test_pdf_reader() -> None:
+    docs = PDFReader().load_data(TEST_PDF, extra_info={"source": "test"})
+    assert len(docs) == 9
+    assert docs[0].text.startswith("Demonstration of DOCX support")
+    assert docs[0].extra_info == {
+        "page_label": "1",
+        "source": "test",
+        "file_name": "preprocess_test.pdf",
+    }
+
+
+def test_pdf_reader_page_range_and_lazy() -> None:
+    all_docs = PDFReader().load_data(TEST_PDF)
+
+    docs = PDFReader().lazy_load_data(TEST_PDF, page_range=(2, 5))
+    assert next(docs).text == all_docs[2].text
+    assert [doc.text for doc in docs] == [doc.text for doc in all_docs[3:5]]
+
+
+def test_pdf_reader_num_workers() -> None:
+    all_docs = PDFReader().load_data(TEST_PDF)
+
+    reader = PDFReader(num_workers=2, pages_per_task=2)
+    docs = reader.load_data(TEST_PDF)
+    assert [doc.text for doc in docs] == [doc.text for doc in all_docs]
+    assert [doc.extra_info for doc in docs] == [doc.extra_info for doc in all_docs]
+
+    with open(TEST_PDF, "rb") as f:
+        docs = reader.load_data(f, page_range=(1, 8))
+    assert [doc.text for doc in docs] == [doc.text for doc in all_docs[1:8]]
@@ -0,0 +1,73 @@
+import io
+
+import pytest
+
+from llama_hub.file.pymu_pdf.base import PyMuPDFReader
+
+fitz = pytest.importorskip("fitz")
+
+NUM_PAGES = 7
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    doc = fitz.open()
+    for i in range(NUM_PAGES):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {i + 1}")
+    file = tmp_path / "test.pdf"
+    doc.save(file)
+    doc.close()
+    return file
+
+
+def as_input(pdf_file, kind):
+    if kind == "path":
+        return pdf_file
+    if kind == "str":
+        return str(pdf_file)
+    if kind == "bytes":
+        return pdf_file.read_bytes()
+    return io.BytesIO(pdf_file.read_bytes())
+
+
+@pytest.mark.parametrize("num_workers", [None, 2])
+@pytest.mark.parametrize("kind", ["path", "str", "bytes", "stream"])
+def test_load_data(pdf_file, kind, num_workers):
+    reader = PyMuPDFReader(num_workers=num_workers, pages_per_task=2)
+
+    documents = reader.load_data(as_input(pdf_file, kind), extra_info={"a": 1})
+
+    assert [doc.text.strip() for doc in documents] == [
+        f"Page {i + 1}" for i in range(NUM_PAGES)
+    ]
+    expected_info = {"a": 1, "total_pages": NUM_PAGES}
+    # only files have a path
+    if kind in ("path", "str"):
+        expected_info["file_path"] = str(pdf_file)
+    assert [doc.extra_info for doc in documents] == [
+        dict(expected_info, source=f"{i + 1}") for i in range(NUM_PAGES)
+    ]
+
+
+def test_load_data_without_metadata(pdf_file):
+    documents = PyMuPDFReader().load_data(pdf_file, metadata=False)
+    assert [doc.extra_info for doc in documents] == [{}] * NUM_PAGES
+
+
+@pytest.mark.parametrize("num_workers", [None, 3])
+def test_lazy_load_data_page_range(pdf_file, num_workers):
+    reader = PyMuPDFReader(num_workers=num_workers, pages_per_task=1)
+
+    documents = reader.lazy_load_data(pdf_file.read_bytes(), page_range=(2, 5))
+
+    assert next(documents).extra_info["source"] == "3"
+    assert [doc.text.strip() for doc in documents] == ["Page 4", "Page 5"]
+
+
+def test_invalid_inputs(pdf_file):
+    reader = PyMuPDFReader()
+    with pytest.raises(TypeError):
+        reader.load_data(42)
+    with pytest.raises(TypeError):
+        reader.load_data(pdf_file, extra_info=["not", "a", "dict"])
@@ -0,0 +1,108 @@
+import pytest
+
+rdflib = pytest.importorskip("rdflib")
+
+from rdflib import Graph, Literal, URIRef  # noqa: E402
+from rdflib.namespace import RDF, RDFS  # noqa: E402
+
+from llama_hub.file.rdf import base  # noqa: E402
+from llama_hub.file.rdf.base import RDFReader  # noqa: E402
+
+TURTLE = """
+@prefix ex: <http://example.org/> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+ex:alice rdfs:label "Alice" ; ex:knows ex:bob, ex:carol .
+ex:bob rdfs:label "Bob"@en, "Robert"@fr ; ex:knows ex:carol .
+ex:carol rdfs:label "Carol"@en ; a ex:Person .
+ex:knows rdfs:label "knows"@en .
+ex:Person rdfs:label "Person"@en .
+"""
+
+
+@pytest.fixture
+def vocabulary(monkeypatch):
+    """Replace the vocabularies fetched from the web by a local graph."""
+    graph = Graph()
+    graph.add((RDF.type, RDFS.label, Literal("type")))
+    monkeypatch.setattr(base, "_load_vocabulary", lambda: graph)
+    base._vocabulary_labels.cache_clear()
+    yield graph
+    base._vocabulary_labels.cache_clear()
+
+
+@pytest.fixture
+def turtle_file(tmp_path):
+    file = tmp_path / "test.ttl"
+    file.write_text(TURTLE)
+    return file
+
+
+def test_load_vocabulary_is_cached(monkeypatch):
+    sources = []
+    monkeypatch.setattr(Graph, "parse", lambda self, source: sources.append(source))
+    base._load_vocabulary.cache_clear()
+    try:
+        assert base._load_vocabulary() is base._load_vocabulary()
+    finally:
+        base._load_vocabulary.cache_clear()
+    assert sources == [str(RDF), str(RDFS)]
+
+
+@pytest.mark.parametrize("lang", ["en", "fr"])
+def test_index_labels_matches_fetch_labels(turtle_file, lang):
+    graph = Graph()
+    graph.parse(turtle_file)
+    # several labels in no language, to compare which one is chosen
+    for i in range(10):
+        graph.add((URIRef("http://example.org/dave"), RDFS.label, Literal(f"D{i}")))
+    reader = RDFReader()
+
+    labels = base._index_labels(graph, lang)
+
+    expected = {}
+    for uri in set(graph.subjects(RDFS.label)):
+        uri_labels = reader.fetch_labels(uri, graph, lang)
+        if uri_labels:
+            expected[uri] = uri_labels[0].value
+    assert labels == expected
+    assert labels[URIRef("http://example.org/bob")] == (
+        "Bob" if lang == "en" else "Robert"
+    )
+
+
+EXPECTED_TRIPLES = [
+    "<Alice> <knows> <Bob>",
+    "<Alice> <knows> <Carol>",
+    "<Bob> <knows> <Carol>",
+    "<Carol> <type> <Person>",
+]
+
+
+def test_load_data(vocabulary, turtle_file):
+    documents = RDFReader().load_data(turtle_file)
+
+    assert len(documents) == 1
+    assert sorted(documents[0].text.split("\n")) == EXPECTED_TRIPLES
+    assert documents[0].extra_info == {}
+
+
+def test_lazy_load_data_triples_per_document(vocabulary, turtle_file):
+    reader = RDFReader(triples_per_document=3)
+
+    documents = list(reader.lazy_load_data(turtle_file, extra_info={"lang": "en"}))
+
+    assert [len(doc.text.split("\n")) for doc in documents] == [3, 1]
+    triples = [line for doc in documents for line in doc.text.split("\n")]
+    assert sorted(triples) == EXPECTED_TRIPLES
+    assert all(doc.extra_info == {"lang": "en"} for doc in documents)
+
+
+def test_missing_label(vocabulary, tmp_path):
+    file = tmp_path / "test.ttl"
+    file.write_text(
+        "<http://example.org/a> <http://example.org/b> <http://example.org/c> ."
+    )
+
+    with pytest.raises(Exception, match="Label not found"):
+        RDFReader().load_data(file)
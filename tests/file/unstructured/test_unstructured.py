@@ -0,0 +1,53 @@
+import httpx
+import pytest
+
+from llama_hub.file.unstructured import UnstructuredReader
+from llama_hub.file.unstructured import base
+
+
+def test_init_does_not_download_nltk_data(monkeypatch):
+    nltk = pytest.importorskip("nltk")
+
+    def download(*args, **kwargs):
+        raise AssertionError("NLTK data should not be downloaded")
+
+    monkeypatch.setattr(nltk, "download", download)
+    UnstructuredReader()
+    UnstructuredReader(url="http://localhost:8000")
+
+
+def test_missing_nltk_data_is_reported(monkeypatch):
+    nltk = pytest.importorskip("nltk")
+
+    def find(path):
+        raise LookupError(path)
+
+    monkeypatch.setattr(nltk.data, "find", find)
+    base._check_nltk_resources.cache_clear()
+    try:
+        with pytest.raises(LookupError, match="punkt"):
+            UnstructuredReader().load_data(file="test.txt")
+    finally:
+        base._check_nltk_resources.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_api_requests_are_retried(httpserver, tmp_path):
+    httpserver.expect_oneshot_request("/general/v0/general").respond_with_data(
+        "busy", status=503
+    )
+    httpserver.expect_request("/general/v0/general").respond_with_json(
+        [{"type": "NarrativeText", "text": "Hello"}]
+    )
+    file = tmp_path / "test.txt"
+    file.write_text("Hello")
+
+    reader = UnstructuredReader(url=httpserver.url_for("").rstrip("/"), api_key="key")
+    async with httpx.AsyncClient() as client:
+        response = await reader._apartition_via_api(client, file)
+
+    assert "Hello" in response
+    assert len(httpserver.log) == 2
+    request, _ = httpserver.log[-1]
+    assert request.headers["unstructured-api-key"] == "key"
+    assert request.files["files"].filename == "test.txt"
@@ -62,3 +62,24 @@ def test_load_data_xml(xml_file):
     assert len(documents) == 1
     assert "Apple" in documents[0].text
     assert "Garden City" in documents[0].text
+
+
+@pytest.mark.parametrize("level", [0, 1, 2, 3])
+def test_lazy_load_data_matches_tree(xml_file, level):
+    reader = XMLReader(tree_level_split=level)
+    expected = reader._parse_xmlelt_to_document(ET.parse(xml_file).getroot())
+    documents = list(reader.lazy_load_data(xml_file))
+    assert [doc.text for doc in documents] == [doc.text for doc in expected]
+
+
+def test_streamed_nodes_are_cleared(xml_file):
+    from llama_hub.file.xml.base import _iter_leaf_nodes_up_to_level
+
+    nodes = _iter_leaf_nodes_up_to_level(xml_file, 1)
+    first = next(nodes)
+    assert first.findtext("name") == "Apple"
+    second = next(nodes)
+    assert second.findtext("name") == "Carrot"
+    # nodes already processed are released
+    assert len(first) == 0
+    assert sum(1 for _ in nodes) == 2
@@ -206,3 +206,148 @@ def test_file_metadata() -> None:
 
         for d in documents:
             assert d.extra_info is not None and d.extra_info["author"] == test_author
+
+
+def test_lazy_load_data() -> None:
+    """Test that lazy loading yields the same documents as load_data."""
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(1, 4):
+            with open(f"{tmp_dir}/test{i}.txt", "w") as f:
+                f.write(f"test{i}")
+
+        reader = SimpleDirectoryReader(tmp_dir)
+        lazy_documents = reader.lazy_load_data()
+        assert next(iter(lazy_documents)).text == "test1"
+        assert [d.text for d in reader.lazy_load_data()] == [
+            d.text for d in reader.load_data()
+        ]
+
+
+def test_num_workers() -> None:
+    """Test parsing files with a process pool."""
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(1, 5):
+            with open(f"{tmp_dir}/test{i}.txt", "w") as f:
+                f.write(f"test{i}")
+
+        def filename_to_metadata(filename: str) -> Dict[str, Any]:
+            return {"filename": Path(filename).name}
+
+        reader = SimpleDirectoryReader(tmp_dir, file_metadata=filename_to_metadata)
+        documents = reader.load_data(num_workers=2)
+        assert [d.text for d in documents] == ["test1", "test2", "test3", "test4"]
+        assert [d.extra_info["filename"] for d in documents] == [
+            "test1.txt",
+            "test2.txt",
+            "test3.txt",
+            "test4.txt",
+        ]
+
+        lazy_documents = list(reader.lazy_load_data(num_workers=2))
+        assert [d.text for d in lazy_documents] == [d.text for d in documents]
+
+
+def test_num_workers_reads_ahead_boundedly() -> None:
+    """Test that workers parse a bounded number of files ahead of the consumer."""
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(20):
+            with open(f"{tmp_dir}/test{i:02}.txt", "w") as f:
+                f.write(f"test{i}")
+
+        reader = SimpleDirectoryReader(tmp_dir)
+        submitted = []
+
+        class InputFiles(list):
+            def __iter__(self):  # type: ignore[no-untyped-def]
+                for input_file in super().__iter__():
+                    submitted.append(input_file)
+                    yield input_file
+
+        file_documents = reader._iter_file_documents(
+            InputFiles(reader.input_files), num_workers=2
+        )
+        assert next(iter(file_documents))[0].text == "test0"
+        # two files per worker, and the one submitted after the first result
+        assert len(submitted) <= 5
+        assert len(list(file_documents)) == 19
+
+
+def test_incremental_manifest() -> None:
+    """Test that only new or changed files are loaded with a manifest."""
+    with TemporaryDirectory() as tmp_dir, TemporaryDirectory() as manifest_dir:
+        manifest_path = f"{manifest_dir}/manifest.json"
+        for i in range(1, 4):
+            with open(f"{tmp_dir}/test{i}.txt", "w") as f:
+                f.write(f"test{i}")
+
+        reader = SimpleDirectoryReader(tmp_dir, manifest_path=manifest_path)
+        documents = reader.load_data()
+        assert [d.text for d in documents] == ["test1", "test2", "test3"]
+        assert reader.deleted_files == []
+
+        # nothing changed
+        reader = SimpleDirectoryReader(tmp_dir, manifest_path=manifest_path)
+        assert reader.load_data() == []
+
+        # rewrite with identical content, change one file, add one, delete one
+        with open(f"{tmp_dir}/test1.txt", "w") as f:
+            f.write("test1")
+        with open(f"{tmp_dir}/test2.txt", "w") as f:
+            f.write("test2 changed")
+        with open(f"{tmp_dir}/test4.txt", "w") as f:
+            f.write("test4")
+        Path(f"{tmp_dir}/test3.txt").unlink()
+
+        reader = SimpleDirectoryReader(tmp_dir, manifest_path=manifest_path)
+        documents = reader.load_data()
+        assert [d.text for d in documents] == ["test2 changed", "test4"]
+        assert [f.name for f in reader.deleted_files] == ["test3.txt"]
+
+        reader = SimpleDirectoryReader(tmp_dir, manifest_path=manifest_path)
+        assert reader.load_data() == []
+        assert reader.deleted_files == []
+
+
+def test_globs_and_ignore_files() -> None:
+    """Test include/exclude globs and .gitignore-style ignore files."""
+    with TemporaryDirectory() as tmp_dir:
+        for name in [
+            "a.txt",
+            "b.md",
+            "build/c.txt",
+            "docs/d.md",
+            "docs/e.log",
+            "docs/keep.log",
+            "docs/sub/f.md",
+        ]:
+            Path(tmp_dir, name).parent.mkdir(parents=True, exist_ok=True)
+            with open(Path(tmp_dir, name), "w") as f:
+                f.write(name)
+
+        reader = SimpleDirectoryReader(
+            tmp_dir, recursive=True, include_globs=["*.md"], exclude_globs=["docs/sub"]
+        )
+        assert [f.name for f in reader.input_files] == ["b.md", "d.md"]
+
+        with open(Path(tmp_dir, "ignore"), "w") as f:
+            f.write("# comment\nbuild/\n*.log\n")
+        with open(Path(tmp_dir, "docs", "ignore"), "w") as f:
+            f.write("!keep.log\n/sub\n")
+
+        reader = SimpleDirectoryReader(
+            tmp_dir,
+            recursive=True,
+            ignore_file_names=["ignore"],
+            exclude_globs=["ignore", "*/ignore"],
+        )
+        assert [f.name for f in reader.input_files] == [
+            "a.txt",
+            "b.md",
+            "d.md",
+            "keep.log",
+        ]
+
+        reader = SimpleDirectoryReader(
+            tmp_dir, recursive=True, ignore_file_names=["ignore"], num_files_limit=3
+        )
+        assert [f.name for f in reader.input_files] == ["a.txt", "b.md", "ignore"]
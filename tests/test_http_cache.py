@@ -0,0 +1,194 @@
+"""Test the HTTP cache of web loaders."""
+from pathlib import Path
+
+import pytest
+import requests
+from werkzeug import Request, Response
+
+from llama_hub.http_cache import HTTPCache
+
+
+class VersionedPage:
+    """A page answering conditional requests for its current version."""
+
+    def __init__(self, body: str) -> None:
+        self.body = body
+        self.version = 1
+        self.validators = True
+        self.conditional_requests = 0
+
+    def __call__(self, request: Request) -> Response:
+        if not self.validators:
+            return Response(self.body, content_type="text/html")
+        etag = f'"v{self.version}"'
+        if request.headers.get("If-None-Match") is not None:
+            self.conditional_requests += 1
+            if request.headers["If-None-Match"] == etag:
+                return Response(status=304, headers={"ETag": etag})
+        return Response(self.body, content_type="text/html", headers={"ETag": etag})
+
+
+@pytest.fixture
+def page(httpserver):
+    page = VersionedPage("<h1>Hello</h1>")
+    httpserver.expect_request("/page").respond_with_handler(page)
+    return page
+
+
+def test_unchanged_page_is_served_from_cache(tmp_path, httpserver, page):
+    url = httpserver.url_for("/page")
+    cache = HTTPCache(tmp_path)
+
+    first = cache.get(requests, url)
+    second = cache.get(requests, url)
+
+    assert not first.from_cache
+    assert second.from_cache
+    assert second.text == first.text == "<h1>Hello</h1>"
+    assert second.content_type == "text/html"
+    assert page.conditional_requests == 1
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.bytes_saved) == (1, 1, 14)
+
+
+def test_changed_page_replaces_entry_and_derived_results(tmp_path, httpserver, page):
+    url = httpserver.url_for("/page")
+    cache = HTTPCache(tmp_path)
+    cache.get(requests, url)
+    cache.store_derived(url, "text", "Hello")
+    assert cache.load_derived(url, "text") == "Hello"
+
+    page.version, page.body = 2, "<h1>Bye</h1>"
+    response = cache.get(requests, url)
+
+    assert not response.from_cache
+    assert response.text == "<h1>Bye</h1>"
+    assert cache.load_derived(url, "text") is None
+    assert cache.get(requests, url).from_cache
+
+
+def test_responses_without_validators_are_not_stored(tmp_path, httpserver):
+    httpserver.expect_request("/plain").respond_with_data("data")
+    url = httpserver.url_for("/plain")
+    cache = HTTPCache(tmp_path)
+
+    cache.get(requests, url)
+
+    assert cache.conditional_headers(url) == {}
+    assert cache.size == 0
+    assert cache.stats.misses == 1
+
+
+def test_unstorable_response_removes_entry(tmp_path, httpserver, page):
+    url = httpserver.url_for("/page")
+    cache = HTTPCache(tmp_path)
+    assert cache.get(requests, url).stored
+    cache.store_derived(url, "text", "Hello")
+
+    page.validators, page.body = False, "<h1>Bye</h1>"
+    response = cache.get(requests, url)
+
+    assert response.text == "<h1>Bye</h1>"
+    assert not response.stored
+    assert cache.conditional_headers(url) == {}
+    assert cache.load_derived(url, "text") is None
+    assert cache.size == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_entries_are_tracked_without_listing_the_directory(
+    tmp_path, httpserver, page, monkeypatch
+):
+    url = httpserver.url_for("/page")
+    cache = HTTPCache(tmp_path)
+
+    def listdir(*args):
+        raise AssertionError("the cache directory was listed")
+
+    monkeypatch.setattr(Path, "glob", listdir)
+    monkeypatch.setattr(Path, "iterdir", listdir)
+    cache.get(requests, url)
+    cache.store_derived(url, "text", "Hello")
+    cache.get(requests, url)
+    page.version, page.body = 2, "<h1>Bye</h1>"
+    cache.get(requests, url)
+    monkeypatch.undo()
+
+    assert cache.load_derived(url, "text") is None
+    assert cache.size == sum(path.stat().st_size for path in tmp_path.iterdir())
+    assert HTTPCache(tmp_path).size == cache.size
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, httpserver):
+    for name in "abc":
+        httpserver.expect_request(f"/{name}").respond_with_data(
+            name * 100, headers={"ETag": f'"{name}"'}
+        )
+    urls = {name: httpserver.url_for(f"/{name}") for name in "abc"}
+    cache = HTTPCache(tmp_path, max_size=600)
+
+    cache.get(requests, urls["a"])
+    cache.get(requests, urls["b"])
+    cache.get(requests, urls["a"])
+    cache.get(requests, urls["c"])
+
+    assert cache.size <= 600
+    assert cache.stats.evictions == 1
+    assert cache.conditional_headers(urls["b"]) == {}
+    assert cache.conditional_headers(urls["a"]) == {"If-None-Match": '"a"'}
+
+    # the index is rebuilt from the files of a previous run
+    reloaded = HTTPCache(tmp_path, max_size=600)
+    assert reloaded.size == cache.size
+    assert reloaded.conditional_headers(urls["c"]) == {"If-None-Match": '"c"'}
+
+
+@pytest.mark.asyncio
+async def test_aget(tmp_path, httpserver, page):
+    aiohttp = pytest.importorskip("aiohttp")
+
+    url = httpserver.url_for("/page")
+    cache = HTTPCache(tmp_path)
+    async with aiohttp.ClientSession() as session:
+        first = await cache.aget(session, url)
+        second = await cache.aget(session, url)
+
+    assert not first.from_cache
+    assert second.from_cache
+    assert second.text == "<h1>Hello</h1>"
+    assert second.url == url
+
+
+def test_reader_skips_converting_unchanged_pages(tmp_path, httpserver, page):
+    pytest.importorskip("html2text")
+    from llama_hub.web.simple_web.base import SimpleWebPageReader
+
+    url = httpserver.url_for("/page")
+    cache = HTTPCache(tmp_path)
+    reader = SimpleWebPageReader(html_to_text=True, http_cache=cache)
+
+    first = reader.load_data([url])
+    second = reader.load_data([url])
+
+    assert [doc.text for doc in second] == [doc.text for doc in first]
+    assert first[0].text.strip() == "# Hello"
+    assert cache.stats.hits == 1
+    assert cache.stats.derived_hits == 1
+
+
+def test_reader_does_not_store_text_of_unstored_pages(tmp_path, httpserver, page):
+    pytest.importorskip("html2text")
+    from llama_hub.web.simple_web.base import SimpleWebPageReader
+
+    url = httpserver.url_for("/page")
+    cache = HTTPCache(tmp_path)
+    reader = SimpleWebPageReader(html_to_text=True, http_cache=cache)
+    reader.load_data([url])
+
+    # a version that cannot be stored, then the first version again
+    page.validators, page.body = False, "<h1>Bye</h1>"
+    assert reader.load_data([url])[0].text.strip() == "# Bye"
+    page.validators, page.body = True, "<h1>Hello</h1>"
+    assert reader.load_data([url])[0].text.strip() == "# Hello"
+    assert reader.load_data([url])[0].text.strip() == "# Hello"
+    assert cache.stats.derived_hits == 1
@@ -0,0 +1,85 @@
+"""Test lazy package exports."""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Dependencies that package init files must not import.
+HEAVY_MODULES = [
+    "aiohttp",
+    "bs4",
+    "fitz",
+    "httpx",
+    "llama_index",
+    "nltk",
+    "numpy",
+    "openai",
+    "pandas",
+    "pypdf",
+    "rdflib",
+    "torch",
+    "transformers",
+    "whisper",
+]
+
+# Init files that configure their package rather than declare exports.
+EAGER_PACKAGES = ["llama_hub.llama_packs.docugami_kg_rag.config"]
+
+# Generous bound on the time to import every package of llama_hub.
+IMPORT_TIME_BUDGET = 2.0
+
+IMPORT_ALL_PACKAGES = """
+import importlib, json, pathlib, sys, time
+
+eager = set(sys.argv[1].split(","))
+packages = [
+    ".".join(path.parent.parts)
+    for path in sorted(pathlib.Path("llama_hub").rglob("__init__.py"))
+]
+failed = []
+start = time.perf_counter()
+for package in packages:
+    if package in eager:
+        continue
+    try:
+        importlib.import_module(package)
+    except Exception as e:
+        failed.append(f"{package}: {e!r}")
+seconds = time.perf_counter() - start
+heavy = [module for module in sys.argv[2].split(",") if module in sys.modules]
+print(json.dumps({"failed": failed, "heavy": heavy, "seconds": seconds}))
+"""
+
+
+def test_package_imports_are_lazy() -> None:
+    """Test that importing any package does not import heavy dependencies."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            IMPORT_ALL_PACKAGES,
+            ",".join(EAGER_PACKAGES),
+            ",".join(HEAVY_MODULES),
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert report["failed"] == []
+    assert report["heavy"] == [], "package init files imported heavy modules"
+    assert report["seconds"] < IMPORT_TIME_BUDGET
+
+
+def test_lazy_exports_resolve_on_access() -> None:
+    """Test that exported names resolve to the objects of their module."""
+    import llama_hub.file.json as package
+    from llama_hub.file.json.base import JSONReader
+
+    assert "JSONReader" in dir(package)
+    assert package.JSONReader is JSONReader
+    assert "JSONReader" in vars(package)
@@ -0,0 +1,79 @@
+"""Test llama_hub utils."""
+import json
+import time
+from tempfile import TemporaryDirectory
+from typing import Any, List
+
+from llama_index.readers.base import BaseReader
+from llama_index.readers.schema.base import Document
+
+from llama_hub.file.base import SimpleDirectoryReader
+from llama_hub.file.markdown.base import MarkdownReader
+from llama_hub.utils import import_loader, load_library
+
+
+def test_import_loader_parses_library_once(mocker: Any) -> None:
+    """Test that the library manifest is parsed once and lookups are memoized."""
+    load_library.cache_clear()
+    import_loader.cache_clear()
+    json_load = mocker.spy(json, "load")
+
+    assert import_loader("MarkdownReader") is MarkdownReader
+    assert import_loader("MarkdownReader") is MarkdownReader
+    import_loader("SimpleDirectoryReader")
+    assert json_load.call_count == 1
+
+
+def test_import_loader_lookup_benchmark() -> None:
+    """Guard against regressions in manifest startup and loader lookup time."""
+    load_library.cache_clear()
+    import_loader.cache_clear()
+
+    start = time.perf_counter()
+    import_loader("MarkdownReader")
+    startup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(10000):
+        import_loader("MarkdownReader")
+    lookups = time.perf_counter() - start
+
+    assert startup < 5.0
+    # memoized lookups should cost about as much as a dict access
+    assert lookups < 0.5
+
+
+def test_reader_instances_reused(mocker: Any) -> None:
+    """Test that readers given by name are instantiated once per load."""
+    instances: List[BaseReader] = []
+
+    class CountingReader(BaseReader):
+        def __init__(self) -> None:
+            instances.append(self)
+
+        def load_data(self, file: Any, extra_info: Any = None) -> List[Document]:
+            return [Document(text=file.name)]
+
+    mocker.patch("llama_hub.utils.import_loader", return_value=CountingReader)
+
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(1, 4):
+            with open(f"{tmp_dir}/test{i}.md", "w") as f:
+                f.write(f"test{i}")
+        with open(f"{tmp_dir}/test4.mdx", "w") as f:
+            f.write("test4")
+
+        reader = SimpleDirectoryReader(
+            tmp_dir, file_extractor={".md": "Counting", ".mdx": "Counting"}
+        )
+        documents = reader.load_data()
+        assert [d.text for d in documents] == [
+            "test1.md",
+            "test2.md",
+            "test3.md",
+            "test4.mdx",
+        ]
+        assert len(instances) == 1
+
+        reader.load_data()
+        assert len(instances) == 2
@@ -1,5 +1,7 @@
+import asyncio
 import base64
 import os
+import time
 import unittest
 from typing import List, Tuple
 from unittest.mock import MagicMock
@@ -7,7 +9,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from llama_hub.github_repo.base import GithubRepositoryReader
-from llama_hub.github_repo.github_client import GithubClient
+from llama_hub.github_repo.github_client import GithubClient, RateLimitScheduler
 
 # Remove this to test changes to GithubRepositoryReader.
 # pytest.skip(
@@ -389,3 +391,108 @@ class TestGithubRepositoryReader(unittest.TestCase):
         self.assertCountEqual(
             expected_tree_obj_paths, actual_tree_obj_paths
         ), "Tree object paths are incorrect"
+
+
+@pytest.mark.asyncio
+async def test_github_client_reuses_pooled_connection(httpserver):
+    blob = {
+        "content": base64.b64encode(b"hello world").decode(),
+        "encoding": "base64",
+        "url": "",
+        "sha": "1234",
+        "size": 11,
+        "node_id": "",
+    }
+    httpserver.expect_request("/repos/owner/repo/git/blobs/1234").respond_with_json(
+        blob
+    )
+
+    async with GithubClient(
+        github_token="token", base_url=httpserver.url_for("")
+    ) as github_client:
+        blob_data = await github_client.get_blob("owner", "repo", "1234")
+        pooled_client = github_client._client
+        assert pooled_client is not None
+        blob_data = await github_client.get_blob("owner", "repo", "1234")
+        assert github_client._client is pooled_client
+        assert base64.b64decode(blob_data.content) == b"hello world"
+
+    assert pooled_client.is_closed
+    assert github_client._client is None
+    request, _ = httpserver.log[0]
+    assert request.headers["Authorization"] == "Bearer token"
+
+
+def test_github_client_closes_client_of_previous_loop(httpserver):
+    blob = {
+        "content": base64.b64encode(b"hello world").decode(),
+        "encoding": "base64",
+        "url": "",
+        "sha": "1234",
+        "size": 11,
+        "node_id": "",
+    }
+    httpserver.expect_request("/repos/owner/repo/git/blobs/1234").respond_with_json(
+        blob
+    )
+    github_client = GithubClient(github_token="token", base_url=httpserver.url_for(""))
+    first_loop, second_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        first_loop.run_until_complete(github_client.get_blob("owner", "repo", "1234"))
+        first_client = github_client._client
+
+        second_loop.run_until_complete(github_client.get_blob("owner", "repo", "1234"))
+
+        assert first_client.is_closed
+        assert github_client._client is not first_client
+        second_loop.run_until_complete(github_client.aclose())
+    finally:
+        first_loop.close()
+        second_loop.close()
+
+
+@pytest.mark.asyncio
+async def test_github_client_retries_rate_limited_requests(httpserver):
+    blob = {
+        "content": base64.b64encode(b"hello world").decode(),
+        "encoding": "base64",
+        "url": "",
+        "sha": "1234",
+        "size": 11,
+        "node_id": "",
+    }
+    httpserver.expect_oneshot_request(
+        "/repos/owner/repo/git/blobs/1234"
+    ).respond_with_data(
+        "rate limited",
+        status=429,
+        headers={"Retry-After": "0", "X-RateLimit-Remaining": "0"},
+    )
+    httpserver.expect_request("/repos/owner/repo/git/blobs/1234").respond_with_json(
+        blob, headers={"X-RateLimit-Remaining": "4999"}
+    )
+
+    async with GithubClient(
+        github_token="token", base_url=httpserver.url_for("")
+    ) as github_client:
+        blob_data = await github_client.get_blob("owner", "repo", "1234")
+
+    assert base64.b64decode(blob_data.content) == b"hello world"
+    assert len(httpserver.log) == 2
+
+
+def test_rate_limit_scheduler_pauses_until_reset():
+    scheduler = RateLimitScheduler(max_wait=120)
+    response = MagicMock(
+        status_code=200,
+        headers={
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) + 60),
+        },
+    )
+    assert scheduler.update(response) is None
+    assert 50 < scheduler._resume_at - time.monotonic() <= 61
+
+    response.status_code = 403
+    response.headers = {"X-RateLimit-Remaining": "10"}
+    assert scheduler.update(response) is None
@@ -1,9 +1,13 @@
+import base64
+import io
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple
 from unittest.mock import AsyncMock, MagicMock, call
 
 import httpx
 import pytest
 from llama_index import Document
+from llama_index.readers.base import BaseReader
 
 from llama_hub.github_repo.base import GithubRepositoryReader
 from llama_hub.github_repo.github_client import (
@@ -12,6 +16,7 @@ from llama_hub.github_repo.github_client import (
     GithubClient,
     GitTreeResponseModel,
 )
+from llama_hub.github_repo.utils import GitBlobCache
 
 ## Test GithubRepositoryReader's _recurse_tree method
 
@@ -1204,3 +1209,233 @@ def test_load_data_with_filters4():
         )
         assert expected.extra_info["file_path"] == actual.extra_info["file_path"]
         assert expected.extra_info["file_name"] == actual.extra_info["file_name"]
+
+
+def _make_tree_obj(
+    path: str, type: str, sha: str
+) -> GitTreeResponseModel.GitTreeObject:
+    return GitTreeResponseModel.GitTreeObject(
+        type=type,
+        path=path,
+        sha=sha,
+        mode="040000" if type == "tree" else "100644",
+        size=None if type == "tree" else 100,
+        url=f"https://api.github.com/repos/owner/repo/git/{type}s/{sha}",
+    )
+
+
+def get_mocked_recursive_github_client(truncated: bool = False) -> MagicMock:
+    # full path, type and sha of every object in the repo
+    repo_objects = [
+        ("README.md", "blob", "1"),
+        ("docs", "tree", "2"),
+        ("docs/index.md", "blob", "3"),
+        ("docs/assets", "tree", "4"),
+        ("docs/assets/logo.png", "blob", "5"),
+        ("src", "tree", "6"),
+        ("src/main.py", "blob", "7"),
+        ("src/tests", "tree", "8"),
+        ("src/tests/test_main.py", "blob", "9"),
+    ]
+    tree_shas = {"root": ""}
+    tree_shas.update({sha: path for path, type, sha in repo_objects if type == "tree"})
+
+    async def get_tree_side_effect(owner, repo, sha, timeout=None, recursive=False):
+        if recursive:
+            return GitTreeResponseModel(
+                sha=sha,
+                url="",
+                tree=[_make_tree_obj(*obj) for obj in repo_objects],
+                truncated=truncated,
+            )
+        dir_path = tree_shas[sha]
+        children = [
+            _make_tree_obj(path.rpartition("/")[2], type, obj_sha)
+            for path, type, obj_sha in repo_objects
+            if path.rpartition("/")[0] == dir_path
+        ]
+        return GitTreeResponseModel(sha=sha, url="", tree=children, truncated=False)
+
+    github_client = MagicMock()
+    github_client.get_tree = AsyncMock(side_effect=get_tree_side_effect)
+    return github_client
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("truncated", [False, True])
+async def test__list_tree_recursive(truncated):
+    filters = [
+        (None, None),
+        (
+            (["docs/assets", "src/tests"], GithubRepositoryReader.FilterType.EXCLUDE),
+            None,
+        ),
+        (
+            (["src"], GithubRepositoryReader.FilterType.INCLUDE),
+            ([".py"], GithubRepositoryReader.FilterType.INCLUDE),
+        ),
+        (
+            (["docs"], GithubRepositoryReader.FilterType.EXCLUDE),
+            ([".md"], GithubRepositoryReader.FilterType.EXCLUDE),
+        ),
+    ]
+    for filter_directories, filter_file_extensions in filters:
+        github_client = get_mocked_recursive_github_client(truncated)
+        walking_reader = GithubRepositoryReader(
+            github_client,
+            "owner",
+            "repo",
+            filter_directories=filter_directories,
+            filter_file_extensions=filter_file_extensions,
+        )
+        recursive_reader = GithubRepositoryReader(
+            github_client,
+            "owner",
+            "repo",
+            filter_directories=filter_directories,
+            filter_file_extensions=filter_file_extensions,
+            recursive_tree_listing=True,
+        )
+
+        expected = [path for _, path in await walking_reader._list_tree("root")]
+        github_client.get_tree.reset_mock()
+        actual = [path for _, path in await recursive_reader._list_tree("root")]
+
+        assert sorted(actual) == sorted(expected)
+        if truncated:
+            # the truncated listing is followed by a walk of the tree
+            assert github_client.get_tree.call_count > 1
+        else:
+            github_client.get_tree.assert_called_once_with(
+                "owner", "repo", "root", timeout=5, recursive=True
+            )
+
+
+def get_mocked_cached_github_client() -> MagicMock:
+    github_client = get_mocked_recursive_github_client()
+
+    async def get_branch_side_effect(owner, repo, branch, timeout=None):
+        return GitBranchResponseModel.from_dict(
+            {
+                "name": branch,
+                "commit": {"commit": {"tree": {"sha": "root"}}},
+                "_links": {"self": "", "html": ""},
+            }
+        )
+
+    async def get_blob_side_effect(owner, repo, sha):
+        return GitBlobResponseModel(
+            sha=sha,
+            url="",
+            content=base64.b64encode(f"content of blob {sha}".encode()).decode(),
+            encoding="base64",
+            size=100,
+            node_id="",
+        )
+
+    github_client.get_branch = AsyncMock(side_effect=get_branch_side_effect)
+    github_client.get_blob = AsyncMock(side_effect=get_blob_side_effect)
+    return github_client
+
+
+def test_load_data_with_blob_cache(tmp_path):
+    blob_cache = GitBlobCache(str(tmp_path / "blobs.sqlite3"))
+
+    github_client = get_mocked_cached_github_client()
+    reader = GithubRepositoryReader(
+        github_client=github_client,
+        owner="owner",
+        repo="repo",
+        blob_cache=blob_cache,
+    )
+    docs = reader.load_data(branch="test-branch-name")
+    assert len(docs) == 5
+    assert github_client.get_blob.call_count == len(docs)
+
+    github_client = get_mocked_cached_github_client()
+    reader = GithubRepositoryReader(
+        github_client=github_client,
+        owner="owner",
+        repo="repo",
+        blob_cache=blob_cache,
+    )
+    cached_docs = reader.load_data(branch="test-branch-name")
+    github_client.get_blob.assert_not_called()
+    assert sorted((doc.doc_id, doc.text) for doc in cached_docs) == sorted(
+        (doc.doc_id, doc.text) for doc in docs
+    )
+
+
+def test_load_data_parses_in_memory(mocker):
+    class InMemoryReader(BaseReader):
+        def load_data(self, file, extra_info=None):
+            assert isinstance(file, io.BytesIO)
+            return [Document(text=f"parsed {file.read().decode()}")]
+
+    mocker.patch.dict(
+        "llama_hub.github_repo.base.IN_MEMORY_FILE_READER_CLS",
+        {".py": InMemoryReader},
+    )
+    github_client = get_mocked_cached_github_client()
+    with ThreadPoolExecutor(max_workers=2) as parse_executor:
+        reader = GithubRepositoryReader(
+            github_client=github_client,
+            owner="owner",
+            repo="repo",
+            use_parser=True,
+            parse_executor=parse_executor,
+            filter_file_extensions=(
+                [".py"],
+                GithubRepositoryReader.FilterType.INCLUDE,
+            ),
+        )
+        docs = reader.load_data(branch="test-branch-name")
+
+    texts = {doc.extra_info["file_path"]: doc.text for doc in docs}
+    assert texts["src/main.py"] == "parsed content of blob 7"
+    assert texts["src/tests/test_main.py"] == "parsed content of blob 9"
+
+
+@pytest.mark.asyncio
+async def test_alazy_load_data():
+    github_client = get_mocked_cached_github_client()
+    reader = GithubRepositoryReader(
+        github_client=github_client,
+        owner="owner",
+        repo="repo",
+        concurrent_requests=2,
+        buffer_size=1,
+    )
+    assert reader._loop is None
+
+    documents = reader.alazy_load_data(branch="test-branch-name")
+    first_document = await documents.__anext__()
+    assert first_document.extra_info["file_path"] == "README.md"
+    # only the blobs in the buffer have been fetched so far
+    assert github_client.get_blob.call_count == 2
+
+    remaining_documents = [document async for document in documents]
+    assert [d.extra_info["file_path"] for d in remaining_documents] == [
+        "docs/index.md",
+        "docs/assets/logo.png",
+        "src/main.py",
+        "src/tests/test_main.py",
+    ]
+
+
+def test_lazy_load_data():
+    github_client = get_mocked_cached_github_client()
+    reader = GithubRepositoryReader(
+        github_client=github_client, owner="owner", repo="repo"
+    )
+
+    documents = reader.lazy_load_data(commit_sha=None, branch="test-branch-name")
+    assert next(documents).text == "content of blob 1"
+    assert [d.doc_id for d in documents] == ["3", "5", "7", "9"]
+    assert [d.doc_id for d in reader.load_data(branch="test-branch-name")] == [
+        "1",
+        "3",
+        "5",
+        "7",
+        "9",
+    ]
@@ -7,6 +7,7 @@ from llama_hub.github_repo.github_client import GitTreeResponseModel
 from llama_hub.github_repo.utils import (
     BufferedAsyncIterator,
     BufferedGitBlobDataIterator,
+    GitBlobCache,
 )
 
 # Remove this to test changes to GithubRepositoryReader.
@@ -164,3 +165,58 @@ async def test_buffered_git_blob_data_iterator():
     assert it._index == 4
     with pytest.raises(StopAsyncIteration):
         await it.__anext__()
+
+
+def test_git_blob_cache(tmp_path):
+    cache = GitBlobCache(str(tmp_path / "blobs.sqlite3"), max_size_bytes=10)
+    assert cache.get("sha-1") is None
+
+    cache.put("sha-1", b"1234")
+    cache.put("sha-2", b"5678")
+    assert cache.get("sha-1") == b"1234"
+    assert cache.get_text("sha-1") is None
+    cache.put_text("sha-1", "12")
+    assert cache.get_text("sha-1") == "12"
+    assert cache.size() == 10
+    assert len(cache) == 2
+
+    # sha-2 is the least recently used blob, so it is evicted first
+    cache.put("sha-3", b"9")
+    assert cache.get("sha-2") is None
+    assert cache.get("sha-1") == b"1234"
+    assert cache.get("sha-3") == b"9"
+    cache.close()
+
+    # the cache persists across instances
+    cache = GitBlobCache(str(tmp_path / "blobs.sqlite3"))
+    assert cache.get("sha-1") == b"1234"
+    assert cache.get_text("sha-1") == "12"
+    cache.close()
+
+
+def test_git_blob_cache_batches_access_writes(tmp_path):
+    path = str(tmp_path / "blobs.sqlite3")
+    cache = GitBlobCache(path, max_size_bytes=8, access_batch_size=2)
+    cache.put("sha-1", b"12")
+    cache.put("sha-2", b"34")
+    cache.put_text("sha-2", "5")
+
+    # reads do not write until a batch is complete
+    changes = cache._conn.total_changes
+    cache.get("sha-1")
+    cache.get("sha-1")
+    assert cache._conn.total_changes == changes
+    cache.get_text("sha-2")
+    assert cache._conn.total_changes == changes + 2
+
+    # sha-1 was read after sha-2, so sha-2 is evicted first
+    cache.get("sha-1")
+    cache.put("sha-3", b"6789")
+    assert cache.get("sha-2") is None
+    assert cache.size() == 6
+    cache.close()
+
+    cache = GitBlobCache(path)
+    assert cache.size() == 6
+    assert len(cache) == 2
+    cache.close()
@@ -0,0 +1,54 @@
+import pytest
+
+from llama_hub.remote_depth.base import RemoteDepthReader
+
+pytest.importorskip("bs4")
+pytest.importorskip("aiohttp")
+
+PAGES = {
+    "/": '<a href="/a">a</a> <a href="/b?x=1">b</a> <a href="/">home</a>',
+    "/a": '<a href="/b">b</a> <a href="/c">c</a>',
+    "/b": '<a href="/a">a</a> <a href="/d">d</a>',
+    "/c": "leaf c",
+    "/d": "leaf d",
+}
+
+
+@pytest.fixture
+def site(httpserver):
+    for path, body in PAGES.items():
+        httpserver.expect_request(path).respond_with_data(
+            body, content_type="text/html"
+        )
+    return httpserver
+
+
+def test_crawl_fetches_each_page_once(site):
+    url = site.url_for("/")
+    reader = RemoteDepthReader(depth=1)
+    documents = reader.load_data(url)
+
+    sources = [doc.extra_info["Source"] for doc in documents]
+    # the starting page, then its links, then theirs, in discovery order
+    assert sources == [site.url_for(path) for path in ["/", "/a", "/b", "/c", "/d"]]
+    requested = [request.path for request, _ in site.log]
+    assert sorted(requested) == ["/", "/a", "/b", "/c", "/d"]
+
+
+def test_crawl_streams_levels(site):
+    reader = RemoteDepthReader(depth=0)
+    documents = reader.lazy_load_data(site.url_for("/"))
+    assert next(documents).extra_info["Source"] == site.url_for("/")
+    assert [doc.extra_info["Source"] for doc in documents] == [
+        site.url_for("/a"),
+        site.url_for("/b"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_load_data_inside_running_loop(site):
+    reader = RemoteDepthReader(depth=0)
+    documents = reader.load_data(site.url_for("/"))
+    assert [doc.extra_info["Source"] for doc in documents] == [
+        site.url_for(path) for path in ["/", "/a", "/b"]
+    ]
@@ -6,16 +6,6 @@ from werkzeug.wrappers import Request, Response
 from llama_hub.web.async_web.base import AsyncWebPageReader
 
 
-@pytest.fixture(scope="session")
-def httpserver_listen_address():
-    return ("localhost", 8888)
-
-
-TEST_URL = "http://localhost:8888/primary.xml"
-TEST_URL_OTHER = "http://localhost:8888/other.xml"
-TEST_URL_ERROR = "http://localhost:8888/failme"
-
-
 class TestAsyncWebPageReader(unittest.TestCase):
     def failme_handler(self, response: Request):
         return Response("Boo!", status=500)
@@ -31,6 +21,9 @@ class TestAsyncWebPageReader(unittest.TestCase):
         httpserver.expect_request("/primary.xml", method="GET").respond_with_data(
             "Some big data chunk!"
         )
+        self.test_url = httpserver.url_for("/primary.xml")
+        self.test_url_other = httpserver.url_for("/other.xml")
+        self.test_url_error = httpserver.url_for("/failme")
 
     def test_async_web_reader_init(self):
         # test w/o args
@@ -51,16 +44,16 @@ class TestAsyncWebPageReader(unittest.TestCase):
     def test_async_web_reader_load_data(self):
         reader = AsyncWebPageReader()
 
-        documents = reader.load_data(urls=[TEST_URL])
+        documents = reader.load_data(urls=[self.test_url])
 
         assert len(documents) == 1
         assert documents[0].text == "Some big data chunk!"
-        assert documents[0].extra_info["Source"] == "http://localhost:8888/primary.xml"
+        assert documents[0].extra_info["Source"] == self.test_url
 
     def test_async_web_reader_load_data_consume_error(self):
         reader = AsyncWebPageReader()
 
-        documents = reader.load_data(urls=[TEST_URL_ERROR])
+        documents = reader.load_data(urls=[self.test_url_error])
 
         assert len(documents) == 0
 
@@ -70,19 +63,61 @@ class TestAsyncWebPageReader(unittest.TestCase):
         with pytest.raises(
             ValueError,
             match=(
-                "error fetching page from http://localhost:8888/failme. server returned"
+                f"error fetching page from {self.test_url_error}. server returned"
                 " status: 500 and response Boo!"
             ),
         ):
-            reader.load_data(urls=[TEST_URL_ERROR])
+            reader.load_data(urls=[self.test_url_error])
 
     def test_async_web_reader_load_data_dedupe(self):
         reader = AsyncWebPageReader(dedupe=True)
 
-        documents = reader.load_data(urls=[TEST_URL, TEST_URL_OTHER, TEST_URL])
+        documents = reader.load_data(
+            urls=[self.test_url, self.test_url_other, self.test_url]
+        )
 
         assert len(documents) == 2
         assert documents[0].text == "Some big data chunk!"
-        assert documents[0].extra_info["Source"] == "http://localhost:8888/primary.xml"
+        assert documents[0].extra_info["Source"] == self.test_url
         assert documents[1].text == "Some big data chunk!"
-        assert documents[1].extra_info["Source"] == "http://localhost:8888/other.xml"
+        assert documents[1].extra_info["Source"] == self.test_url_other
+
+
+def test_async_web_reader_retries_transient_errors(httpserver):
+    httpserver.expect_ordered_request("/flaky").respond_with_data("busy", status=503)
+    httpserver.expect_ordered_request("/flaky").respond_with_data("<h1>Ready</h1>")
+    reader = AsyncWebPageReader(html_to_text=True, retry_backoff=0.01)
+
+    documents = reader.load_data(urls=[httpserver.url_for("/flaky")])
+
+    assert [doc.text.strip() for doc in documents] == ["# Ready"]
+
+
+def test_async_web_reader_gives_up_after_max_retries(httpserver):
+    httpserver.expect_request("/down").respond_with_data("busy", status=503)
+    reader = AsyncWebPageReader(max_retries=1, retry_backoff=0.01)
+
+    assert reader.load_data(urls=[httpserver.url_for("/down")]) == []
+    assert len(httpserver.log) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_web_reader_streams_documents(httpserver):
+    paths = [f"/page{i}" for i in range(5)]
+    for path in paths:
+        httpserver.expect_request(path).respond_with_data(f"<p>{path}</p>")
+    urls = [httpserver.url_for(path) for path in paths]
+    reader = AsyncWebPageReader(
+        html_to_text=True, limit=2, max_connections_per_host=2, text_workers=2
+    )
+
+    streamed = [doc async for doc in reader.alazy_load_data(urls)]
+    assert sorted(doc.extra_info["Source"] for doc in streamed) == sorted(urls)
+
+    documents = await reader.aload_data(urls)
+    assert [doc.text.strip() for doc in documents] == paths
+
+    # the sync API also works from inside a running event loop
+    assert [doc.text for doc in reader.load_data(urls)] == [
+        doc.text for doc in documents
+    ]
@@ -0,0 +1,58 @@
+import pytest
+
+from llama_hub.web.rss.base import RssReader
+
+pytest.importorskip("feedparser")
+
+FEED = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>{name}</title>
+<item><title>{name} café</title><link>/posts/1</link>
+<description>&lt;p&gt;First {name}&lt;/p&gt;</description></item>
+<item><title>{name} two</title><link>/posts/2</link>
+<description>&lt;p&gt;Second {name}&lt;/p&gt;</description></item>
+</channel></rss>"""
+
+
+@pytest.fixture
+def feeds(httpserver):
+    for name in ["a", "b", "c"]:
+        # the charset is only given by the HTTP header
+        httpserver.expect_request(f"/{name}.xml").respond_with_data(
+            FEED.format(name=name).encode("iso-8859-1"),
+            content_type="application/rss+xml; charset=iso-8859-1",
+        )
+    return httpserver
+
+
+def test_load_data_keeps_feed_order(feeds):
+    urls = [feeds.url_for(f"/{name}.xml") for name in ["a", "b", "c"]]
+    reader = RssReader(num_workers=3)
+
+    documents = reader.load_data(urls)
+
+    assert [doc.text for doc in documents] == [
+        f"<p>{nth} {name}</p>" for name in "abc" for nth in ["First", "Second"]
+    ]
+    assert documents[0].extra_info == {
+        "title": "a café",
+        "link": feeds.url_for("/posts/1"),
+    }
+
+
+def test_dead_feed_does_not_abort_batch(feeds):
+    urls = ["http://localhost:1/dead.xml", feeds.url_for("/a.xml")]
+    reader = RssReader(num_workers=2, timeout=5)
+
+    documents = reader.load_data(urls)
+
+    assert [doc.extra_info["title"] for doc in documents] == ["a café", "a two"]
+
+
+@pytest.mark.parametrize("text_workers", [None, 2])
+def test_html_to_text(feeds, text_workers):
+    pytest.importorskip("html2text")
+
+    reader = RssReader(html_to_text=True, text_workers=text_workers)
+    documents = reader.load_data([feeds.url_for("/b.xml")])
+
+    assert [doc.text.strip() for doc in documents] == ["First b", "Second b"]
@@ -0,0 +1,35 @@
+import pytest
+
+from llama_hub.web.simple_web.base import SimpleWebPageReader
+
+PAGES = {f"/{i}": f"<h1>Page {i}</h1>" for i in range(8)}
+
+
+@pytest.fixture
+def site(httpserver):
+    for path, body in PAGES.items():
+        httpserver.expect_request(path).respond_with_data(
+            body, content_type="text/html"
+        )
+    return httpserver
+
+
+def test_load_data_keeps_url_order(site):
+    urls = [site.url_for(path) for path in PAGES]
+    reader = SimpleWebPageReader(num_workers=4)
+    documents = reader.load_data(urls)
+    assert [doc.text for doc in documents] == list(PAGES.values())
+
+
+@pytest.mark.parametrize("text_workers", [None, 2])
+def test_html_to_text(site, text_workers):
+    pytest.importorskip("html2text")
+
+    urls = [site.url_for(path) for path in PAGES]
+    reader = SimpleWebPageReader(
+        html_to_text=True, num_workers=2, text_workers=text_workers
+    )
+    documents = reader.load_data(urls)
+    assert [doc.text.strip() for doc in documents] == [
+        f"# Page {i}" for i in range(len(PAGES))
+    ]
@@ -1,3 +1,5 @@
+import gzip
+import json
 import unittest
 from unittest.mock import patch
 
@@ -6,15 +8,13 @@ from llama_index.readers.schema.base import Document
 
 from llama_hub.web.sitemap.base import SitemapReader
 
-MOCK_URL = "https://gpt-index.readthedocs.io/sitemap.xml"
-
 
 def get_sitemapdata():
     f = open("tests/tests_web_sitemap/test_sitemap.xml", "r")
     return f.read()
 
 
-def dummy_load_pages(urls: str):
+async def dummy_load_pages(urls: str):
     documents = []
     for u in urls:
         doc = Document(text="Bla", extra_info={"Source": u})
@@ -22,7 +22,36 @@ def dummy_load_pages(urls: str):
     return documents
 
 
+def sitemap(urls):
+    entries = "".join(
+        f"<url><loc>{loc}</loc><lastmod>{lastmod}</lastmod></url>"
+        for loc, lastmod in urls
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{entries}</urlset>'
+    )
+
+
+def sitemap_index(sitemaps):
+    entries = "".join(
+        f"<sitemap><loc>{loc}</loc><lastmod>{lastmod}</lastmod></sitemap>"
+        for loc, lastmod in sitemaps
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><sitemapindex'
+        f' xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{entries}</sitemapindex>'
+    )
+
+
 class TestSitemapReader(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def setup(self, httpserver):
+        httpserver.expect_request("/sitemap.xml").respond_with_data(
+            get_sitemapdata(), content_type="application/xml"
+        )
+        self.sitemap_url = httpserver.url_for("/sitemap.xml")
+
     def test_sitemap_reader_init(self):
         # test w/o args
         SitemapReader()
@@ -39,49 +68,170 @@ class TestSitemapReader(unittest.TestCase):
         ):
             sitemap_reader.load_data()
 
-    @patch("llama_hub.web.async_web.base.AsyncWebPageReader.load_data")
+    @patch("llama_hub.web.async_web.base.AsyncWebPageReader.aload_data")
     def test_sitemap_reader_load_data(self, mock_load_data):
-        with patch("urllib.request.urlopen") as mock_urlopen:
-            sitemap_reader = SitemapReader()
-
-            # mock sitemap call
-            mock_response = mock_urlopen.return_value
-            mock_response.read.return_value = get_sitemapdata()
-
-            mock_load_data.side_effect = dummy_load_pages
+        sitemap_reader = SitemapReader()
+        mock_load_data.side_effect = dummy_load_pages
 
-            documents = sitemap_reader.load_data(sitemap_url=MOCK_URL)
+        documents = sitemap_reader.load_data(sitemap_url=self.sitemap_url)
 
-            mock_urlopen.assert_called_once_with(
-                "https://gpt-index.readthedocs.io/sitemap.xml"
-            )
-            mock_response.read.assert_called_once()
-            assert mock_load_data.call_count == 1
-            assert len(documents) == 38
+        assert mock_load_data.call_count == 1
+        assert len(documents) == 38
 
-    @patch("llama_hub.web.async_web.base.AsyncWebPageReader.load_data")
+    @patch("llama_hub.web.async_web.base.AsyncWebPageReader.aload_data")
     def test_sitemap_reader_load_data_with_filter(self, mock_load_data):
-        with patch("urllib.request.urlopen") as mock_urlopen:
-            sitemap_reader = SitemapReader()
-
-            # mock sitemap call
-            mock_response = mock_urlopen.return_value
-            mock_response.read.return_value = get_sitemapdata()
-
-            mock_load_data.side_effect = dummy_load_pages
-
-            documents = sitemap_reader.load_data(
-                sitemap_url=MOCK_URL,
-                filter="https://gpt-index.readthedocs.io/en/latest/",
-            )
-
-            mock_urlopen.assert_called_once_with(
-                "https://gpt-index.readthedocs.io/sitemap.xml"
-            )
-            mock_response.read.assert_called_once()
-            assert mock_load_data.call_count == 1
-            assert len(documents) == 1
-            assert (
-                documents[0].extra_info["Source"]
-                == "https://gpt-index.readthedocs.io/en/latest/"
-            )
+        sitemap_reader = SitemapReader()
+        mock_load_data.side_effect = dummy_load_pages
+
+        documents = sitemap_reader.load_data(
+            sitemap_url=self.sitemap_url,
+            filter="https://gpt-index.readthedocs.io/en/latest/",
+        )
+
+        assert mock_load_data.call_count == 1
+        assert len(documents) == 1
+        assert (
+            documents[0].extra_info["Source"]
+            == "https://gpt-index.readthedocs.io/en/latest/"
+        )
+
+
+@patch("llama_hub.web.async_web.base.AsyncWebPageReader.aload_data")
+def test_sitemap_index_is_followed(mock_load_data, httpserver):
+    mock_load_data.side_effect = dummy_load_pages
+    httpserver.expect_request("/index.xml").respond_with_data(
+        sitemap_index(
+            [
+                (httpserver.url_for("/pages.xml"), "2024-01-01"),
+                (httpserver.url_for("/posts.xml.gz"), "2024-01-01"),
+            ]
+        )
+    )
+    httpserver.expect_request("/pages.xml").respond_with_data(
+        sitemap([("https://example.com/a", "2024-01-01")])
+    )
+    httpserver.expect_request("/posts.xml.gz").respond_with_data(
+        gzip.compress(sitemap([("https://example.com/b", "2024-01-01")]).encode()),
+        content_type="application/gzip",
+    )
+
+    documents = SitemapReader().load_data(httpserver.url_for("/index.xml"))
+
+    assert [doc.extra_info["Source"] for doc in documents] == [
+        "https://example.com/a",
+        "https://example.com/b",
+    ]
+
+
+async def dummy_load_indexed(urls):
+    for i, url in enumerate(urls):
+        if "broken" in url:
+            continue
+        # redirected pages have a different source
+        source = url + "/" if "redirected" in url else url
+        yield i, Document(text="Bla", extra_info={"Source": source})
+
+
+@patch("llama_hub.web.async_web.base.AsyncWebPageReader._aload_indexed")
+def test_only_pages_modified_since_watermark_are_loaded(
+    mock_load_indexed, httpserver, tmp_path
+):
+    mock_load_indexed.side_effect = dummy_load_indexed
+    pages = [
+        ("https://example.com/old", "2024-01-01T00:00:00Z"),
+        ("https://example.com/new", "2024-01-02T00:00:00+00:00"),
+    ]
+    httpserver.expect_request("/sitemap.xml").respond_with_data(sitemap(pages))
+    url = httpserver.url_for("/sitemap.xml")
+    watermark_path = tmp_path / "watermarks.json"
+    reader = SitemapReader(watermark_path=watermark_path)
+
+    assert len(reader.load_data(url)) == 2
+    assert reader.load_data(url) == []
+
+    pages.append(("https://example.com/newer", "2024-01-03"))
+    httpserver.clear_all_handlers()
+    httpserver.expect_request("/sitemap.xml").respond_with_data(sitemap(pages))
+    documents = reader.load_data(url)
+
+    assert [doc.extra_info["Source"] for doc in documents] == [
+        "https://example.com/newer"
+    ]
+    watermarks = json.loads(watermark_path.read_text())
+    assert watermarks[url] == {
+        "": {"watermark": "2024-01-03T00:00:00+00:00", "failed": []}
+    }
+
+
+@patch("llama_hub.web.async_web.base.AsyncWebPageReader._aload_indexed")
+def test_failed_pages_are_retried(mock_load_indexed, httpserver, tmp_path):
+    mock_load_indexed.side_effect = dummy_load_indexed
+    pages = [
+        ("https://example.com/a", "2024-01-01"),
+        ("https://example.com/broken", "2024-01-02"),
+        ("https://example.com/redirected", "2024-01-03"),
+    ]
+    httpserver.expect_request("/sitemap.xml").respond_with_data(sitemap(pages))
+    url = httpserver.url_for("/sitemap.xml")
+    watermark_path = tmp_path / "watermarks.json"
+    reader = SitemapReader(watermark_path=watermark_path)
+
+    assert len(reader.load_data(url)) == 2
+    # redirected pages count as loaded, and failed ones do not hold the
+    # watermark back
+    watermarks = json.loads(watermark_path.read_text())
+    assert watermarks[url] == {
+        "": {
+            "watermark": "2024-01-03T00:00:00+00:00",
+            "failed": ["https://example.com/broken"],
+        }
+    }
+
+    # only the failed page is tried again
+    assert reader.load_data(url) == []
+    assert mock_load_indexed.call_args.kwargs["urls"] == ["https://example.com/broken"]
+
+
+@patch("llama_hub.web.async_web.base.AsyncWebPageReader._aload_indexed")
+def test_watermark_of_previous_format_is_read(mock_load_indexed, httpserver, tmp_path):
+    mock_load_indexed.side_effect = dummy_load_indexed
+    pages = [
+        ("https://example.com/old", "2024-01-01"),
+        ("https://example.com/new", "2024-01-02"),
+    ]
+    httpserver.expect_request("/sitemap.xml").respond_with_data(sitemap(pages))
+    url = httpserver.url_for("/sitemap.xml")
+    watermark_path = tmp_path / "watermarks.json"
+    watermark_path.write_text(json.dumps({url: {"": "2024-01-01T00:00:00+00:00"}}))
+    reader = SitemapReader(watermark_path=watermark_path)
+
+    documents = reader.load_data(url)
+
+    assert [doc.extra_info["Source"] for doc in documents] == [
+        "https://example.com/new"
+    ]
+
+
+@patch("llama_hub.web.async_web.base.AsyncWebPageReader._aload_indexed")
+def test_failed_sitemap_of_index_is_skipped(mock_load_indexed, httpserver, tmp_path):
+    mock_load_indexed.side_effect = dummy_load_indexed
+    httpserver.expect_request("/index.xml").respond_with_data(
+        sitemap_index(
+            [
+                (httpserver.url_for("/missing.xml"), "2024-01-01"),
+                (httpserver.url_for("/pages.xml"), "2024-01-01"),
+            ]
+        )
+    )
+    httpserver.expect_request("/missing.xml").respond_with_data("", status=404)
+    httpserver.expect_request("/pages.xml").respond_with_data(
+        sitemap([("https://example.com/a", "2024-01-01")])
+    )
+    watermark_path = tmp_path / "watermarks.json"
+    reader = SitemapReader(watermark_path=watermark_path)
+
+    documents = reader.load_data(httpserver.url_for("/index.xml"))
+
+    assert [doc.extra_info["Source"] for doc in documents] == ["https://example.com/a"]
+    # the pages of the missing sitemap were never seen
+    assert not watermark_path.exists()